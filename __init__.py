@@ -40,6 +40,12 @@ from . import animation_system
 from . import damage_system
 from . import power_system
 from . import build_validator
+from . import fleet_simulator
+from . import bulk_validator
+from . import ship_layout
+from . import material_registry
+from . import batch_runner
+from . import output_cache
 
 
 class SpaceshipGeneratorProperties(bpy.types.PropertyGroup):
@@ -307,6 +313,38 @@ class SpaceshipGeneratorProperties(bpy.types.PropertyGroup):
         default=""
     )
 
+    export_glb: BoolProperty(
+        name="Also Export GLB",
+        description="Write a binary glTF next to each batch-exported OBJ (NovaForge scale, shared meshes instanced)",
+        default=False
+    )
+
+    use_output_cache: BoolProperty(
+        name="Reuse Cached Ships",
+        description="Skip ships whose generator parameters and add-on code are unchanged, restoring their files from the output cache",
+        default=True
+    )
+
+    batch_workers: IntProperty(
+        name="Batch Workers",
+        description="Background Blender processes for batch export (0 = generate in this session)",
+        default=0,
+        min=0,
+        max=64
+    )
+
+    batch_purge: BoolProperty(
+        name="Purge After Export",
+        description="Delete each batch ship and its orphaned data after export to keep memory bounded",
+        default=True
+    )
+
+    batch_status: StringProperty(
+        name="Batch Status",
+        description="Progress of the running background batch",
+        default=""
+    )
+
 
 class SPACESHIP_OT_generate(bpy.types.Operator):
     """Generate a procedural spaceship"""
@@ -443,13 +481,7 @@ class SPACESHIP_OT_export_obj(bpy.types.Operator):
         filename = obj.name.replace(' ', '_') + '.obj'
         filepath = os.path.join(export_dir, filename)
 
-        # Select all children too
-        bpy.ops.object.select_all(action='DESELECT')
-        obj.select_set(True)
-        for child in obj.children_recursive:
-            child.select_set(True)
-
-        atlas_exporter.export_obj(filepath)
+        atlas_exporter.export_obj(filepath, hull=obj)
 
         self.report({'INFO'}, f"Exported to {filepath}")
         return {'FINISHED'}
@@ -600,7 +632,110 @@ class SPACESHIP_OT_catalog_render(bpy.types.Operator):
         return {'FINISHED'}
 
 
-class SPACESHIP_OT_batch_generate(bpy.types.Operator):
+class _BatchJobsMixin:
+    """Runs an operator's ship jobs in this session or on background workers.
+
+    Ships already in the output cache are restored rather than rebuilt
+    (``use_output_cache``).  With ``batch_workers`` at 0 the jobs run one
+    after another here; with ``batch_purge`` each ship is deleted again
+    once exported.  Otherwise a :class:`batch_runner.BatchRunner` spreads them
+    over that many ``blender --background`` processes and the operator
+    stays modal, polling for results on a timer so the UI stays
+    responsive.  ESC cancels the workers.
+    """
+
+    _runner = None
+    _timer = None
+
+    def run_jobs(self, context, jobs, output_dir):
+        import os
+
+        props = context.scene.spaceship_props
+        cache = None
+        if props.use_output_cache:
+            cache = output_cache.OutputCache(
+                os.path.join(output_dir, output_cache.CACHE_DIR),
+                version=bl_info['version'],
+                blender_version=bpy.app.version)
+        if props.batch_workers <= 0:
+            manifest = batch_runner.run_local(
+                jobs, output_dir, purge=props.batch_purge, cache=cache)
+            self.report_manifest(manifest, output_dir)
+            return {'FINISHED'}
+
+        self._runner = batch_runner.BatchRunner(
+            jobs, output_dir, bpy.app.binary_path,
+            workers=props.batch_workers, cache=cache)
+        if bpy.app.background:
+            # No event loop to drive a modal operator
+            self.report_manifest(self._runner.run(), output_dir)
+            return {'FINISHED'}
+
+        self._runner.start()
+        wm = context.window_manager
+        wm.progress_begin(0, self._runner.total)
+        self._timer = wm.event_timer_add(0.5, window=context.window)
+        wm.modal_handler_add(self)
+        self._set_status(context, f"Batch: 0/{self._runner.total} ships")
+        return {'RUNNING_MODAL'}
+
+    def modal(self, context, event):
+        runner = self._runner
+        if event.type == 'ESC':
+            runner.cancel()
+            manifest = runner.finish()
+            self._end(context)
+            done = sum(1 for e in manifest['ships'] if e['status'] == 'ok')
+            self.report({'WARNING'},
+                        f"Batch cancelled after {done}/{runner.total} ships "
+                        f"(see {batch_runner.MANIFEST_NAME})")
+            return {'CANCELLED'}
+        if event.type != 'TIMER':
+            return {'PASS_THROUGH'}
+
+        runner.poll()
+        context.window_manager.progress_update(runner.completed)
+        self._set_status(
+            context, f"Batch: {runner.completed}/{runner.total} ships"
+            + (f", {runner.failed} failed" if runner.failed else ""))
+        if runner.running:
+            return {'PASS_THROUGH'}
+
+        manifest = runner.finish()
+        self._end(context)
+        self.report_manifest(manifest, runner.output_dir)
+        return {'FINISHED'}
+
+    def report_manifest(self, manifest, output_dir):
+        count = len(manifest['ships']) - manifest['failed']
+        message = f"Batch generated {count} ships to {output_dir}"
+        if 'cache' in manifest:
+            message += (f", {manifest['cache']['hits']} cached / "
+                        f"{manifest['cache']['misses']} rebuilt")
+        if manifest['peak_mb'] is not None:
+            message += f" (peak memory {manifest['peak_mb']:.0f} MB)"
+        if manifest['failed']:
+            self.report({'WARNING'},
+                        f"{message}, {manifest['failed']} failed (see "
+                        f"{batch_runner.MANIFEST_NAME})")
+        else:
+            self.report({'INFO'}, message)
+
+    def _end(self, context):
+        wm = context.window_manager
+        wm.event_timer_remove(self._timer)
+        wm.progress_end()
+        self._set_status(context, "")
+
+    @staticmethod
+    def _set_status(context, text):
+        context.scene.spaceship_props.batch_status = text
+        for area in context.screen.areas:
+            if area.type == 'VIEW_3D':
+                area.tag_redraw()
+
+
+class SPACESHIP_OT_batch_generate(_BatchJobsMixin, bpy.types.Operator):
     """Generate all ship types and export each to the batch output folder"""
     bl_idname = "mesh.batch_generate_all"
     bl_label = "Batch Generate All Types"
@@ -618,53 +753,41 @@ class SPACESHIP_OT_batch_generate(bpy.types.Operator):
 
         os.makedirs(output_dir, exist_ok=True)
 
-        count = 0
+        jobs = []
         for ship_class in ship_generator.SHIP_CONFIGS:
-            hull = ship_generator.generate_spaceship(
-                ship_class=ship_class,
-                seed=props.seed,
-                generate_interior=props.generate_interior,
-                module_slots=props.module_slots,
-                hull_complexity=props.hull_complexity,
-                symmetry=props.symmetry,
-                style=props.style,
-                naming_prefix=props.naming_prefix,
-                hull_taper=props.hull_taper,
-            )
-
-            if props.generate_textures:
-                texture_generator.apply_textures_to_ship(
-                    hull,
-                    style=props.style,
-                    seed=props.seed,
-                    weathering=props.weathering,
-                )
-
-            # Select the hull and all children for export
-            bpy.ops.object.select_all(action='DESELECT')
-            hull.select_set(True)
-            for child in hull.children_recursive:
-                child.select_set(True)
-
-            filename = f"{ship_class}_seed{props.seed}.obj"
-            filepath = os.path.join(output_dir, filename)
-            atlas_exporter.export_obj(filepath)
-
-            count += 1
-
-        self.report({'INFO'},
-                     f"Batch generated {count} ship types to {output_dir}")
-        return {'FINISHED'}
-
-
-class SPACESHIP_OT_novaforge_pipeline(bpy.types.Operator):
+            jobs.append({
+                'name': f"{ship_class}_seed{props.seed}",
+                'params': {
+                    'ship_class': ship_class,
+                    'seed': props.seed,
+                    'generate_interior': props.generate_interior,
+                    'module_slots': props.module_slots,
+                    'hull_complexity': props.hull_complexity,
+                    'symmetry': props.symmetry,
+                    'style': props.style,
+                    'naming_prefix': props.naming_prefix,
+                    'hull_taper': props.hull_taper,
+                },
+                'texture': {
+                    'style': props.style,
+                    'seed': props.seed,
+                    'weathering': props.weathering,
+                } if props.generate_textures else None,
+                'glb': props.export_glb,
+            })
+
+        return self.run_jobs(context, jobs, output_dir)
+
+
+class SPACESHIP_OT_novaforge_pipeline(_BatchJobsMixin, bpy.types.Operator):
     """Read all project data/ships JSON files, generate every ship, and export OBJ models.
 
     Each ship is generated using its model_data (seed, turrets, engines,
     drones, launchers) and faction style, then exported as
     ``<ship_id>.obj`` into the output directory.  The resulting folder
     can be placed directly into the project's ``data/ships/obj_models/``
-    directory for use by the AtlasForge engine.
+    directory for use by the AtlasForge engine.  Set Batch Workers to
+    spread the ships over background Blender processes.
     """
     bl_idname = "mesh.novaforge_pipeline_export"
     bl_label = "AtlasForge Pipeline Export"
@@ -693,36 +816,21 @@ class SPACESHIP_OT_novaforge_pipeline(bpy.types.Operator):
             self.report({'WARNING'}, "No ship definitions found in data dir")
             return {'CANCELLED'}
 
-        count = 0
+        jobs = []
         for ship_id, ship_def in ships.items():
             params = novaforge_importer.ship_to_generator_params(ship_def)
+            jobs.append({
+                'name': ship_id,
+                'params': params,
+                'texture': {
+                    'style': params.get('style', 'SOLARI'),
+                    'seed': params.get('seed', 1),
+                    'weathering': props.weathering,
+                } if props.generate_textures else None,
+                'glb': props.export_glb,
+            })
 
-            hull = ship_generator.generate_spaceship(**params)
-
-            if props.generate_textures:
-                texture_generator.apply_textures_to_ship(
-                    hull,
-                    style=params.get('style', 'SOLARI'),
-                    seed=params.get('seed', 1),
-                    weathering=props.weathering,
-                )
-
-            # Select the hull and all children for export
-            bpy.ops.object.select_all(action='DESELECT')
-            hull.select_set(True)
-            for child in hull.children_recursive:
-                child.select_set(True)
-
-            filename = f"{ship_id}.obj"
-            filepath = os.path.join(output_dir, filename)
-            atlas_exporter.export_obj(filepath)
-
-            count += 1
-
-        self.report(
-            {'INFO'},
-            f"AtlasForge pipeline: generated {count} ships to {output_dir}")
-        return {'FINISHED'}
+        return self.run_jobs(context, jobs, output_dir)
 
 
 class SPACESHIP_PT_main_panel(bpy.types.Panel):
@@ -772,7 +880,14 @@ class SPACESHIP_PT_main_panel(bpy.types.Panel):
         layout.separator()
         layout.label(text="Batch Generation:")
         layout.prop(props, "batch_output_path")
+        layout.prop(props, "export_glb")
+        layout.prop(props, "use_output_cache")
+        layout.prop(props, "batch_workers")
+        if props.batch_workers == 0:
+            layout.prop(props, "batch_purge")
         layout.operator("mesh.batch_generate_all", icon='FILE_REFRESH')
+        if props.batch_status:
+            layout.label(text=props.batch_status, icon='TIME')
 
         layout.separator()
         layout.label(text="Project Integration:")
@@ -860,10 +975,22 @@ def register():
     damage_system.register()
     power_system.register()
     build_validator.register()
+    fleet_simulator.register()
+    bulk_validator.register()
+    ship_layout.register()
+    material_registry.register()
+    batch_runner.register()
+    output_cache.register()
 
 
 def unregister():
     # Unregister submodules
+    output_cache.unregister()
+    batch_runner.unregister()
+    material_registry.unregister()
+    ship_layout.unregister()
+    bulk_validator.unregister()
+    fleet_simulator.unregister()
     build_validator.unregister()
     power_system.unregister()
     damage_system.unregister()
@@ -14,6 +14,7 @@ EVEOFFLINE project: https://github.com/shifty81/EVEOFFLINE
 import bpy
 import random
 import math
+from . import material_registry
 
 
 # Ore visual properties (color, roughness, metallic) from EVEOFFLINE data
@@ -217,14 +218,8 @@ def _belt_position(shape, radius, index, total):
 
 def _apply_ore_material(obj, ore_name, ore):
     """Apply a PBR material matching the ore type."""
-    mat = bpy.data.materials.new(name=f"Ore_{ore_name}")
-    mat.use_nodes = True
-    nodes = mat.node_tree.nodes
-    bsdf = nodes.get('Principled BSDF')
-    if bsdf:
-        bsdf.inputs['Base Color'].default_value = ore['color']
-        bsdf.inputs['Metallic'].default_value = ore['metallic']
-        bsdf.inputs['Roughness'].default_value = ore['roughness']
+    mat = material_registry.principled_material(
+        f"Ore_{ore_name}", ore['color'], ore['metallic'], ore['roughness'])
     obj.data.materials.append(mat)
 
 
@@ -8,6 +8,7 @@ EVEOFFLINE project: https://github.com/shifty81/EVEOFFLINE
 
 import json
 import os
+import struct
 
 # Faction-to-style mapping for EVEOFFLINE factions
 FACTION_STYLE_MAP = {
@@ -117,14 +118,22 @@ def load_all_ships(data_dir):
     return all_ships
 
 
-def export_obj(filepath):
+def export_obj(filepath, hull=None):
     """
-    Export the active ship as OBJ for the EVEOFFLINE asset pipeline.
-    Must be called inside Blender with an active object.
+    Export a ship as OBJ for the EVEOFFLINE asset pipeline.
+
+    With *hull* the ship (hull plus all children) is written directly by
+    :func:`write_obj` without touching the selection.  Without it the
+    selected objects are exported through ``bpy.ops.wm.obj_export``.
 
     Args:
         filepath: Output .obj file path
+        hull: Optional ship root object
     """
+    if hull is not None:
+        write_obj(hull, filepath, forward_axis='NEGATIVE_Z')
+        return
+
     import bpy
 
     bpy.ops.wm.obj_export(
@@ -139,8 +148,8 @@ def export_obj(filepath):
     )
 
 
-def export_for_novaforge(filepath, scale_factor=None):
-    """Export the active ship as OBJ for the NovaForge asset pipeline.
+def export_for_novaforge(filepath, scale_factor=None, hull=None):
+    """Export a ship as OBJ for the NovaForge asset pipeline.
 
     Uses NovaForge coordinate conventions (+Z forward, +Y up) and
     optionally applies the NovaForge scale (1 game unit ≈ 50 m).
@@ -152,27 +161,34 @@ def export_for_novaforge(filepath, scale_factor=None):
         scale_factor: Optional global scale multiplier.  When *None* the
             default NovaForge conversion (1 unit = 50 m) is applied,
             i.e. ``scale_factor = 1.0 / 50.0``.
+        hull: Optional ship root object, written directly by
+            :func:`write_obj` instead of exporting the selection.
     """
     import bpy
 
     if scale_factor is None:
         scale_factor = 1.0 / 50.0
 
-    bpy.ops.wm.obj_export(
-        filepath=filepath,
-        export_selected_objects=True,
-        apply_modifiers=True,
-        export_uv=True,
-        export_normals=True,
-        export_materials=True,
-        forward_axis='Z',
-        up_axis='Y',
-        global_scale=scale_factor,
-    )
+    if hull is not None:
+        objects = write_obj(hull, filepath, forward_axis='Z',
+                            scale=scale_factor)
+    else:
+        bpy.ops.wm.obj_export(
+            filepath=filepath,
+            export_selected_objects=True,
+            apply_modifiers=True,
+            export_uv=True,
+            export_normals=True,
+            export_materials=True,
+            forward_axis='Z',
+            up_axis='Y',
+            global_scale=scale_factor,
+        )
+        objects = bpy.context.selected_objects
 
     # Write companion material JSON
     mat_data = {}
-    for obj in bpy.context.selected_objects:
+    for obj in objects:
         if obj.type != 'MESH':
             continue
         for slot in obj.material_slots:
@@ -180,16 +196,12 @@ def export_for_novaforge(filepath, scale_factor=None):
             if mat is None or mat.name in mat_data:
                 continue
             entry = {'name': mat.name}
-            if mat.use_nodes:
-                for node in mat.node_tree.nodes:
-                    if node.type == 'BSDF_PRINCIPLED':
-                        entry['base_color'] = list(
-                            node.inputs['Base Color'].default_value)
-                        entry['metallic'] = node.inputs[
-                            'Metallic'].default_value
-                        entry['roughness'] = node.inputs[
-                            'Roughness'].default_value
-                        break
+            bsdf = _find_node(mat, 'BSDF_PRINCIPLED')
+            if bsdf is not None:
+                entry['base_color'] = list(
+                    bsdf.inputs['Base Color'].default_value)
+                entry['metallic'] = bsdf.inputs['Metallic'].default_value
+                entry['roughness'] = bsdf.inputs['Roughness'].default_value
             mat_data[mat.name] = entry
 
     json_path = os.path.splitext(filepath)[0] + '_materials.json'
@@ -197,6 +209,532 @@ def export_for_novaforge(filepath, scale_factor=None):
         json.dump(mat_data, fh, indent=2)
 
 
+# ---------------------------------------------------------------------------
+# Direct OBJ/MTL writer
+# ---------------------------------------------------------------------------
+# Walks a ship's evaluated meshes through the depsgraph and streams them to
+# disk with NumPy, so exports need no selection state or operator context
+# and run the same in batch workers.  Output follows wm.obj_export with
+# modifiers applied: world-space positions, corner normals and UVs
+# deduplicated per object, ``usemtl`` runs, and a companion .mtl file.
+
+# Blender (X right, Y forward, Z up) → OBJ axes, keyed by forward axis
+# (up is always +Y)
+_OBJ_AXES = {
+    'NEGATIVE_Z': ((1.0, 0.0, 0.0), (0.0, 0.0, 1.0), (0.0, -1.0, 0.0)),
+    'Z': ((-1.0, 0.0, 0.0), (0.0, 0.0, 1.0), (0.0, 1.0, 0.0)),
+}
+
+# Faces formatted and written per chunk
+_FACE_CHUNK = 65536
+
+# File buffer for the streamed .obj
+_WRITE_BUFFER = 1 << 20
+
+
+def _find_node(mat, node_type):
+    """Return the first node of *node_type* in *mat*'s node tree, or None."""
+    if not mat.use_nodes or mat.node_tree is None:
+        return None
+    for node in mat.node_tree.nodes:
+        if node.type == node_type:
+            return node
+    return None
+
+
+def _obj_name(name):
+    return name.replace(' ', '_')
+
+
+def _corner_normals(mesh):
+    """Return the mesh's per-corner (loop) normals as an (L, 3) array."""
+    import bpy
+    import numpy as np
+
+    normals = np.empty(len(mesh.loops) * 3, dtype=np.float32)
+    if bpy.app.version >= (4, 1, 0):
+        mesh.corner_normals.foreach_get("vector", normals)
+    else:
+        mesh.calc_normals_split()
+        mesh.loops.foreach_get("normal", normals)
+    return normals.reshape(-1, 3).astype(np.float64)
+
+
+def write_obj(hull, filepath, forward_axis='NEGATIVE_Z', scale=1.0,
+              depsgraph=None):
+    """Stream *hull* and all its children to *filepath* as OBJ + MTL.
+
+    Modifiers are applied by evaluating each object through *depsgraph*
+    (the context's evaluated depsgraph by default).  Positions are in
+    world space, converted to the OBJ axes for *forward_axis* (+Y up)
+    and multiplied by *scale*.  A ``.mtl`` file with the same base name
+    is written next to the OBJ.
+
+    Returns:
+        The list of mesh objects that were written.
+    """
+    import bpy
+    import numpy as np
+
+    if depsgraph is None:
+        depsgraph = bpy.context.evaluated_depsgraph_get()
+    axes = np.array(_OBJ_AXES[forward_axis])
+    objects = [obj for obj in (hull, *hull.children_recursive)
+               if obj.type == 'MESH']
+    mtl_path = os.path.splitext(filepath)[0] + '.mtl'
+
+    materials = {}
+    offsets = [0, 0, 0]  # vertices, UVs and normals written so far
+    with open(filepath, 'w', encoding='utf-8', newline='\n',
+              buffering=_WRITE_BUFFER) as fh:
+        fh.write(f"# {bpy.app.version_string}\n"
+                 f"mtllib {os.path.basename(mtl_path)}\n")
+        for obj in objects:
+            evaluated = obj.evaluated_get(depsgraph)
+            mesh = evaluated.to_mesh()
+            try:
+                _write_obj_mesh(fh, obj.name, mesh,
+                                np.array(evaluated.matrix_world), axes, scale,
+                                evaluated.material_slots, materials, offsets)
+            finally:
+                evaluated.to_mesh_clear()
+
+    _write_mtl(mtl_path, materials.values())
+    return objects
+
+
+def _write_obj_mesh(fh, name, mesh, matrix, axes, scale, slots, materials,
+                    offsets):
+    """Write one evaluated mesh; *offsets* carries the running indices."""
+    import numpy as np
+
+    if not mesh.polygons:
+        return
+
+    linear = scale * axes @ matrix[:3, :3]
+    translation = scale * axes @ matrix[:3, 3]
+
+    count = len(mesh.vertices)
+    co = np.empty(count * 3, dtype=np.float32)
+    mesh.vertices.foreach_get("co", co)
+    co = co.reshape(-1, 3).astype(np.float64) @ linear.T + translation
+
+    loop_count = len(mesh.loops)
+    loop_verts = np.empty(loop_count, dtype=np.int64)
+    mesh.loops.foreach_get("vertex_index", loop_verts)
+
+    normal_matrix = axes @ np.linalg.inv(matrix[:3, :3]).T
+    normals = _corner_normals(mesh) @ normal_matrix.T
+    lengths = np.linalg.norm(normals, axis=1, keepdims=True)
+    normals = np.round(normals / np.maximum(lengths, 1e-12), 4) + 0.0
+    normals, normal_index = np.unique(normals, axis=0, return_inverse=True)
+
+    uv_layer = mesh.uv_layers.active
+    if uv_layer is not None:
+        uvs = np.empty(loop_count * 2, dtype=np.float32)
+        uv_layer.data.foreach_get("uv", uvs)
+        uvs = np.round(uvs.reshape(-1, 2).astype(np.float64), 6) + 0.0
+        uvs, uv_index = np.unique(uvs, axis=0, return_inverse=True)
+
+    poly_count = len(mesh.polygons)
+    starts = np.empty(poly_count, dtype=np.int64)
+    totals = np.empty(poly_count, dtype=np.int64)
+    mat_index = np.empty(poly_count, dtype=np.int64)
+    mesh.polygons.foreach_get("loop_start", starts)
+    mesh.polygons.foreach_get("loop_total", totals)
+    mesh.polygons.foreach_get("material_index", mat_index)
+
+    fh.write(f"o {_obj_name(name)}\n")
+    np.savetxt(fh, co, fmt="v %.6f %.6f %.6f")
+    if uv_layer is not None:
+        np.savetxt(fh, uvs, fmt="vt %.6f %.6f")
+    np.savetxt(fh, normals, fmt="vn %.4f %.4f %.4f")
+
+    # "v/vt/vn" token per corner, 1-based and offset by earlier objects
+    v_ids = (loop_verts + offsets[0] + 1).tolist()
+    vn_ids = (normal_index.ravel() + offsets[2] + 1).tolist()
+    if uv_layer is not None:
+        vt_ids = (uv_index.ravel() + offsets[1] + 1).tolist()
+        tokens = [f"{v}/{t}/{n}" for v, t, n in zip(v_ids, vt_ids, vn_ids)]
+    else:
+        tokens = [f"{v}//{n}" for v, n in zip(v_ids, vn_ids)]
+
+    # Mirrored transforms flip the winding, as in wm.obj_export
+    reverse = np.linalg.det(matrix[:3, :3]) < 0
+
+    current = None
+    order = np.argsort(mat_index, kind='stable').tolist()
+    for first in range(0, poly_count, _FACE_CHUNK):
+        lines = []
+        for poly in order[first:first + _FACE_CHUNK]:
+            slot = int(mat_index[poly])
+            if slot != current:
+                current = slot
+                mat = slots[slot].material if slot < len(slots) else None
+                if mat is not None:
+                    materials.setdefault(mat.name, mat)
+                    lines.append(f"usemtl {_obj_name(mat.name)}\n")
+            start = int(starts[poly])
+            corners = tokens[start:start + int(totals[poly])]
+            if reverse:
+                corners.reverse()
+            lines.append("f " + " ".join(corners) + "\n")
+        fh.writelines(lines)
+
+    offsets[0] += count
+    offsets[1] += len(uvs) if uv_layer is not None else 0
+    offsets[2] += len(normals)
+
+
+def _write_mtl(mtl_path, materials):
+    """Write an MTL file for *materials* from their shader nodes."""
+    lines = [f"# {len(materials)} materials\n"]
+    for mat in materials:
+        color, metallic, roughness = (0.8, 0.8, 0.8), 0.0, 0.5
+        emission, alpha = (0.0, 0.0, 0.0), 1.0
+        bsdf = _find_node(mat, 'BSDF_PRINCIPLED')
+        if bsdf is not None:
+            color = tuple(bsdf.inputs['Base Color'].default_value)[:3]
+            metallic = bsdf.inputs['Metallic'].default_value
+            roughness = bsdf.inputs['Roughness'].default_value
+            alpha = bsdf.inputs['Alpha'].default_value
+        else:
+            color = tuple(mat.diffuse_color)[:3]
+        glow = _find_node(mat, 'EMISSION')
+        if glow is not None:
+            strength = glow.inputs['Strength'].default_value
+            emission = tuple(c * strength for c in
+                             tuple(glow.inputs['Color'].default_value)[:3])
+        lines.append(
+            f"\nnewmtl {_obj_name(mat.name)}\n"
+            f"Ns {(1.0 - roughness) ** 2 * 1000.0:.6f}\n"
+            f"Ka {metallic:.6f} {metallic:.6f} {metallic:.6f}\n"
+            f"Kd {color[0]:.6f} {color[1]:.6f} {color[2]:.6f}\n"
+            "Ks 0.500000 0.500000 0.500000\n"
+            f"Ke {emission[0]:.6f} {emission[1]:.6f} {emission[2]:.6f}\n"
+            "Ni 1.450000\n"
+            f"d {alpha:.6f}\n"
+            "illum 2\n")
+    with open(mtl_path, 'w', encoding='utf-8', newline='\n') as fh:
+        fh.writelines(lines)
+
+
+# ---------------------------------------------------------------------------
+# Binary glTF (GLB) export
+# ---------------------------------------------------------------------------
+# One .glb per ship: every part's vertex data is packed into a single binary
+# buffer, objects sharing a mesh (turrets, greebles, exhaust rings …) become
+# nodes referencing one glTF mesh, and custom properties (ship_dna, LOD and
+# collision tags …) are stored as node extras.  glTF is +Y up / +Z forward,
+# the same as the NovaForge OBJ convention.
+
+# glTF accessor component types
+_GL_FLOAT = 5126
+_GL_UNSIGNED_INT = 5125
+
+# glTF buffer-view targets
+_GL_ARRAY_BUFFER = 34962
+_GL_ELEMENT_ARRAY_BUFFER = 34963
+
+_GLB_MAGIC = 0x46546C67
+_GLB_JSON_CHUNK = 0x4E4F534A
+_GLB_BIN_CHUNK = 0x004E4942
+
+
+class _GltfBuilder:
+    """Collects glTF JSON and the single binary buffer for one file."""
+
+    def __init__(self):
+        self.gltf = {
+            'asset': {'version': '2.0', 'generator': 'AtlasForge Generator'},
+            'scene': 0,
+            'scenes': [{'nodes': []}],
+            'nodes': [],
+            'meshes': [],
+            'materials': [],
+            'accessors': [],
+            'bufferViews': [],
+            'buffers': [],
+        }
+        self.blob = bytearray()
+        self.material_index = {}
+
+    def accessor(self, array, accessor_type, target, with_bounds=False):
+        """Append *array* to the buffer and return its accessor index."""
+        import numpy as np
+
+        if array.dtype == np.uint32:
+            component = _GL_UNSIGNED_INT
+        else:
+            array = array.astype(np.float32)
+            component = _GL_FLOAT
+        data = np.ascontiguousarray(array).tobytes()
+        self.blob.extend(b'\0' * (-len(self.blob) % 4))
+        self.gltf['bufferViews'].append({
+            'buffer': 0, 'byteOffset': len(self.blob),
+            'byteLength': len(data), 'target': target,
+        })
+        self.blob.extend(data)
+        accessor = {
+            'bufferView': len(self.gltf['bufferViews']) - 1,
+            'componentType': component,
+            'count': len(array),
+            'type': accessor_type,
+        }
+        if with_bounds:
+            accessor['min'] = array.min(axis=0).tolist()
+            accessor['max'] = array.max(axis=0).tolist()
+        self.gltf['accessors'].append(accessor)
+        return len(self.gltf['accessors']) - 1
+
+    def material(self, mat):
+        """Return the glTF material index for Blender material *mat*."""
+        if mat.name in self.material_index:
+            return self.material_index[mat.name]
+        pbr = {'baseColorFactor': [0.8, 0.8, 0.8, 1.0],
+               'metallicFactor': 0.0, 'roughnessFactor': 0.5}
+        entry = {'name': mat.name, 'pbrMetallicRoughness': pbr}
+        bsdf = _find_node(mat, 'BSDF_PRINCIPLED')
+        if bsdf is not None:
+            pbr['baseColorFactor'] = list(
+                bsdf.inputs['Base Color'].default_value)
+            pbr['metallicFactor'] = bsdf.inputs['Metallic'].default_value
+            pbr['roughnessFactor'] = bsdf.inputs['Roughness'].default_value
+        glow = _find_node(mat, 'EMISSION')
+        if glow is not None:
+            pbr['baseColorFactor'] = [0.0, 0.0, 0.0, 1.0]
+            entry['emissiveFactor'] = list(
+                glow.inputs['Color'].default_value)[:3]
+            strength = glow.inputs['Strength'].default_value
+            if strength != 1.0:
+                entry['extensions'] = {'KHR_materials_emissive_strength': {
+                    'emissiveStrength': strength}}
+                used = self.gltf.setdefault('extensionsUsed', [])
+                if 'KHR_materials_emissive_strength' not in used:
+                    used.append('KHR_materials_emissive_strength')
+        self.gltf['materials'].append(entry)
+        self.material_index[mat.name] = len(self.gltf['materials']) - 1
+        return self.material_index[mat.name]
+
+    def write(self, filepath):
+        # glTF forbids empty top-level arrays and zero-length buffers, so
+        # a ship without mesh data gets neither a buffer nor a BIN chunk
+        if self.blob:
+            self.gltf['buffers'] = [{'byteLength': len(self.blob)}]
+        for key in [k for k, v in self.gltf.items() if v == []]:
+            del self.gltf[key]
+        json_bytes = json.dumps(self.gltf, separators=(',', ':')).encode()
+        json_bytes += b' ' * (-len(json_bytes) % 4)
+        self.blob.extend(b'\0' * (-len(self.blob) % 4))
+        length = 12 + 8 + len(json_bytes)
+        if self.blob:
+            length += 8 + len(self.blob)
+        with open(filepath, 'wb') as fh:
+            fh.write(struct.pack('<III', _GLB_MAGIC, 2, length))
+            fh.write(struct.pack('<II', len(json_bytes), _GLB_JSON_CHUNK))
+            fh.write(json_bytes)
+            if self.blob:
+                fh.write(struct.pack('<II', len(self.blob), _GLB_BIN_CHUNK))
+                fh.write(self.blob)
+
+
+def _gltf_mesh(builder, name, mesh, slots):
+    """Add evaluated *mesh* as a glTF mesh; return its index or None."""
+    import numpy as np
+
+    mesh.calc_loop_triangles()
+    tri_count = len(mesh.loop_triangles)
+    if tri_count == 0:
+        return None
+    tri_loops = np.empty(tri_count * 3, dtype=np.int64)
+    tri_mats = np.empty(tri_count, dtype=np.int64)
+    mesh.loop_triangles.foreach_get("loops", tri_loops)
+    mesh.loop_triangles.foreach_get("material_index", tri_mats)
+
+    co = np.empty(len(mesh.vertices) * 3, dtype=np.float32)
+    mesh.vertices.foreach_get("co", co)
+    loop_verts = np.empty(len(mesh.loops), dtype=np.int64)
+    mesh.loops.foreach_get("vertex_index", loop_verts)
+
+    # One glTF vertex per distinct (position, normal, uv) corner
+    normals = _corner_normals(mesh)
+    normals /= np.maximum(np.linalg.norm(normals, axis=1, keepdims=True),
+                          1e-12)
+    columns = [co.reshape(-1, 3)[loop_verts], normals.astype(np.float32)]
+    uv_layer = mesh.uv_layers.active
+    if uv_layer is not None:
+        uvs = np.empty(len(mesh.loops) * 2, dtype=np.float32)
+        uv_layer.data.foreach_get("uv", uvs)
+        uvs = uvs.reshape(-1, 2)
+        uvs[:, 1] = 1.0 - uvs[:, 1]  # glTF UV origin is top-left
+        columns.append(uvs)
+    corners = np.hstack(columns)
+    vertices, corner_vertex = np.unique(corners, axis=0, return_inverse=True)
+    indices = corner_vertex.ravel()[tri_loops].astype(np.uint32)
+
+    attributes = {
+        'POSITION': builder.accessor(vertices[:, 0:3], 'VEC3',
+                                     _GL_ARRAY_BUFFER, with_bounds=True),
+        'NORMAL': builder.accessor(vertices[:, 3:6], 'VEC3',
+                                   _GL_ARRAY_BUFFER),
+    }
+    if uv_layer is not None:
+        attributes['TEXCOORD_0'] = builder.accessor(
+            vertices[:, 6:8], 'VEC2', _GL_ARRAY_BUFFER)
+
+    primitives = []
+    triangles = indices.reshape(-1, 3)
+    for slot in np.unique(tri_mats).tolist():
+        primitive = {
+            'attributes': attributes,
+            'indices': builder.accessor(
+                triangles[tri_mats == slot].ravel(), 'SCALAR',
+                _GL_ELEMENT_ARRAY_BUFFER),
+        }
+        mat = slots[slot].material if slot < len(slots) else None
+        if mat is not None:
+            primitive['material'] = builder.material(mat)
+        primitives.append(primitive)
+
+    builder.gltf['meshes'].append({'name': name, 'primitives': primitives})
+    return len(builder.gltf['meshes']) - 1
+
+
+def _node_extras(obj):
+    """Return *obj*'s custom properties as JSON-ready glTF extras."""
+    extras = {}
+    for key in obj.keys():
+        if key.startswith('_'):
+            continue
+        value = obj[key]
+        if hasattr(value, 'to_dict'):
+            value = value.to_dict()
+        elif hasattr(value, 'to_list'):
+            value = value.to_list()
+        if key == 'ship_dna' and isinstance(value, str):
+            try:
+                value = json.loads(value)
+            except ValueError:
+                pass
+        try:
+            json.dumps(value)
+        except (TypeError, ValueError):
+            continue
+        extras[key] = value
+    return extras
+
+
+def _gltf_matrix(matrix):
+    """Column-major glTF matrix list, or None for the identity."""
+    import numpy as np
+
+    if np.allclose(matrix, np.eye(4)):
+        return None
+    return matrix.T.ravel().tolist()
+
+
+def export_glb(filepath, hull, scale_factor=None, depsgraph=None):
+    """Export a ship as binary glTF (GLB) for the NovaForge engine.
+
+    The hull, its children and its LOD objects (``lod_level`` > 0 and a
+    ``lod_source`` naming the hull) become a node tree below the hull
+    node.  Each node keeps its object's custom properties as extras.
+    Objects that share a mesh data-block and have no modifiers reference
+    a single glTF mesh.  All vertex and index data lives in one binary
+    buffer.
+
+    Args:
+        filepath: Output .glb file path.
+        hull: Ship root object.
+        scale_factor: Optional global scale multiplier.  When *None* the
+            default NovaForge conversion (1 unit = 50 m) is applied.
+        depsgraph: Depsgraph to evaluate modifiers with (defaults to the
+            context's evaluated depsgraph).
+    """
+    import bpy
+    import numpy as np
+
+    if scale_factor is None:
+        scale_factor = 1.0 / 50.0
+    if depsgraph is None:
+        depsgraph = bpy.context.evaluated_depsgraph_get()
+
+    objects = [hull, *hull.children_recursive]
+    lod_prefix = f"{hull.name.split('.')[0]}_LOD"
+    exported = {obj.name for obj in objects}
+    for collection in hull.users_collection:
+        for obj in collection.objects:
+            if obj.get("lod_level", 0) <= 0 or obj.name in exported:
+                continue
+            # LODs from older files carry no lod_source: match the name
+            source = obj.get("lod_source")
+            if (source == hull.name if source is not None
+                    else obj.name.startswith(lod_prefix)):
+                objects.append(obj)
+                exported.add(obj.name)
+
+    conversion = np.eye(4)
+    conversion[:3, :3] = scale_factor * np.array(_OBJ_AXES['Z'])
+
+    builder = _GltfBuilder()
+    mesh_cache = {}   # instancing key → glTF mesh index
+    node_index = {}   # object name → glTF node index
+    owners = {}       # object name → parent object name (None for the hull)
+    for obj in objects:
+        evaluated = obj.evaluated_get(depsgraph)
+        world = np.array(evaluated.matrix_world)
+        parent = obj.parent if obj is not hull else None
+        while parent is not None and parent.name not in exported:
+            parent = parent.parent
+        if obj is hull:
+            local = conversion @ world
+        elif parent is None:  # LOD siblings hang off the hull node
+            local = np.linalg.inv(np.array(hull.matrix_world)) @ world
+        else:
+            local = np.linalg.inv(np.array(parent.matrix_world)) @ world
+
+        node = {'name': obj.name}
+        matrix = _gltf_matrix(local)
+        if matrix is not None:
+            node['matrix'] = matrix
+        extras = _node_extras(obj)
+        if extras:
+            node['extras'] = extras
+
+        if obj.type == 'MESH':
+            slots = evaluated.material_slots
+            key = (obj.data.name,
+                   tuple(s.material.name if s.material else None
+                         for s in slots))
+            if obj.modifiers:
+                key = ('OBJECT', obj.name)
+            if key not in mesh_cache:
+                mesh = evaluated.to_mesh()
+                try:
+                    mesh_cache[key] = _gltf_mesh(builder, obj.data.name,
+                                                 mesh, slots)
+                finally:
+                    evaluated.to_mesh_clear()
+            if mesh_cache[key] is not None:
+                node['mesh'] = mesh_cache[key]
+
+        builder.gltf['nodes'].append(node)
+        node_index[obj.name] = len(builder.gltf['nodes']) - 1
+        owners[obj.name] = (None if obj is hull
+                            else parent.name if parent is not None
+                            else hull.name)
+
+    # Link children once every node exists
+    for name, owner in owners.items():
+        if owner is None:
+            builder.gltf['scenes'][0]['nodes'].append(node_index[name])
+        else:
+            builder.gltf['nodes'][node_index[owner]].setdefault(
+                'children', []).append(node_index[name])
+
+    builder.write(filepath)
+
+
 def register():
     """Register this module"""
     pass
@@ -0,0 +1,517 @@
+"""
+Multi-process batch generation.
+
+Generates a list of ship jobs on several headless Blender processes
+instead of one long blocking loop in the UI session:
+
+- Each job is a dict ``{'name', 'params', 'texture', 'glb'}``.
+  ``params`` are :func:`ship_generator.generate_spaceship` keyword
+  arguments, and ``texture`` is ``None`` or keyword arguments for
+  :func:`texture_generator.apply_textures_to_ship`.  The ship is
+  exported to ``<output_dir>/<name>.obj`` (+ ``.mtl``) and its Ship DNA
+  to ``<name>_dna.json``.  If ``glb`` is set, it is also exported to
+  ``<name>.glb`` with :func:`atlas_exporter.export_glb`.
+- :class:`BatchRunner` deals the jobs round-robin over N
+  ``blender --background --factory-startup`` workers.  Every worker
+  starts each ship from an empty scene.
+- Workers append one JSON line per finished ship to their own results
+  file.  :meth:`BatchRunner.poll` picks these lines up without blocking,
+  so a modal operator can show progress while the UI stays responsive.
+- When every worker has exited, the entries are merged in job order
+  into ``batch_manifest.json`` in the output directory.
+- With an :class:`output_cache.OutputCache`, jobs whose outputs are
+  already cached are restored instead of generated.  Fresh results are
+  added to the cache, and the manifest reports hits and misses.
+- Every entry records the process's resident and peak memory once the
+  ship is done.  In-session batches can pass ``purge=True`` to
+  :func:`run_job`, which deletes each exported ship and its orphaned
+  data-blocks so memory stays bounded over long runs.
+
+The orchestrator does **not** depend on ``bpy``.  Only :func:`run_job`
+and :func:`run_worker` are called inside Blender.
+"""
+
+import json
+import os
+import subprocess
+import sys
+import time
+
+try:
+    import resource
+except ImportError:  # not available on Windows
+    resource = None
+
+# Scratch directory (inside the output directory) for job and result files
+BATCH_DIR = ".batch"
+
+# Manifest file written to the output directory when a batch finishes
+MANIFEST_NAME = "batch_manifest.json"
+
+
+# ---------------------------------------------------------------------------
+# Jobs
+# ---------------------------------------------------------------------------
+
+
+def split_jobs(jobs, workers):
+    """Deal *jobs* round-robin into at most *workers* chunks.
+
+    Round-robin keeps big and small ship classes mixed in every chunk.
+    Jobs without an ``index`` are tagged with their position in *jobs*,
+    so the manifest can be put back in the original order.
+    """
+    workers = max(1, min(int(workers), len(jobs)))
+    chunks = [[] for _ in range(workers)]
+    for position, job in enumerate(jobs):
+        chunks[position % workers].append(
+            dict(job, index=job.get('index', position)))
+    return chunks
+
+
+def run_job(job, output_dir, purge=False):
+    """Generate, texture and export one job in this Blender session.
+
+    With *purge* the ship is deleted again after export (see
+    :func:`purge_ship`).  Returns the job's manifest entry.
+    """
+    from . import atlas_exporter
+    from . import ship_generator
+    from . import texture_generator
+
+    start = time.perf_counter()
+    hull = ship_generator.generate_spaceship(**job['params'])
+    if job.get('texture'):
+        texture_generator.apply_textures_to_ship(hull, **job['texture'])
+
+    filepath = os.path.join(output_dir, f"{job['name']}.obj")
+    atlas_exporter.export_obj(filepath, hull=hull)
+    dna_path = os.path.join(output_dir, f"{job['name']}_dna.json")
+    with open(dna_path, 'w', encoding='utf-8') as fh:
+        fh.write(hull["ship_dna"])
+    files = [filepath, os.path.splitext(filepath)[0] + '.mtl', dna_path]
+    glb_path = None
+    if job.get('glb'):
+        glb_path = os.path.join(output_dir, f"{job['name']}.glb")
+        atlas_exporter.export_glb(glb_path, hull)
+        files.append(glb_path)
+    if purge:
+        purge_ship(hull)
+
+    entry = {
+        'index': job.get('index'),
+        'name': job['name'],
+        'file': filepath,
+        'glb': glb_path,
+        'dna': dna_path,
+        'files': files,
+        'status': 'ok',
+        'seconds': time.perf_counter() - start,
+    }
+    entry.update(memory_usage())
+    return entry
+
+
+def purge_ship(hull):
+    """Delete a generated ship and the data-blocks it leaves orphaned.
+
+    Removes *hull*, its children and its ship collection, then the
+    meshes, materials, textures, images, node groups and actions those
+    objects used once nothing else uses them.  Other data-blocks in the file are
+    never touched, even if they have no users, and shared part meshes
+    and registry materials that other ships still use are kept.
+    """
+    import bpy
+
+    objects = [hull, *hull.children_recursive]
+    names = {obj.name for obj in objects}
+    keep = {bpy.context.scene.collection.name,
+            bpy.context.view_layer.active_layer_collection.collection.name}
+    # The ship's own collection holds nothing but the ship
+    collections = [
+        coll for coll in hull.users_collection
+        if coll.name not in keep and not coll.children
+        and all(obj.name in names for obj in coll.objects)
+    ]
+    blocks = _ship_data_blocks(objects)
+    for obj in objects:
+        bpy.data.objects.remove(obj, do_unlink=True)
+    for coll in collections:
+        bpy.data.collections.remove(coll)
+
+    # Freeing a mesh can orphan its materials, and a material its images
+    # and node groups, so sweep until nothing more is freed.
+    removed = True
+    while removed:
+        removed = False
+        for attr, name in list(blocks):
+            collection = getattr(bpy.data, attr)
+            block = collection.get(name)
+            if block is None:
+                blocks.discard((attr, name))
+            elif block.users == 0 and not block.use_fake_user:
+                collection.remove(block)
+                blocks.discard((attr, name))
+                removed = True
+
+
+def _ship_data_blocks(objects):
+    """Return ``{(bpy.data attribute, name)}`` for data used by *objects*."""
+    blocks = set()
+    materials = []
+    for obj in objects:
+        if obj.type == 'MESH' and obj.data is not None:
+            blocks.add(('meshes', obj.data.name))
+            materials.extend(obj.data.materials)
+        materials.extend(slot.material for slot in obj.material_slots)
+        for mod in obj.modifiers:
+            texture = getattr(mod, 'texture', None)
+            if texture is not None:
+                blocks.add(('textures', texture.name))
+        anim = obj.animation_data
+        if anim is not None and anim.action is not None:
+            blocks.add(('actions', anim.action.name))
+
+    trees = []
+    for mat in materials:
+        if mat is not None:
+            blocks.add(('materials', mat.name))
+            if mat.node_tree is not None:
+                trees.append(mat.node_tree)
+    seen = set()
+    while trees:
+        tree = trees.pop()
+        for node in tree.nodes:
+            image = getattr(node, 'image', None)
+            if image is not None:
+                blocks.add(('images', image.name))
+            group = node.node_tree if node.type == 'GROUP' else None
+            if group is not None and group.name not in seen:
+                seen.add(group.name)
+                blocks.add(('node_groups', group.name))
+                trees.append(group)
+    return blocks
+
+
+def memory_usage():
+    """Return this process's ``resident_mb`` and ``peak_mb``.
+
+    Values the platform does not expose are None.  Resident memory is
+    read from /proc on Linux; the peak comes from ``getrusage``.
+    """
+    resident = peak = None
+    if resource is not None:
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # ru_maxrss is in bytes on macOS and kilobytes elsewhere
+        peak /= 1024.0 * 1024.0 if sys.platform == 'darwin' else 1024.0
+    try:
+        with open('/proc/self/statm', 'r') as fh:
+            pages = int(fh.read().split()[1])
+        resident = pages * os.sysconf('SC_PAGE_SIZE') / (1024.0 * 1024.0)
+    except (OSError, ValueError, AttributeError):
+        pass
+    return {'resident_mb': resident, 'peak_mb': peak}
+
+
+def _run_job_or_error(job, output_dir, purge=False):
+    """:func:`run_job`, returning an ``'error'`` entry if the job raises."""
+    start = time.perf_counter()
+    try:
+        return run_job(job, output_dir, purge=purge)
+    except Exception as exc:  # record it and carry on with the next job
+        return {
+            'index': job.get('index'),
+            'name': job['name'],
+            'file': None,
+            'status': 'error',
+            'error': f"{type(exc).__name__}: {exc}",
+            'seconds': time.perf_counter() - start,
+            **memory_usage(),
+        }
+
+
+def run_worker(jobs_path, results_path, output_dir):
+    """Worker entry point: run every job in *jobs_path* from a clean scene.
+
+    Called inside ``blender --background``.  One result line is appended
+    to *results_path* per job.  A failing job is recorded as an error
+    and the worker carries on with the next one.
+    """
+    import bpy
+
+    with open(jobs_path, 'r', encoding='utf-8') as fh:
+        jobs = json.load(fh)
+
+    with open(results_path, 'a', encoding='utf-8') as results:
+        for job in jobs:
+            bpy.ops.wm.read_homefile(use_empty=True)
+            entry = _run_job_or_error(job, output_dir)
+            results.write(json.dumps(entry) + "\n")
+            results.flush()
+
+
+def run_local(jobs, output_dir, purge=False, cache=None):
+    """Run *jobs* one after another in this session; return the manifest.
+
+    A failing job is recorded as an error and the batch carries on.  With
+    *cache* unchanged ships are restored from it and new results are
+    stored.
+    """
+    start = time.perf_counter()
+    entries = []
+    for index, job in enumerate(jobs):
+        job = dict(job, index=index)
+        key = cache.key(job) if cache is not None else None
+        entry = cache.restore(key, output_dir) if key else None
+        if entry is None:
+            entry = _run_job_or_error(job, output_dir, purge=purge)
+            if cache is not None:
+                cache.store(key, entry)
+        entry['index'] = index
+        entries.append(entry)
+    extra = {'cache': cache.stats()} if cache is not None else {}
+    return write_manifest(output_dir, entries, workers=0,
+                          seconds=time.perf_counter() - start, **extra)
+
+
+def write_manifest(output_dir, entries, **extra):
+    """Write *entries* (plus *extra* fields) to the batch manifest.
+
+    Returns the manifest dict.
+    """
+    manifest = dict(extra)
+    manifest['ships'] = entries
+    manifest['failed'] = sum(1 for e in entries if e['status'] != 'ok')
+    peaks = [e['peak_mb'] for e in entries if e.get('peak_mb') is not None]
+    manifest['peak_mb'] = max(peaks) if peaks else None
+    with open(os.path.join(output_dir, MANIFEST_NAME), 'w',
+              encoding='utf-8') as fh:
+        json.dump(manifest, fh, indent=2)
+    return manifest
+
+
+# ---------------------------------------------------------------------------
+# Orchestrator
+# ---------------------------------------------------------------------------
+
+
+# Executed by each worker via --python-expr: load this addon package from
+# its directory (no add-on needs to be enabled) and hand over to run_worker.
+_WORKER_BOOTSTRAP = """\
+import importlib, importlib.util, sys
+spec = importlib.util.spec_from_file_location(
+    {package!r}, {init!r}, submodule_search_locations=[{root!r}])
+package = importlib.util.module_from_spec(spec)
+sys.modules[spec.name] = package
+spec.loader.exec_module(package)
+importlib.import_module({module!r}).run_worker({jobs!r}, {results!r}, {output!r})
+"""
+
+
+class _Worker:
+    """One background Blender process and its result stream."""
+
+    def __init__(self, number, jobs, process, results_path, log):
+        self.number = number
+        self.jobs = jobs
+        self.process = process
+        self.results_path = results_path
+        self.log = log
+        self.offset = 0
+        self.done = set()   # job indices with a result
+
+
+class BatchRunner:
+    """Runs ship jobs on background Blender worker processes.
+
+    Usage::
+
+        runner = BatchRunner(jobs, output_dir, bpy.app.binary_path,
+                             workers=8)
+        runner.start()
+        while runner.running:
+            runner.poll()          # new manifest entries, never blocks
+            time.sleep(0.5)
+        manifest = runner.finish()
+
+    :meth:`run` does the same in one blocking call.
+    """
+
+    def __init__(self, jobs, output_dir, blender, workers=1, cache=None):
+        self.jobs = [dict(job, index=index) for index, job in enumerate(jobs)]
+        self.output_dir = output_dir
+        self.blender = blender
+        self.workers = max(1, int(workers))
+        self.cache = cache
+        self.entries = []
+        self.cancelled = False
+        self._keys = {}   # job index → cache key
+        self._workers = []
+        self._start_time = None
+
+    # -- progress -----------------------------------------------------------
+
+    @property
+    def total(self):
+        return len(self.jobs)
+
+    @property
+    def completed(self):
+        return len(self.entries)
+
+    @property
+    def failed(self):
+        return sum(1 for e in self.entries if e['status'] != 'ok')
+
+    @property
+    def running(self):
+        return any(w.process.poll() is None for w in self._workers)
+
+    # -- lifecycle ----------------------------------------------------------
+
+    def start(self):
+        """Restore cached jobs, then launch one Blender process per chunk."""
+        batch_dir = os.path.join(self.output_dir, BATCH_DIR)
+        os.makedirs(batch_dir, exist_ok=True)
+        package_root = os.path.dirname(os.path.abspath(__file__))
+        self._start_time = time.perf_counter()
+
+        pending = []
+        for job in self.jobs:
+            if self.cache is None:
+                pending.append(job)
+                continue
+            key = self._keys[job['index']] = self.cache.key(job)
+            entry = self.cache.restore(key, self.output_dir)
+            if entry is None:
+                pending.append(job)
+            else:
+                entry['index'] = job['index']
+                self.entries.append(entry)
+        if not pending:
+            return
+
+        for number, chunk in enumerate(split_jobs(pending, self.workers)):
+            jobs_path = os.path.join(batch_dir, f"jobs_{number}.json")
+            results_path = os.path.join(batch_dir, f"results_{number}.jsonl")
+            with open(jobs_path, 'w', encoding='utf-8') as fh:
+                json.dump(chunk, fh)
+            open(results_path, 'w').close()
+
+            bootstrap = _WORKER_BOOTSTRAP.format(
+                package=__package__,
+                init=os.path.join(package_root, "__init__.py"),
+                root=package_root,
+                module=__name__,
+                jobs=jobs_path, results=results_path,
+                output=self.output_dir,
+            )
+            log = open(os.path.join(batch_dir, f"worker_{number}.log"), 'w')
+            process = subprocess.Popen(
+                [self.blender, "--background", "--factory-startup",
+                 "--python-exit-code", "1", "--python-expr", bootstrap],
+                stdout=log, stderr=subprocess.STDOUT,
+            )
+            self._workers.append(
+                _Worker(number, chunk, process, results_path, log))
+
+    def poll(self):
+        """Collect finished ships without blocking; return the new entries."""
+        new = []
+        for worker in self._workers:
+            exited = worker.process.poll() is not None
+            new.extend(self._read_results(worker))
+            if exited and not worker.log.closed:
+                worker.log.close()
+                new.extend(self._missing_results(worker, self.cancelled))
+        if self.cache is not None:
+            for entry in new:
+                self.cache.store(self._keys[entry['index']], entry)
+        self.entries.extend(new)
+        return new
+
+    def cancel(self):
+        """Stop every worker; unfinished jobs are reported as cancelled.
+
+        Call :meth:`finish` afterwards to write the manifest.
+        """
+        self.cancelled = True
+        for worker in self._workers:
+            if worker.process.poll() is None:
+                worker.process.terminate()
+        for worker in self._workers:
+            worker.process.wait()
+        self.poll()
+
+    def finish(self, interval=0.5):
+        """Wait for the workers, then write and return the manifest."""
+        while self.running:
+            self.poll()
+            time.sleep(interval)
+        self.poll()
+        self.entries.sort(key=lambda e: e['index'])
+        elapsed = (time.perf_counter() - self._start_time
+                   if self._start_time is not None else 0.0)
+        extra = ({'cache': self.cache.stats()}
+                 if self.cache is not None else {})
+        if self.cancelled:
+            extra['cancelled'] = True
+        return write_manifest(self.output_dir, self.entries,
+                              workers=len(self._workers), seconds=elapsed,
+                              **extra)
+
+    def run(self, interval=0.5):
+        """Start the workers, block until they finish, return the manifest."""
+        self.start()
+        return self.finish(interval)
+
+    # -- result streams -----------------------------------------------------
+
+    @staticmethod
+    def _read_results(worker):
+        with open(worker.results_path, 'rb') as fh:
+            fh.seek(worker.offset)
+            data = fh.read()
+        # Only consume complete lines; a partial line is read next time
+        end = data.rfind(b"\n") + 1
+        worker.offset += end
+        entries = []
+        for line in data[:end].decode('utf-8').splitlines():
+            entry = json.loads(line)
+            entry['worker'] = worker.number
+            worker.done.add(entry['index'])
+            entries.append(entry)
+        return entries
+
+    @staticmethod
+    def _missing_results(worker, cancelled=False):
+        """Entries for jobs a crashed or cancelled worker never reported."""
+        code = worker.process.returncode
+        return [
+            {
+                'index': job['index'],
+                'name': job['name'],
+                'file': None,
+                'status': 'cancelled' if cancelled else 'error',
+                'error': ("batch cancelled" if cancelled else
+                          f"worker {worker.number} exited with code {code}"),
+                'seconds': 0.0,
+                'worker': worker.number,
+            }
+            for job in worker.jobs if job['index'] not in worker.done
+        ]
+
+
+# ---------------------------------------------------------------------------
+# Blender registration stubs
+# ---------------------------------------------------------------------------
+
+
+def register():
+    """Register this module"""
+    pass
+
+
+def unregister():
+    """Unregister this module"""
+    pass
@@ -10,13 +10,18 @@ Implements placement validation rules from ENGINE_INTEGRATION.md §5 and §11
 - Power connection verification
 - Structural connectivity check (must connect to spine)
 
+Connectivity is tracked by a disjoint-set index that is updated on every
+placement, so the editor can query live "connected to spine" / "powered"
+state in near-constant time.  Removals invalidate the index, which is
+rebuilt lazily on the next query.
+
 This module is a pure-Python reference implementation that works with
 brick definitions from :mod:`brick_system`.  It does **not** depend on
 ``bpy`` so it can be tested outside Blender and ported to C++ for the
 Atlas engine.
 """
 
-from collections import deque
+import functools
 
 # ---------------------------------------------------------------------------
 # Hardpoint compatibility matrix
@@ -68,7 +73,7 @@ class ValidationResult:
 
 
 # ---------------------------------------------------------------------------
-# Build validator
+# Grid geometry
 # ---------------------------------------------------------------------------
 
 # Neighbour offsets on the 3-D grid (6-connected)
@@ -93,6 +98,10 @@ _OFFSET_DIRECTIONS = {
 }
 
 
+# Brick types that feed power into the bricks connected to them
+POWER_SOURCE_TYPES = frozenset(['REACTOR_CORE', 'POWER_BUS'])
+
+
 def _dot(a, b):
     """Dot product of two 3-tuples."""
     return a[0] * b[0] + a[1] * b[1] + a[2] * b[2]
@@ -103,6 +112,155 @@ def _neg(v):
     return (-v[0], -v[1], -v[2])
 
 
+# ---------------------------------------------------------------------------
+# Precomputed hardpoint compatibility
+# ---------------------------------------------------------------------------
+
+def _roles_facing(brick_def, direction):
+    """Return hardpoint roles on *brick_def* whose direction matches."""
+    roles = []
+    for hp in brick_def.get('hardpoints', []):
+        hp_dir = tuple(hp.get('direction', (0, 0, 0)))
+        if _dot(hp_dir, direction) > DIRECTION_MATCH_THRESHOLD:
+            roles.append(hp['role'])
+    return roles
+
+
+def build_compatibility_table(brick_types):
+    """Precompute hardpoint compatibility for every brick pair and
+    neighbour direction.
+
+    Returns a dict mapping ``(type_a, direction, type_b)`` to True when
+    *type_a* has a hardpoint facing *direction* whose role is compatible
+    with a hardpoint on *type_b* facing the opposite way.  Missing keys
+    (unknown types) mean incompatible.
+    """
+    directions = list(_OFFSET_DIRECTIONS.values())
+    roles = {
+        (name, direction): frozenset(_roles_facing(brick_def, direction))
+        for name, brick_def in brick_types.items()
+        for direction in directions
+    }
+    table = {}
+    for name_a in brick_types:
+        for direction in directions:
+            roles_a = roles[(name_a, direction)]
+            opposing = _neg(direction)
+            for name_b in brick_types:
+                roles_b = roles[(name_b, opposing)]
+                table[(name_a, direction, name_b)] = any(
+                    (ra, rb) in COMPATIBLE_ROLES
+                    for ra in roles_a for rb in roles_b)
+    return table
+
+
+def get_compatibility_table(brick_types):
+    """Return the cached :func:`build_compatibility_table` result for
+    *brick_types*, building it on first use.
+
+    The cache is keyed on the brick names and their hardpoint roles and
+    directions, so equal brick-type dicts share one table and a mutated
+    dict gets a fresh one.  Only the most recent few tables are kept.
+    """
+    if not brick_types:
+        return {}
+    fingerprint = tuple(
+        (name, tuple((hp['role'], tuple(hp.get('direction', (0, 0, 0))))
+                     for hp in brick_def.get('hardpoints', [])))
+        for name, brick_def in brick_types.items()
+    )
+    return _cached_compatibility_table(fingerprint)
+
+
+@functools.lru_cache(maxsize=8)
+def _cached_compatibility_table(fingerprint):
+    return build_compatibility_table({
+        name: {'hardpoints': [{'role': role, 'direction': direction}
+                              for role, direction in hardpoints]}
+        for name, hardpoints in fingerprint
+    })
+
+
+# ---------------------------------------------------------------------------
+# Build validator
+# ---------------------------------------------------------------------------
+
+
+class _ConnectivityIndex:
+    """Disjoint-set (union by size, path halving) over placed grid cells.
+
+    Each component root tracks its size and how many spine / power-source
+    bricks it contains, and running totals record how many bricks sit in
+    components with no spine or no power source.
+    """
+
+    __slots__ = ('parent', 'size', 'spines', 'sources', 'spine_total',
+                 'source_total', 'unanchored', 'unpowered')
+
+    def __init__(self):
+        self.parent = {}      # cell → parent cell
+        self.size = {}        # root cell → component size
+        self.spines = {}      # root cell → spine bricks in component
+        self.sources = {}     # root cell → power sources in component
+        self.spine_total = 0
+        self.source_total = 0
+        self.unanchored = 0   # bricks in components without a spine
+        self.unpowered = 0    # bricks in components without a power source
+
+    def find(self, cell):
+        parent = self.parent
+        while parent[cell] != cell:
+            parent[cell] = parent[parent[cell]]
+            cell = parent[cell]
+        return cell
+
+    def _discount(self, root, sign):
+        """Add (*sign* = 1) or remove (*sign* = -1) *root*'s contribution
+        to the unanchored / unpowered totals."""
+        if not self.spines[root]:
+            self.unanchored += sign * self.size[root]
+        if not self.sources[root]:
+            self.unpowered += sign * self.size[root]
+
+    def add(self, cell, brick_type):
+        self.parent[cell] = cell
+        self.size[cell] = 1
+        self.spines[cell] = int(brick_type == 'STRUCTURAL_SPINE')
+        self.sources[cell] = int(brick_type in POWER_SOURCE_TYPES)
+        self.spine_total += self.spines[cell]
+        self.source_total += self.sources[cell]
+        self._discount(cell, 1)
+
+    def retype(self, cell, old_type, new_type):
+        """Account for the brick at *cell* changing type in place."""
+        root = self.find(cell)
+        spine = (int(new_type == 'STRUCTURAL_SPINE')
+                 - int(old_type == 'STRUCTURAL_SPINE'))
+        source = (int(new_type in POWER_SOURCE_TYPES)
+                  - int(old_type in POWER_SOURCE_TYPES))
+        self._discount(root, -1)
+        self.spines[root] += spine
+        self.sources[root] += source
+        self.spine_total += spine
+        self.source_total += source
+        self._discount(root, 1)
+
+    def union(self, a, b):
+        ra = self.find(a)
+        rb = self.find(b)
+        if ra == rb:
+            return
+        if self.size[ra] < self.size[rb]:
+            ra, rb = rb, ra
+        self._discount(ra, -1)
+        self._discount(rb, -1)
+        self.parent[rb] = ra
+        self.size[ra] += self.size.pop(rb)
+        self.spines[ra] += self.spines.pop(rb)
+        self.sources[ra] += self.sources.pop(rb)
+        self._discount(ra, 1)
+
+
 class BuildValidator:
     """Validates brick placement according to the grid and hardpoint rules.
 
@@ -116,11 +274,16 @@ class BuildValidator:
             validator.place_brick('ENGINE_BLOCK', (0, -4, 0))
     """
 
-    def __init__(self, grid_size=1.0, brick_types=None):
+    def __init__(self, grid_size=1.0, brick_types=None, compat_table=None):
         self.grid_size = grid_size
         self.brick_types = brick_types or {}
+        # (type_a, direction, type_b) → bool, shared across validators
+        self._compat = (compat_table if compat_table is not None
+                        else get_compatibility_table(self.brick_types))
         self.placed = {}  # grid cell (gx, gy, gz) → brick_type name
         self._positions = {}  # grid cell → world position
+        self._index = _ConnectivityIndex()
+        self._index_dirty = False  # set by removals; rebuilt on next query
 
     # -- helpers ------------------------------------------------------------
 
@@ -132,13 +295,13 @@ class BuildValidator:
             round(pos[2] / gs),
         )
 
-    def _snap(self, pos):
+    def _is_aligned(self, pos, cell=None):
+        if cell is None:
+            cell = self._to_cell(pos)
         gs = self.grid_size if self.grid_size else 1.0
-        return tuple(round(v / gs) * gs for v in pos)
-
-    def _is_aligned(self, pos):
-        snapped = self._snap(pos)
-        return all(abs(a - b) < 1e-6 for a, b in zip(snapped, pos))
+        return (abs(cell[0] * gs - pos[0]) < 1e-6
+                and abs(cell[1] * gs - pos[1]) < 1e-6
+                and abs(cell[2] * gs - pos[2]) < 1e-6)
 
     # -- placement ----------------------------------------------------------
 
@@ -146,15 +309,69 @@ class BuildValidator:
         """Place a brick (bypasses validation — call :meth:`validate_placement`
         first)."""
         cell = self._to_cell(pos)
+        old_type = self.placed.get(cell)
         self.placed[cell] = brick_type_name
         self._positions[cell] = tuple(pos)
 
+        if self._index_dirty:
+            return
+        if old_type is not None:
+            self._index.retype(cell, old_type, brick_type_name)
+            return
+        self._index.add(cell, brick_type_name)
+        for offset in _NEIGHBOUR_OFFSETS:
+            ncell = (cell[0] + offset[0],
+                     cell[1] + offset[1],
+                     cell[2] + offset[2])
+            if ncell in self.placed:
+                self._index.union(cell, ncell)
+
     def remove_brick(self, pos):
         """Remove a brick at *pos*."""
         cell = self._to_cell(pos)
-        self.placed.pop(cell, None)
+        if self.placed.pop(cell, None) is not None:
+            self._index_dirty = True
         self._positions.pop(cell, None)
 
+    # -- connectivity index -------------------------------------------------
+
+    def _connectivity(self):
+        """Return the up-to-date :class:`_ConnectivityIndex`, rebuilding it
+        after removals."""
+        if self._index_dirty:
+            index = _ConnectivityIndex()
+            for cell, bt in self.placed.items():
+                index.add(cell, bt)
+            for cell in self.placed:
+                # Positive offsets only: each adjacent pair is joined once
+                for offset in _NEIGHBOUR_OFFSETS[::2]:
+                    ncell = (cell[0] + offset[0],
+                             cell[1] + offset[1],
+                             cell[2] + offset[2])
+                    if ncell in self.placed:
+                        index.union(cell, ncell)
+            self._index = index
+            self._index_dirty = False
+        return self._index
+
+    def is_connected_to_spine(self, pos):
+        """Return True if the brick at *pos* reaches a STRUCTURAL_SPINE
+        brick through adjacent bricks."""
+        cell = self._to_cell(pos)
+        if cell not in self.placed:
+            return False
+        index = self._connectivity()
+        return index.spines[index.find(cell)] > 0
+
+    def is_powered(self, pos):
+        """Return True if the brick at *pos* reaches a power source
+        (REACTOR_CORE or POWER_BUS) through adjacent bricks."""
+        cell = self._to_cell(pos)
+        if cell not in self.placed:
+            return False
+        index = self._connectivity()
+        return index.sources[index.find(cell)] > 0
+
     # -- validation ---------------------------------------------------------
 
     def validate_placement(self, brick_type_name, pos):
@@ -171,14 +388,14 @@ class BuildValidator:
             return result
 
         # 2. Grid alignment
-        if not self._is_aligned(pos):
+        cell = self._to_cell(pos)
+        if not self._is_aligned(pos, cell):
             result.add_error(
                 f"Position {pos} is not aligned to grid "
                 f"(size={self.grid_size})"
             )
 
         # 3. Cell not occupied
-        cell = self._to_cell(pos)
         if cell in self.placed:
             result.add_error(
                 f"Grid cell {cell} is already occupied by "
@@ -195,15 +412,12 @@ class BuildValidator:
                 continue
             has_any_neighbour = True
 
-            # Check hardpoint compatibility
+            # Check hardpoint compatibility (precomputed table)
             neighbour_type_name = self.placed[ncell]
             direction = _OFFSET_DIRECTIONS[offset]
-            opposing = _neg(direction)
 
-            compatible = self._check_hardpoint_compatibility(
-                brick_def, direction,
-                self.brick_types.get(neighbour_type_name), opposing,
-            )
+            compatible = self._compat.get(
+                (brick_type_name, direction, neighbour_type_name), False)
             if not compatible:
                 result.add_warning(
                     f"No compatible hardpoint pair between "
@@ -221,32 +435,6 @@ class BuildValidator:
 
         return result
 
-    def _check_hardpoint_compatibility(self, brick_a_def, dir_a,
-                                       brick_b_def, dir_b):
-        """Return True if brick_a has a hardpoint facing *dir_a* whose role
-        is compatible with a hardpoint on brick_b facing *dir_b*."""
-        if brick_a_def is None or brick_b_def is None:
-            return False
-
-        roles_a = self._get_roles_facing(brick_a_def, dir_a)
-        roles_b = self._get_roles_facing(brick_b_def, dir_b)
-
-        for ra in roles_a:
-            for rb in roles_b:
-                if (ra, rb) in COMPATIBLE_ROLES:
-                    return True
-        return False
-
-    @staticmethod
-    def _get_roles_facing(brick_def, direction):
-        """Return hardpoint roles on *brick_def* whose direction matches."""
-        roles = []
-        for hp in brick_def.get('hardpoints', []):
-            hp_dir = tuple(hp.get('direction', (0, 0, 0)))
-            if _dot(hp_dir, direction) > DIRECTION_MATCH_THRESHOLD:
-                roles.append(hp['role'])
-        return roles
-
     # -- structural connectivity check --------------------------------------
 
     def check_connectivity(self):
@@ -255,56 +443,25 @@ class BuildValidator:
         if not self.placed:
             return True
 
-        # Find spine cells
-        spine_cells = [cell for cell, bt in self.placed.items()
-                       if bt == 'STRUCTURAL_SPINE']
-        if not spine_cells:
+        index = self._connectivity()
+        if not index.spine_total:
             return False
-
-        # BFS from spine cells
-        visited = set()
-        queue = deque(spine_cells)
-        while queue:
-            current = queue.popleft()
-            if current in visited:
-                continue
-            visited.add(current)
-            for offset in _NEIGHBOUR_OFFSETS:
-                ncell = (current[0] + offset[0],
-                         current[1] + offset[1],
-                         current[2] + offset[2])
-                if ncell in self.placed and ncell not in visited:
-                    queue.append(ncell)
-
-        return len(visited) == len(self.placed)
+        return index.unanchored == 0
 
     # -- power connectivity check -------------------------------------------
 
     def check_power_connectivity(self):
         """Return list of brick cells that have no path to a power source
         (REACTOR_CORE or POWER_BUS) through power-role hardpoints."""
-        power_sources = [cell for cell, bt in self.placed.items()
-                         if bt in ('REACTOR_CORE', 'POWER_BUS')]
-        if not power_sources:
+        index = self._connectivity()
+        if not index.source_total:
             return list(self.placed.keys())
-
-        # BFS from power sources
-        visited = set()
-        queue = deque(power_sources)
-        while queue:
-            current = queue.popleft()
-            if current in visited:
-                continue
-            visited.add(current)
-            for offset in _NEIGHBOUR_OFFSETS:
-                ncell = (current[0] + offset[0],
-                         current[1] + offset[1],
-                         current[2] + offset[2])
-                if ncell in self.placed and ncell not in visited:
-                    queue.append(ncell)
+        if not index.unpowered:
+            return []
 
         # Cells with no power path
-        return [cell for cell in self.placed if cell not in visited]
+        return [cell for cell in self.placed
+                if not index.sources[index.find(cell)]]
 
     # -- bulk validation from Ship DNA --------------------------------------
 
@@ -317,6 +474,9 @@ class BuildValidator:
         """
         grid_size = dna.get('grid_size', 1.0)
         validator = cls(grid_size=grid_size, brick_types=brick_types or {})
+        # Bulk validation rarely queries connectivity; build the index
+        # lazily on first use instead of once per placement.
+        validator._index_dirty = True
         results = []
         for brick_data in dna.get('bricks', []):
             bt = brick_data['type']
@@ -0,0 +1,272 @@
+"""
+Bulk Ship DNA validation.
+
+Validates a whole library of saved Ship DNA with
+:meth:`build_validator.BuildValidator.from_ship_dna`:
+
+- Sources are a directory (every ``*.json`` below it), a single DNA
+  ``.json`` file, or a JSON-lines stream (``.jsonl`` file or ``-`` for
+  stdin) holding one DNA per line.
+- Ships are fanned out across a process pool; each worker reads and
+  parses its own files, so only paths and small summaries cross the
+  process boundary.
+- One summary per ship is streamed back in input order, ready to be
+  written as JSON lines, together with throughput statistics.
+- Fail-fast mode stops at the first invalid ship.
+
+Command line::
+
+    python bulk_validator.py ships/ --workers 8 --output report.jsonl
+    cat library.jsonl | python bulk_validator.py - --fail-fast
+
+The exit status is 0 when every ship is valid and 1 otherwise; the
+statistics are printed to stderr as a single JSON object.
+
+This module is a pure-Python reference implementation.  It does **not**
+depend on ``bpy`` so it can run in CI and on content-pipeline servers.
+"""
+
+import argparse
+import json
+import multiprocessing
+import os
+import sys
+import time
+
+try:
+    from . import brick_system
+    from . import build_validator
+except ImportError:  # loaded outside the addon package (CLI, workers)
+    import brick_system
+    import build_validator
+
+# Maximum number of error/warning messages kept per ship summary
+MAX_MESSAGES = 10
+
+# Ships handed to a worker per round trip
+DEFAULT_CHUNKSIZE = 16
+
+
+# ---------------------------------------------------------------------------
+# Sources
+# ---------------------------------------------------------------------------
+
+
+def iter_dna_sources(paths, stdin=None):
+    """Yield ``(label, path, text)`` work items for every DNA in *paths*.
+
+    Exactly one of *path* / *text* is set: files are read by the worker
+    that validates them, stream lines are passed through as text.
+    Directories are walked recursively in sorted order.
+    """
+    if isinstance(paths, str):
+        paths = [paths]
+    for path in paths:
+        if path == '-':
+            yield from _iter_stream(stdin or sys.stdin, '<stdin>')
+        elif os.path.isdir(path):
+            for root, dirs, files in os.walk(path):
+                dirs.sort()
+                for name in sorted(files):
+                    if name.endswith('.json'):
+                        full = os.path.join(root, name)
+                        yield full, full, None
+        elif path.endswith('.jsonl'):
+            with open(path, 'r') as f:
+                yield from _iter_stream(f, path)
+        else:
+            yield path, path, None
+
+
+def _iter_stream(stream, label):
+    for line_no, line in enumerate(stream, 1):
+        if line.strip():
+            yield f"{label}:{line_no}", None, line
+
+
+# ---------------------------------------------------------------------------
+# Per-ship validation
+# ---------------------------------------------------------------------------
+
+
+def validate_dna(dna, brick_types=None):
+    """Validate one Ship DNA dict and return a JSON-serialisable summary.
+
+    A ship is valid when every brick placement is valid and every brick is
+    structurally connected to a spine.  Hardpoint warnings and unpowered
+    bricks are reported but do not fail the ship.
+    """
+    if brick_types is None:
+        brick_types = brick_system.BRICK_TYPES
+    validator, results = build_validator.BuildValidator.from_ship_dna(
+        dna, brick_types)
+
+    errors = 0
+    warnings = 0
+    messages = []
+    for index, (brick_type, pos, result) in enumerate(results):
+        errors += len(result.errors)
+        warnings += len(result.warnings)
+        for level, texts in (('error', result.errors),
+                             ('warning', result.warnings)):
+            for text in texts:
+                if len(messages) < MAX_MESSAGES:
+                    messages.append({'brick': index, 'type': brick_type,
+                                     'pos': list(pos), 'level': level,
+                                     'message': text})
+
+    connected = validator.check_connectivity()
+    return {
+        'class': dna.get('class'),
+        'seed': dna.get('seed'),
+        'bricks': len(results),
+        'valid': errors == 0 and connected,
+        'connected': connected,
+        'unpowered': len(validator.check_power_connectivity()),
+        'errors': errors,
+        'warnings': warnings,
+        'messages': messages,
+    }
+
+
+def _validate_item(item):
+    """Worker entry point: load and validate one ``(label, path, text)``."""
+    label, path, text = item
+    try:
+        if path is not None:
+            with open(path, 'r') as f:
+                text = f.read()
+        dna = json.loads(text)
+        if not isinstance(dna, dict):
+            raise ValueError("Ship DNA must be a JSON object")
+        summary = validate_dna(dna)
+    except Exception as exc:  # report the ship instead of killing the run
+        summary = {'bricks': 0, 'valid': False,
+                   'error': f"{type(exc).__name__}: {exc}"}
+    summary['source'] = label
+    return summary
+
+
+# ---------------------------------------------------------------------------
+# Bulk validator
+# ---------------------------------------------------------------------------
+
+
+class BulkValidator:
+    """Validates many Ship DNAs across a process pool.
+
+    Usage::
+
+        bulk = BulkValidator(workers=8, fail_fast=False)
+        for summary in bulk.run(iter_dna_sources('ships/')):
+            print(json.dumps(summary))
+        print(bulk.stats)
+
+    :meth:`run` yields summaries in input order while later ships are
+    still being validated.  With ``workers=1`` everything runs in this
+    process.
+    """
+
+    def __init__(self, workers=None, fail_fast=False,
+                 chunksize=DEFAULT_CHUNKSIZE):
+        self.workers = max(1, int(workers or os.cpu_count() or 1))
+        self.fail_fast = fail_fast
+        self.chunksize = max(1, int(chunksize))
+        self.stats = self._empty_stats()
+
+    def _empty_stats(self):
+        return {'ships': 0, 'valid': 0, 'invalid': 0, 'bricks': 0,
+                'workers': self.workers, 'stopped_early': False,
+                'elapsed_seconds': 0.0, 'ships_per_second': 0.0,
+                'bricks_per_second': 0.0}
+
+    def run(self, items):
+        """Validate every ``(label, path, text)`` item, yielding summaries."""
+        self.stats = stats = self._empty_stats()
+        start = time.perf_counter()
+        pool = None
+        if self.workers > 1:
+            pool = multiprocessing.get_context().Pool(self.workers)
+            summaries = pool.imap(_validate_item, items, self.chunksize)
+        else:
+            summaries = map(_validate_item, items)
+        try:
+            for summary in summaries:
+                stats['ships'] += 1
+                stats['bricks'] += summary['bricks']
+                stats['valid' if summary['valid'] else 'invalid'] += 1
+                self._update_rates(start)
+                yield summary
+                if self.fail_fast and not summary['valid']:
+                    stats['stopped_early'] = True
+                    break
+        finally:
+            if pool is not None:
+                # Drops any work still queued after a fail-fast stop
+                pool.terminate()
+                pool.join()
+            self._update_rates(start)
+
+    def _update_rates(self, start):
+        stats = self.stats
+        elapsed = time.perf_counter() - start
+        stats['elapsed_seconds'] = elapsed
+        if elapsed > 0:
+            stats['ships_per_second'] = stats['ships'] / elapsed
+            stats['bricks_per_second'] = stats['bricks'] / elapsed
+
+
+# ---------------------------------------------------------------------------
+# Command line
+# ---------------------------------------------------------------------------
+
+
+def main(argv=None, stdin=None, stdout=None, stderr=None):
+    """Run the bulk validator from the command line; returns the exit code."""
+    parser = argparse.ArgumentParser(
+        description="Validate a library of Ship DNA JSON files.")
+    parser.add_argument('paths', nargs='+',
+                        help="DNA directories, .json/.jsonl files, "
+                             "or - for JSON lines on stdin")
+    parser.add_argument('--workers', type=int, default=None,
+                        help="worker processes (default: CPU count)")
+    parser.add_argument('--fail-fast', action='store_true',
+                        help="stop at the first invalid ship")
+    parser.add_argument('--chunksize', type=int, default=DEFAULT_CHUNKSIZE,
+                        help="ships per worker round trip")
+    parser.add_argument('--output', default=None,
+                        help="write JSON lines here instead of stdout")
+    args = parser.parse_args(argv)
+
+    stdout = stdout or sys.stdout
+    stderr = stderr or sys.stderr
+    bulk = BulkValidator(workers=args.workers, fail_fast=args.fail_fast,
+                         chunksize=args.chunksize)
+    out = open(args.output, 'w') if args.output else stdout
+    try:
+        for summary in bulk.run(iter_dna_sources(args.paths, stdin=stdin)):
+            out.write(json.dumps(summary) + '\n')
+    finally:
+        if out is not stdout:
+            out.close()
+    stderr.write(json.dumps(bulk.stats) + '\n')
+    return 0 if bulk.stats['invalid'] == 0 else 1
+
+
+# ---------------------------------------------------------------------------
+# Blender registration stubs
+# ---------------------------------------------------------------------------
+
+
+def register():
+    """Register this module."""
+    pass
+
+
+def unregister():
+    """Unregister this module."""
+    pass
+
+
+if __name__ == '__main__':
+    sys.exit(main())
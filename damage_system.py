@@ -13,12 +13,26 @@ Implements the runtime damage rules described in ENGINE_INTEGRATION.md §11–§
 
 This module is a pure-Python reference implementation that works with Ship
 DNA brick lists.  It does **not** depend on ``bpy`` so it can be tested
-outside Blender and ported to C++ for the Atlas engine.
+outside Blender and ported to C++ for the Atlas engine.  The optional
+:class:`ArrayShipDamageState` backend additionally requires NumPy (bundled
+with Blender).
 """
 
+import heapq
+import json
 import math
 import random
+import struct
+import sys
+import weakref
+from array import array
 from collections import deque
+from itertools import accumulate
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is only needed for ArrayShipDamageState
+    np = None
 
 # ---------------------------------------------------------------------------
 # Hull influence weights (ENGINE_INTEGRATION.md §17)
@@ -115,10 +129,19 @@ for _cat, _types in _CATEGORIES_MAP.items():
 # Structural integrity timeout (frames) before unsupported section detaches
 DETACH_TIMEOUT = 60
 
+# Connectivity maintenance strategies for ShipDamageState
+#   INCREMENTAL — repair only the spanning subtree below destroyed bricks
+#   REBUILD     — full flood-fill from every spine brick on each destruction
+#   VERIFY      — incremental repair cross-checked against a full flood-fill
+CONNECTIVITY_MODES = ('INCREMENTAL', 'REBUILD', 'VERIFY')
+
 # Salvage condition range (fraction of max HP retained by recovered bricks)
 SALVAGE_CONDITION_MIN = 0.1
 SALVAGE_CONDITION_MAX = 0.8
 
+# Area-of-effect falloff curves for ShipDamageState.query_sphere
+AOE_FALLOFFS = ('NONE', 'LINEAR', 'QUADRATIC')
+
 # Visual feedback states
 DAMAGE_STATES = {
     'NOMINAL': 'Normal operation',
@@ -128,6 +151,9 @@ DAMAGE_STATES = {
     'DETACHMENT': 'Chunk separation + debris',
 }
 
+# Integer codes for DAMAGE_STATES (used by the array-backed state)
+DAMAGE_STATE_CODES = {name: code for code, name in enumerate(DAMAGE_STATES)}
+
 # ---------------------------------------------------------------------------
 # Brick entity
 # ---------------------------------------------------------------------------
@@ -193,6 +219,62 @@ class SalvageEntity:
                 f"condition={self.condition:.0%}, pos={self.pos})")
 
 
+# ---------------------------------------------------------------------------
+# Change feed
+# ---------------------------------------------------------------------------
+
+
+class DamageChangeFeed:
+    """Structural changes of one :class:`ShipDamageState` since the last
+    :meth:`drain`.
+
+    Obtained from :meth:`ShipDamageState.subscribe_changes`; the ship
+    publishes destroyed and detached brick ids and the previous
+    ``connected_to_spine`` value of every brick whose flag may have
+    changed.  The ship only holds subscribers weakly, so a dropped feed
+    stops collecting.
+    """
+
+    __slots__ = ('source', 'destroyed', 'detached', 'reset', '_before',
+                 '__weakref__')
+
+    def __init__(self, source):
+        self.source = source
+        self.destroyed = []   # brick ids destroyed by damage
+        self.detached = []    # brick ids detached as debris
+        self.reset = False    # whole state replaced (restore)
+        self._before = {}     # brick_id → connected flag before the change
+
+    def drain(self):
+        """Return the pending changes and start a new window.
+
+        Returns a dict with ``'destroyed'`` and ``'detached'`` id lists,
+        ``'connectivity'`` — sorted ``(brick_id, connected)`` pairs for
+        surviving bricks whose flag actually flipped — and ``'reset'``,
+        True when the ship was restored from a snapshot and consumers
+        should resynchronise from scratch.
+        """
+        bricks = self.source.bricks
+        flips = []
+        for bid in sorted(self._before):
+            entity = bricks.get(bid)
+            if entity is not None:
+                connected = bool(entity.connected_to_spine)
+                if connected != self._before[bid]:
+                    flips.append((bid, connected))
+        changes = {
+            'destroyed': self.destroyed,
+            'detached': self.detached,
+            'connectivity': flips,
+            'reset': self.reset,
+        }
+        self.destroyed = []
+        self.detached = []
+        self.reset = False
+        self._before = {}
+        return changes
+
+
 # ---------------------------------------------------------------------------
 # Ship damage state
 # ---------------------------------------------------------------------------
@@ -206,25 +288,51 @@ class ShipDamageState:
 
         state = ShipDamageState.from_ship_dna(dna['bricks'], dna['grid_size'])
 
-    Then call :meth:`apply_damage` each frame to process incoming hits and
-    :meth:`tick` to advance the structural integrity timer.
+    Then call :meth:`apply_damage` (or :meth:`apply_damage_batch` for many
+    hits in one frame) to process incoming hits and :meth:`tick` to advance
+    the structural integrity timer.
+
+    Connectivity to the spine is kept as a BFS spanning tree
+    (``parent_id`` / ``children_ids``).  By default a destroyed brick only
+    re-checks the subtree that hung off it (``connectivity_mode=
+    'INCREMENTAL'``); ``'REBUILD'`` restores the full flood-fill per
+    destruction and ``'VERIFY'`` runs both and raises on disagreement.
     """
 
-    def __init__(self, grid_size=1.0):
+    def __init__(self, grid_size=1.0, connectivity_mode='INCREMENTAL'):
+        if connectivity_mode not in CONNECTIVITY_MODES:
+            raise ValueError(
+                f"Unknown connectivity mode: {connectivity_mode}")
         self.grid_size = grid_size
+        self.connectivity_mode = connectivity_mode
         self.bricks = {}          # id → BrickEntity
         self.grid = {}            # (gx, gy, gz) → brick_id
         self.salvage = []         # list of SalvageEntity
         self.detached_ids = set()  # brick ids that have detached
+        self._unsupported = set()  # alive brick ids not connected to spine
+        self._blueprints = []     # id → (brick_type, pos, archetype, cell)
         self._next_id = 0
         self._rng = random.Random()
+        self._feeds = weakref.WeakSet()  # subscribed DamageChangeFeeds
+        self._cell_bounds = None  # (blueprint count, low cell, high cell)
+
+    def __getstate__(self):
+        # Subscribers are per-process listeners and cannot be pickled
+        state = self.__dict__.copy()
+        del state['_feeds']
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._feeds = weakref.WeakSet()
 
     # -- construction -------------------------------------------------------
 
     @classmethod
-    def from_ship_dna(cls, bricks_list, grid_size=1.0, seed=None):
+    def from_ship_dna(cls, bricks_list, grid_size=1.0, seed=None,
+                      connectivity_mode='INCREMENTAL'):
         """Build a :class:`ShipDamageState` from a Ship DNA bricks list."""
-        state = cls(grid_size=grid_size)
+        state = cls(grid_size=grid_size, connectivity_mode=connectivity_mode)
         if seed is not None:
             state._rng.seed(seed)
         for brick_data in bricks_list:
@@ -237,15 +345,25 @@ class ShipDamageState:
         return state
 
     def add_brick(self, brick_type, pos, archetype=None):
-        """Add a brick and register it on the grid."""
+        """Add a brick and register it on the grid.
+
+        New bricks start disconnected; call :meth:`rebuild_connections`
+        once all bricks are added.
+        """
         brick_id = self._next_id
         self._next_id += 1
-        entity = BrickEntity(brick_id, brick_type, pos, archetype)
-        self.bricks[brick_id] = entity
+        entity = self._new_entity(brick_id, brick_type, pos, archetype)
         cell = self._pos_to_cell(pos)
+        self._blueprints.append((brick_type, entity.pos, archetype, cell))
+        self.bricks[brick_id] = entity
+        self._unsupported.add(brick_id)
         self.grid[cell] = brick_id
         return brick_id
 
+    def _new_entity(self, brick_id, brick_type, pos, archetype):
+        """Create the entity object for a newly added brick."""
+        return BrickEntity(brick_id, brick_type, pos, archetype)
+
     # -- grid helpers -------------------------------------------------------
 
     def _pos_to_cell(self, pos):
@@ -276,10 +394,33 @@ class ShipDamageState:
                 result.append(nid)
         return result
 
+    # -- change feed --------------------------------------------------------
+
+    def subscribe_changes(self):
+        """Return a new :class:`DamageChangeFeed` collecting this ship's
+        destroyed / detached ids and connectivity flips."""
+        feed = DamageChangeFeed(self)
+        self._feeds.add(feed)
+        return feed
+
+    def unsubscribe_changes(self, feed):
+        """Stop publishing to *feed*."""
+        self._feeds.discard(feed)
+
+    def _note_connectivity(self, entities):
+        """Record the connected flag of *entities* before it changes."""
+        for feed in self._feeds:
+            before = feed._before
+            for b in entities:
+                if b.id not in before:
+                    before[b.id] = bool(b.connected_to_spine)
+
     # -- connection / structural integrity ----------------------------------
 
     def rebuild_connections(self):
         """Flood-fill from spine bricks to mark connectivity."""
+        if self._feeds:
+            self._note_connectivity(self.bricks.values())
         # Reset all
         for b in self.bricks.values():
             b.connected_to_spine = False
@@ -310,60 +451,272 @@ class ShipDamageState:
                         self.bricks[current_id].children_ids.append(nid)
                         queue.append(nid)
 
-        # Compute load counts (number of descendants)
-        for bid in self.bricks:
-            self.bricks[bid].load_count = self._count_descendants(bid)
+        # Compute load counts (number of descendants) in one pass
+        roots = [b.id for b in self.bricks.values()
+                 if b.brick_type == 'STRUCTURAL_SPINE']
+        for bid, count in self._descendant_counts(roots).items():
+            self.bricks[bid].load_count = count
 
         # Update damage states for disconnected bricks
+        self._unsupported = set()
         for b in self.bricks.values():
-            if not b.connected_to_spine and b.damage_state == 'NOMINAL':
+            if not b.connected_to_spine:
+                self._unsupported.add(b.id)
+                if b.damage_state == 'NOMINAL':
+                    b.damage_state = 'POWER_LOSS'
+
+    def _descendant_counts(self, root_ids):
+        """Return ``{brick_id: descendant_count}`` for every brick in the
+        spanning subtrees rooted at *root_ids*.
+
+        Uses an explicit stack and a single reverse (post-order) sweep, so
+        cost is linear in subtree size and long chains cannot exhaust the
+        recursion limit.
+        """
+        order = []
+        stack = list(root_ids)
+        while stack:
+            bid = stack.pop()
+            entity = self.bricks.get(bid)
+            if entity is None:
+                continue
+            order.append(bid)
+            stack.extend(entity.children_ids)
+
+        counts = dict.fromkeys(order, 0)
+        for bid in reversed(order):
+            parent_id = self.bricks[bid].parent_id
+            if parent_id in counts:
+                counts[parent_id] += counts[bid] + 1
+        return counts
+
+    def _adjust_ancestor_loads(self, brick_id, delta):
+        """Add *delta* to the load count of *brick_id* and every ancestor
+        up to its spine root."""
+        entity = self.bricks.get(brick_id)
+        while entity is not None:
+            entity.load_count += delta
+            entity = self.bricks.get(entity.parent_id)
+
+    def _repair_connections(self, removed):
+        """Incrementally repair the spanning tree after *removed* bricks
+        (already deleted from :attr:`bricks` and :attr:`grid`) are gone.
+
+        Only the subtrees that hung off the removed bricks are re-checked:
+        their bricks are reattached through any alternate neighbour that is
+        still connected to the spine, and the rest are marked unsupported.
+        """
+        # Detach each removed brick from its surviving parent and collect
+        # the orphaned subtrees below it.
+        orphans = []
+        seen = set()
+        for entity in removed:
+            if not entity.connected_to_spine:
+                continue
+            parent = self.bricks.get(entity.parent_id)
+            if parent is not None:
+                parent.children_ids.remove(entity.id)
+                # Stops at the first removed ancestor, so nested removals
+                # are never subtracted twice.
+                self._adjust_ancestor_loads(parent.id,
+                                            -(entity.load_count + 1))
+            stack = list(entity.children_ids)
+            while stack:
+                cid = stack.pop()
+                child = self.bricks.get(cid)
+                if child is None or cid in seen:
+                    continue
+                seen.add(cid)
+                orphans.append(child)
+                stack.extend(child.children_ids)
+
+        if not orphans:
+            return
+
+        if self._feeds:
+            self._note_connectivity(orphans)
+        for b in orphans:
+            b.connected_to_spine = False
+            b.parent_id = None
+            b.children_ids = []
+            b.load_count = 0
+
+        # Reattach orphans that touch a brick still connected to the spine,
+        # then flood through the orphaned region from those anchors.
+        orphans.sort(key=lambda b: b.id)
+        reattached = set()
+        queue = deque()
+        for b in orphans:
+            for nid in self._neighbour_ids(b.id):
+                nb = self.bricks[nid]
+                if nb.connected_to_spine:
+                    b.connected_to_spine = True
+                    b.parent_id = nid
+                    nb.children_ids.append(b.id)
+                    reattached.add(b.id)
+                    queue.append(b.id)
+                    break
+
+        while queue:
+            current_id = queue.popleft()
+            for nid in self._neighbour_ids(current_id):
+                nb = self.bricks[nid]
+                if not nb.connected_to_spine:
+                    nb.connected_to_spine = True
+                    nb.parent_id = current_id
+                    self.bricks[current_id].children_ids.append(nid)
+                    reattached.add(nid)
+                    queue.append(nid)
+
+        # Load counts for the reattached forest, then push each grafted
+        # subtree's weight up through its new ancestors.
+        grafts = [bid for bid in sorted(reattached)
+                  if self.bricks[bid].parent_id not in reattached]
+        for bid, count in self._descendant_counts(grafts).items():
+            self.bricks[bid].load_count = count
+        for bid in grafts:
+            b = self.bricks[bid]
+            self._adjust_ancestor_loads(b.parent_id, b.load_count + 1)
+
+        for b in orphans:
+            if b.connected_to_spine:
+                continue
+            self._unsupported.add(b.id)
+            if b.damage_state == 'NOMINAL':
                 b.damage_state = 'POWER_LOSS'
 
-    def _count_descendants(self, brick_id):
-        """Count all transitive children of *brick_id*."""
-        entity = self.bricks.get(brick_id)
-        if entity is None:
-            return 0
-        count = 0
-        for cid in entity.children_ids:
-            count += 1 + self._count_descendants(cid)
-        return count
+    def _update_connections(self, removed):
+        """Refresh connectivity after *removed* bricks were deleted, using
+        the strategy selected by :attr:`connectivity_mode`."""
+        if self.connectivity_mode == 'REBUILD':
+            self.rebuild_connections()
+            return
+        self._repair_connections(removed)
+        if self.connectivity_mode == 'VERIFY':
+            mismatched = self.verify_connections()
+            if mismatched:
+                raise RuntimeError(
+                    f"Incremental connectivity diverged from full rebuild "
+                    f"for bricks {mismatched}")
+
+    def verify_connections(self):
+        """Cross-check the maintained spanning tree against a full
+        flood-fill without modifying any state.
+
+        Returns a sorted list of brick IDs whose ``connected_to_spine`` flag,
+        parent link or ``load_count`` is inconsistent (empty when valid).
+        """
+        reachable = set()
+        queue = deque(b.id for b in self.bricks.values()
+                      if b.brick_type == 'STRUCTURAL_SPINE')
+        while queue:
+            current_id = queue.popleft()
+            if current_id in reachable:
+                continue
+            reachable.add(current_id)
+            for nid in self._neighbour_ids(current_id):
+                if nid not in reachable:
+                    queue.append(nid)
+
+        expected_loads = self._descendant_counts(
+            b.id for b in self.bricks.values()
+            if b.connected_to_spine and b.parent_id is None)
+        bad = set()
+        for b in self.bricks.values():
+            if b.connected_to_spine != (b.id in reachable):
+                bad.add(b.id)
+                continue
+            if not b.connected_to_spine:
+                if b.parent_id is not None or b.children_ids:
+                    bad.add(b.id)
+                continue
+            if b.brick_type == 'STRUCTURAL_SPINE':
+                if b.parent_id is not None:
+                    bad.add(b.id)
+            else:
+                parent = self.bricks.get(b.parent_id)
+                if (parent is None or not parent.connected_to_spine
+                        or b.id not in parent.children_ids
+                        or b.parent_id not in self._neighbour_ids(b.id)):
+                    bad.add(b.id)
+            if b.load_count != expected_loads.get(b.id, 0):
+                bad.add(b.id)
+        return sorted(bad)
 
     def get_unsupported_bricks(self):
-        """Return list of brick IDs not connected to the spine."""
-        return [b.id for b in self.bricks.values()
-                if not b.connected_to_spine]
+        """Return sorted list of brick IDs not connected to the spine."""
+        return sorted(self._unsupported)
+
+    def get_critical_bricks(self, count=5):
+        """Return up to *count* connected brick IDs carrying the most
+        structural load, heaviest first.
+
+        Reads the cached ``load_count`` values, so it is cheap enough to
+        call every tick for AI target selection.
+        """
+        connected = (b for b in self.bricks.values()
+                     if b.connected_to_spine and b.load_count > 0)
+        top = heapq.nlargest(count, connected,
+                             key=lambda b: (b.load_count, -b.id))
+        return [b.id for b in top]
 
     # -- damage -------------------------------------------------------------
 
     def apply_damage(self, brick_id, amount):
         """Apply *amount* damage to a brick.  Returns list of events."""
-        entity = self.bricks.get(brick_id)
-        if entity is None or not entity.alive:
-            return []
-
+        return self.apply_damage_batch(((brick_id, amount),))
+
+    def apply_damage_batch(self, hits):
+        """Apply many hits at once and run structural integrity only once.
+
+        *hits* is an iterable of ``(brick_id, amount)`` pairs (a dict's
+        ``items()`` works) applied in order; repeated IDs accumulate and
+        hits on bricks already destroyed are ignored.  Returns the merged
+        event list: per-hit events in hit order, followed by a single
+        ``('unsupported_bricks', ids)`` event if any brick is unsupported
+        after the batch.
+        """
         events = []
-        entity.hp = max(0, entity.hp - amount)
-
-        # Update visual state based on HP fraction
-        if entity.hp > 0:
-            frac = entity.hp_fraction
-            if frac < 0.3:
-                entity.damage_state = 'HULL_THINNING'
-                events.append(('hull_thinning', brick_id))
-            elif frac < 0.6:
-                entity.damage_state = 'STRUCTURAL_STRESS'
-                events.append(('structural_stress', brick_id))
-        else:
-            # Brick destroyed
-            events.extend(self._destroy_brick(brick_id))
+        destroyed = []
+        for brick_id, amount in hits:
+            entity = self.bricks.get(brick_id)
+            if entity is None or not entity.alive:
+                continue
+
+            entity.hp = max(0, entity.hp - amount)
+
+            # Update visual state based on HP fraction
+            if entity.hp > 0:
+                frac = entity.hp_fraction
+                if frac < 0.3:
+                    entity.damage_state = 'HULL_THINNING'
+                    events.append(('hull_thinning', brick_id))
+                elif frac < 0.6:
+                    entity.damage_state = 'STRUCTURAL_STRESS'
+                    events.append(('structural_stress', brick_id))
+            else:
+                # Brick destroyed
+                events.extend(self._destroy_brick(entity))
+                destroyed.append(entity)
+
+        if destroyed:
+            # Re-check the sections that depended on the destroyed bricks
+            self._update_connections(destroyed)
+
+            unsupported = self.get_unsupported_bricks()
+            if unsupported:
+                events.append(('unsupported_bricks', unsupported))
 
         return events
 
-    def _destroy_brick(self, brick_id):
-        """Remove a destroyed brick and cascade structural checks."""
+    def _destroy_brick(self, entity):
+        """Remove a destroyed brick from the grid and roll its salvage.
+
+        Structural checks are left to the caller so that a batch of
+        destructions shares a single pass.
+        """
+        brick_id = entity.id
         events = [('brick_destroyed', brick_id)]
-        entity = self.bricks[brick_id]
 
         # Roll salvage
         salvage = self._roll_salvage(entity)
@@ -378,13 +731,9 @@ class ShipDamageState:
 
         # Remove from bricks dict
         del self.bricks[brick_id]
-
-        # Rebuild connectivity to find newly unsupported sections
-        self.rebuild_connections()
-
-        unsupported = self.get_unsupported_bricks()
-        if unsupported:
-            events.append(('unsupported_bricks', unsupported))
+        self._unsupported.discard(brick_id)
+        for feed in self._feeds:
+            feed.destroyed.append(brick_id)
 
         return events
 
@@ -398,27 +747,314 @@ class ShipDamageState:
             return SalvageEntity(entity.brick_type, entity.pos, condition)
         return None
 
+    # -- spatial queries ----------------------------------------------------
+
+    def _cell_range(self, lo, hi):
+        """Inclusive grid-index range covering world coordinates lo..hi."""
+        gs = self.grid_size if self.grid_size else 1.0
+        return range(round(lo / gs), round(hi / gs) + 1)
+
+    def query_sphere(self, center, radius, falloff='LINEAR'):
+        """Return bricks whose position lies within *radius* of *center*.
+
+        Result is a list of ``(brick_id, distance, factor)`` sorted by
+        distance then ID, where *factor* is the damage multiplier from the
+        chosen *falloff* curve (see :data:`AOE_FALLOFFS`).  Only the grid
+        cells overlapping the sphere are visited; when the sphere covers
+        more cells than the ship has bricks, the bricks are scanned instead.
+        """
+        if falloff not in AOE_FALLOFFS:
+            raise ValueError(f"Unknown falloff: {falloff}")
+        if radius < 0:
+            return []
+        cx, cy, cz = center
+        r2 = radius * radius
+        gs = self.grid_size if self.grid_size else 1.0
+        half = gs * 0.5
+
+        xs = self._cell_range(cx - radius, cx + radius)
+        ys = self._cell_range(cy - radius, cy + radius)
+        zs = self._cell_range(cz - radius, cz + radius)
+        if len(xs) * len(ys) * len(zs) > len(self.bricks):
+            candidates = list(self.bricks)
+        else:
+            candidates = []
+            grid = self.grid
+            for gx in xs:
+                # Closest a brick in this slab can be to the centre
+                dx = max(0.0, abs(gx * gs - cx) - half)
+                rem_x = r2 - dx * dx
+                if rem_x < 0:
+                    continue
+                for gy in ys:
+                    dy = max(0.0, abs(gy * gs - cy) - half)
+                    rem = rem_x - dy * dy
+                    if rem < 0:
+                        continue
+                    rz = math.sqrt(rem)
+                    for gz in self._cell_range(cz - rz, cz + rz):
+                        bid = grid.get((gx, gy, gz))
+                        if bid is not None:
+                            candidates.append(bid)
+
+        result = []
+        for bid in candidates:
+            entity = self.bricks.get(bid)
+            if entity is None:
+                continue
+            px, py, pz = entity.pos
+            d2 = (px - cx) ** 2 + (py - cy) ** 2 + (pz - cz) ** 2
+            if d2 > r2:
+                continue
+            dist = math.sqrt(d2)
+            if falloff == 'NONE' or radius == 0:
+                factor = 1.0
+            elif falloff == 'LINEAR':
+                factor = 1.0 - dist / radius
+            else:
+                factor = (1.0 - dist / radius) ** 2
+            result.append((bid, dist, factor))
+        result.sort(key=lambda hit: (hit[1], hit[0]))
+        return result
+
+    def query_box(self, min_corner, max_corner):
+        """Return sorted IDs of bricks whose position lies inside the
+        axis-aligned box spanned by *min_corner* and *max_corner*."""
+        lo = [min(a, b) for a, b in zip(min_corner, max_corner)]
+        hi = [max(a, b) for a, b in zip(min_corner, max_corner)]
+        ranges = [self._cell_range(lo[i], hi[i]) for i in range(3)]
+        if len(ranges[0]) * len(ranges[1]) * len(ranges[2]) > len(self.bricks):
+            candidates = self.bricks.keys()
+        else:
+            candidates = []
+            for gx in ranges[0]:
+                for gy in ranges[1]:
+                    for gz in ranges[2]:
+                        bid = self.grid.get((gx, gy, gz))
+                        if bid is not None:
+                            candidates.append(bid)
+
+        result = []
+        for bid in candidates:
+            entity = self.bricks.get(bid)
+            if entity is None:
+                continue
+            if all(lo[i] <= entity.pos[i] <= hi[i] for i in range(3)):
+                result.append(bid)
+        result.sort()
+        return result
+
+    def query_ray(self, origin, direction, max_distance, max_hits=None):
+        """Walk the grid along a ray and return the bricks it passes through.
+
+        Uses a 3-D DDA (Amanatides & Woo) so only the cells on the ray are
+        visited.  Returns ``(brick_id, distance)`` pairs in hit order, where
+        *distance* is where the ray enters the brick's cell; stops after
+        *max_hits* bricks when given.
+        """
+        length = math.sqrt(sum(c * c for c in direction))
+        if length == 0 or max_distance < 0 or not self.grid:
+            return []
+        d = [c / length for c in direction]
+        gs = self.grid_size if self.grid_size else 1.0
+
+        # Only walk the part of the ray inside the grid's bounding box, so
+        # misses and long (even infinite) ranges cost a handful of cells.
+        low, high = self._grid_bounds()
+        t_enter, t_exit = 0.0, max_distance
+        for i in range(3):
+            lo = (low[i] - 0.5) * gs
+            hi = (high[i] + 0.5) * gs
+            if d[i] == 0:
+                if not lo <= origin[i] <= hi:
+                    return []
+                continue
+            t0 = (lo - origin[i]) / d[i]
+            t1 = (hi - origin[i]) / d[i]
+            if t0 > t1:
+                t0, t1 = t1, t0
+            t_enter = max(t_enter, t0)
+            t_exit = min(t_exit, t1)
+        if t_enter > t_exit:
+            return []
+        start = [origin[i] + d[i] * t_enter for i in range(3)]
+
+        # Cell i spans world coordinates [(i - 0.5) * gs, (i + 0.5) * gs)
+        cell = [math.floor(start[i] / gs + 0.5) for i in range(3)]
+        step = [0, 0, 0]
+        t_max = [math.inf] * 3
+        t_delta = [math.inf] * 3
+        for i in range(3):
+            if d[i] > 0:
+                step[i] = 1
+                boundary = (cell[i] + 0.5) * gs
+            elif d[i] < 0:
+                step[i] = -1
+                boundary = (cell[i] - 0.5) * gs
+            else:
+                continue
+            t_max[i] = t_enter + (boundary - start[i]) / d[i]
+            t_delta[i] = gs / abs(d[i])
+
+        hits = []
+        t = t_enter
+        while t <= t_exit:
+            bid = self.grid.get(tuple(cell))
+            if bid is not None and bid in self.bricks:
+                hits.append((bid, t))
+                if max_hits is not None and len(hits) >= max_hits:
+                    break
+            axis = t_max.index(min(t_max))
+            if t_max[axis] == math.inf:
+                break
+            t = t_max[axis]
+            cell[axis] += step[axis]
+            t_max[axis] += t_delta[axis]
+        return hits
+
+    def _grid_bounds(self):
+        """Return the low and high cell corners of every brick ever added.
+
+        Destroyed bricks never move the box, so it is a cheap (cached)
+        superset of the live grid.
+        """
+        count = len(self._blueprints)
+        bounds = getattr(self, '_cell_bounds', None)
+        if bounds is None or bounds[0] != count:
+            cells = [bp[3] for bp in self._blueprints]
+            bounds = (count,
+                      tuple(min(c[i] for c in cells) for i in range(3)),
+                      tuple(max(c[i] for c in cells) for i in range(3)))
+            self._cell_bounds = bounds
+        return bounds[1], bounds[2]
+
+    def apply_area_damage(self, center, radius, damage, falloff='LINEAR'):
+        """Damage every brick within *radius* of *center*, scaled by the
+        *falloff* curve, as one :meth:`apply_damage_batch`.
+
+        Returns the merged event list.
+        """
+        hits = [(bid, damage * factor)
+                for bid, _dist, factor in self.query_sphere(
+                    center, radius, falloff)
+                if factor > 0]
+        return self.apply_damage_batch(hits)
+
     # -- tick (frame update) ------------------------------------------------
 
     def tick(self):
-        """Advance one frame.  Handles detachment of unsupported sections."""
+        """Advance one frame.  Handles detachment of unsupported sections.
+
+        Only bricks in the unsupported set are visited, so a fully
+        connected ship costs O(1) per frame.
+        """
+        if not self._unsupported:
+            return []
+
         detached_this_frame = []
-        for b in list(self.bricks.values()):
-            if not b.connected_to_spine:
-                b.unsupported_timer += 1
-                if b.unsupported_timer >= DETACH_TIMEOUT:
-                    b.damage_state = 'DETACHMENT'
-                    detached_this_frame.append(b.id)
+        for bid in self._unsupported:
+            b = self.bricks[bid]
+            b.unsupported_timer += 1
+            if b.unsupported_timer >= DETACH_TIMEOUT:
+                b.damage_state = 'DETACHMENT'
+                detached_this_frame.append(bid)
+
+        detached_this_frame.sort()
+        self._detach(detached_this_frame)
+        return detached_this_frame
 
-        for bid in detached_this_frame:
+    def _detach(self, brick_ids):
+        """Remove unsupported *brick_ids* from the ship as debris."""
+        for bid in brick_ids:
             self.detached_ids.add(bid)
+            self._unsupported.discard(bid)
             entity = self.bricks.pop(bid, None)
             if entity is not None:
                 cell = self._pos_to_cell(entity.pos)
                 if cell in self.grid and self.grid[cell] == bid:
                     del self.grid[cell]
-
-        return detached_this_frame
+                for feed in self._feeds:
+                    feed.detached.append(bid)
+
+    # -- snapshots ----------------------------------------------------------
+
+    def snapshot(self):
+        """Capture the full damage state as a compact
+        :class:`DamageSnapshot` (per-brick columns plus salvage, detached
+        ids and the salvage RNG state)."""
+        ids = sorted(self.bricks)
+        bricks = [self.bricks[bid] for bid in ids]
+        gridded = set(self.grid.values())
+        codes = DAMAGE_STATE_CODES
+
+        snap = DamageSnapshot()
+        snap.next_id = self._next_id
+        snap.ids = array('i', ids)
+        snap.hp = array('d', [b.hp for b in bricks])
+        snap.timer = array('i', [b.unsupported_timer for b in bricks])
+        snap.state = array('b', [codes[b.damage_state] for b in bricks])
+        snap.flags = array('b', [
+            (_FLAG_CONNECTED if b.connected_to_spine else 0)
+            | (_FLAG_IN_GRID if b.id in gridded else 0)
+            for b in bricks])
+        snap.parent = array('i', [-1 if b.parent_id is None else b.parent_id
+                                  for b in bricks])
+        snap.load = array('i', [b.load_count for b in bricks])
+        snap.child_counts = array('i', [len(b.children_ids) for b in bricks])
+        snap.children = array('i', [cid for b in bricks
+                                    for cid in b.children_ids])
+        snap.salvage = tuple((sv.brick_type, sv.pos, sv.condition)
+                             for sv in self.salvage)
+        snap.detached = array('i', sorted(self.detached_ids))
+        snap.rng_state = self._rng.getstate()
+        return snap
+
+    def restore(self, snapshot):
+        """Return this ship to the state captured in *snapshot*.
+
+        Brick entities that still exist are reused; destroyed ones are
+        recreated from the ship's blueprint.  Replaying the same hits after
+        a restore reproduces the same events and salvage rolls.
+        """
+        if snapshot.next_id > len(self._blueprints):
+            raise ValueError("Snapshot belongs to a different ship")
+        previous = self.bricks
+        blueprints = self._blueprints
+        bricks = {}
+        grid = {}
+        unsupported = set()
+        offsets = snapshot._offsets()
+        for i, (bid, hp, timer, state, flags, parent, load) in enumerate(zip(
+                snapshot.ids, snapshot.hp, snapshot.timer, snapshot.state,
+                snapshot.flags, snapshot.parent, snapshot.load)):
+            entity = previous.get(bid)
+            if entity is None:
+                brick_type, pos, archetype, _cell = blueprints[bid]
+                entity = self._new_entity(bid, brick_type, pos, archetype)
+            entity.hp = hp
+            entity.unsupported_timer = timer
+            entity.damage_state = _DAMAGE_STATE_NAMES[state]
+            entity.parent_id = None if parent < 0 else parent
+            entity.load_count = load
+            entity.children_ids = snapshot.children[
+                offsets[i]:offsets[i + 1]].tolist()
+            bricks[bid] = entity
+            if flags & _FLAG_IN_GRID:
+                grid[blueprints[bid][3]] = bid
+            if flags & _FLAG_CONNECTED:
+                entity.connected_to_spine = True
+            else:
+                entity.connected_to_spine = False
+                unsupported.add(bid)
+        self.bricks = bricks
+        self.grid = grid
+        self._unsupported = unsupported
+        self.salvage = [SalvageEntity(*sv) for sv in snapshot.salvage]
+        self.detached_ids = set(snapshot.detached)
+        self._next_id = snapshot.next_id
+        self._rng.setstate(snapshot.rng_state)
+        for feed in self._feeds:
+            feed.reset = True
 
     # -- queries ------------------------------------------------------------
 
@@ -442,6 +1078,386 @@ class ShipDamageState:
         return summary
 
 
+# ---------------------------------------------------------------------------
+# Snapshots and deltas (rollback netcode / replays)
+# ---------------------------------------------------------------------------
+
+_FLAG_CONNECTED = 1
+_FLAG_IN_GRID = 2
+
+_DAMAGE_STATE_NAMES = tuple(DAMAGE_STATES)
+
+_SNAPSHOT_MAGIC = b'DSNP'
+_SNAPSHOT_VERSION = 1
+_SNAPSHOT_HEADER = struct.Struct('<4sHIIII')
+
+
+def _array_bytes(arr):
+    """Little-endian bytes of an :class:`array.array`."""
+    if sys.byteorder == 'big':
+        arr = array(arr.typecode, arr)
+        arr.byteswap()
+    return arr.tobytes()
+
+
+def _array_from(typecode, data, offset, count):
+    """Read *count* little-endian items from *data*; return
+    ``(array, new_offset)``."""
+    arr = array(typecode)
+    end = offset + count * arr.itemsize
+    arr.frombytes(data[offset:end])
+    if sys.byteorder == 'big':
+        arr.byteswap()
+    return arr, end
+
+
+class DamageSnapshot:
+    """Compact capture of a :class:`ShipDamageState` at one frame.
+
+    Per-brick state is stored column-wise in :class:`array.array` buffers
+    for alive bricks in id order; static data (type, position) is not
+    copied since it never changes.  Use :meth:`ShipDamageState.snapshot`
+    to create one and :meth:`ShipDamageState.restore` to apply it.
+    """
+
+    __slots__ = ('next_id', 'ids', 'hp', 'timer', 'state', 'flags',
+                 'parent', 'load', 'child_counts', 'children', 'salvage',
+                 'detached', 'rng_state')
+
+    _COLUMNS = (
+        ('ids', 'i'), ('hp', 'd'), ('timer', 'i'), ('state', 'b'),
+        ('flags', 'b'), ('parent', 'i'), ('load', 'i'),
+        ('child_counts', 'i'),
+    )
+
+    def __init__(self):
+        self.next_id = 0
+        for name, typecode in self._COLUMNS:
+            setattr(self, name, array(typecode))
+        self.children = array('i')
+        self.salvage = ()
+        self.detached = array('i')
+        self.rng_state = None
+
+    def __eq__(self, other):
+        if not isinstance(other, DamageSnapshot):
+            return NotImplemented
+        return all(getattr(self, name) == getattr(other, name)
+                   for name in self.__slots__)
+
+    def _offsets(self):
+        """Start offset of each brick's children in :attr:`children`, plus
+        the end offset."""
+        return list(accumulate(self.child_counts, initial=0))
+
+    def _record(self, i, offsets):
+        """Structural record of the brick at column index *i*."""
+        return (self.timer[i], self.state[i], self.flags[i],
+                self.parent[i], self.load[i],
+                tuple(self.children[offsets[i]:offsets[i + 1]]))
+
+    # -- deltas -------------------------------------------------------------
+
+    def delta_from(self, previous):
+        """Return the :class:`DamageDelta` that turns *previous* into this
+        snapshot."""
+        delta = DamageDelta()
+        delta.next_id = self.next_id
+        old_index = {bid: j for j, bid in enumerate(previous.ids)}
+        old_offsets = previous._offsets()
+        offsets = self._offsets()
+        for i, bid in enumerate(self.ids):
+            j = old_index.pop(bid, None)
+            if j is None:
+                delta.hp[bid] = self.hp[i]
+                delta.records[bid] = self._record(i, offsets)
+                continue
+            if self.hp[i] != previous.hp[j]:
+                delta.hp[bid] = self.hp[i]
+            if (self.timer[i] != previous.timer[j]
+                    or self.state[i] != previous.state[j]
+                    or self.flags[i] != previous.flags[j]
+                    or self.parent[i] != previous.parent[j]
+                    or self.load[i] != previous.load[j]
+                    or self.children[offsets[i]:offsets[i + 1]]
+                    != previous.children[old_offsets[j]:old_offsets[j + 1]]):
+                delta.records[bid] = self._record(i, offsets)
+        delta.removed = tuple(sorted(old_index))
+
+        base = len(previous.salvage)
+        if self.salvage[:base] != previous.salvage:
+            base = 0
+        delta.salvage_base = base
+        delta.salvage = self.salvage[base:]
+        delta.detached = tuple(sorted(
+            set(self.detached).difference(previous.detached)))
+        if self.rng_state != previous.rng_state:
+            delta.rng_state = self.rng_state
+        return delta
+
+    def apply_delta(self, delta):
+        """Return a new snapshot equal to this one with *delta* applied."""
+        offsets = self._offsets()
+        removed = set(delta.removed)
+        records = {}
+        for i, bid in enumerate(self.ids):
+            if bid in removed:
+                continue
+            hp = delta.hp.get(bid, self.hp[i])
+            record = delta.records.get(bid)
+            if record is None:
+                record = self._record(i, offsets)
+            records[bid] = (hp, record)
+        for bid, record in delta.records.items():
+            if bid not in records:
+                records[bid] = (delta.hp[bid], record)
+
+        snap = DamageSnapshot()
+        snap.next_id = delta.next_id
+        for bid in sorted(records):
+            hp, (timer, state, flags, parent, load, kids) = records[bid]
+            snap.ids.append(bid)
+            snap.hp.append(hp)
+            snap.timer.append(timer)
+            snap.state.append(state)
+            snap.flags.append(flags)
+            snap.parent.append(parent)
+            snap.load.append(load)
+            snap.child_counts.append(len(kids))
+            snap.children.extend(kids)
+        snap.salvage = self.salvage[:delta.salvage_base] + delta.salvage
+        snap.detached = array('i', sorted(
+            set(self.detached).union(delta.detached)))
+        snap.rng_state = (self.rng_state if delta.rng_state is None
+                          else delta.rng_state)
+        return snap
+
+    # -- binary encoding ----------------------------------------------------
+
+    def to_bytes(self):
+        """Serialise to a compact little-endian binary blob."""
+        version, internal, gauss_next = self.rng_state
+        meta = json.dumps({
+            'salvage': [list(sv) for sv in self.salvage],
+            'rng': [version, gauss_next],
+        }, separators=(',', ':')).encode('utf-8')
+        parts = [_SNAPSHOT_HEADER.pack(
+            _SNAPSHOT_MAGIC, _SNAPSHOT_VERSION, self.next_id,
+            len(self.ids), len(self.children), len(self.detached))]
+        for name, _typecode in self._COLUMNS:
+            parts.append(_array_bytes(getattr(self, name)))
+        parts.append(_array_bytes(self.children))
+        parts.append(_array_bytes(self.detached))
+        parts.append(struct.pack('<I', len(internal)))
+        parts.append(_array_bytes(array('I', internal)))
+        parts.append(meta)
+        return b''.join(parts)
+
+    @classmethod
+    def from_bytes(cls, data):
+        """Deserialise a blob produced by :meth:`to_bytes`."""
+        magic, version, next_id, count, n_children, n_detached = \
+            _SNAPSHOT_HEADER.unpack_from(data, 0)
+        if magic != _SNAPSHOT_MAGIC or version != _SNAPSHOT_VERSION:
+            raise ValueError("Not a damage snapshot blob")
+        snap = cls()
+        snap.next_id = next_id
+        offset = _SNAPSHOT_HEADER.size
+        for name, typecode in cls._COLUMNS:
+            column, offset = _array_from(typecode, data, offset, count)
+            setattr(snap, name, column)
+        snap.children, offset = _array_from('i', data, offset, n_children)
+        snap.detached, offset = _array_from('i', data, offset, n_detached)
+        (n_internal,) = struct.unpack_from('<I', data, offset)
+        offset += 4
+        internal, offset = _array_from('I', data, offset, n_internal)
+        meta = json.loads(data[offset:].decode('utf-8'))
+        snap.salvage = tuple((sv[0], tuple(sv[1]), sv[2])
+                             for sv in meta['salvage'])
+        rng_version, gauss_next = meta['rng']
+        snap.rng_state = (rng_version, tuple(internal), gauss_next)
+        return snap
+
+
+class DamageDelta:
+    """Frame-to-frame difference between two :class:`DamageSnapshot`
+    objects: changed HP, removed (destroyed or detached) ids, bricks whose
+    structural record changed, newly dropped salvage, newly detached ids
+    and the salvage RNG state when it advanced."""
+
+    __slots__ = ('next_id', 'hp', 'records', 'removed', 'salvage_base',
+                 'salvage', 'detached', 'rng_state')
+
+    def __init__(self):
+        self.next_id = 0
+        self.hp = {}          # brick_id → new hp
+        self.records = {}     # brick_id → (timer, state, flags, parent,
+        #                                   load, children)
+        self.removed = ()
+        self.salvage_base = 0
+        self.salvage = ()
+        self.detached = ()
+        self.rng_state = None
+
+    @property
+    def empty(self):
+        """True when nothing changed between the two frames."""
+        return not (self.hp or self.records or self.removed
+                    or self.salvage or self.detached
+                    or self.rng_state is not None)
+
+
+# ---------------------------------------------------------------------------
+# Array-backed (struct-of-arrays) damage state
+# ---------------------------------------------------------------------------
+
+
+class ArrayBrickEntity(BrickEntity):
+    """:class:`BrickEntity` whose per-frame fields live in the owning
+    :class:`ArrayShipDamageState` arrays, indexed by brick id.
+
+    Topology (type, position, spanning-tree links, load count) stays on the
+    object; hp, max_hp, mass, hull_weight, connectivity, timer and damage
+    state read and write straight through to the arrays.
+    """
+
+    __slots__ = ('_store',)
+
+    def __init__(self, store, brick_id, brick_type, pos, archetype=None):
+        self._store = store
+        super().__init__(brick_id, brick_type, pos, archetype)
+
+    def _field(name, cast):
+        def getter(self):
+            return cast(getattr(self._store, name)[self.id])
+
+        def setter(self, value):
+            getattr(self._store, name)[self.id] = value
+
+        return property(getter, setter)
+
+    hp = _field('_hp', float)
+    max_hp = _field('_max_hp', float)
+    mass = _field('_mass', float)
+    hull_weight = _field('_hull_weight', float)
+    connected_to_spine = _field('_connected', bool)
+    unsupported_timer = _field('_timer', int)
+    del _field
+
+    @property
+    def damage_state(self):
+        return _DAMAGE_STATE_NAMES[self._store._state[self.id]]
+
+    @damage_state.setter
+    def damage_state(self, value):
+        self._store._state[self.id] = DAMAGE_STATE_CODES[value]
+
+
+class ArrayShipDamageState(ShipDamageState):
+    """Struct-of-arrays variant of :class:`ShipDamageState` for large-scale
+    battle simulation.
+
+    hp, max_hp, mass, hull_weight, the connected flag, unsupported timers
+    and damage-state codes are stored in contiguous NumPy arrays indexed by
+    brick id, so aggregates (:meth:`total_mass`, :meth:`total_hull_weight`,
+    :meth:`get_damage_summary`) and :meth:`tick` run as vectorised
+    operations.  The public API is identical to :class:`ShipDamageState`;
+    ``bricks`` still maps ids to (array-backed) entities.  Requires NumPy.
+    """
+
+    _INITIAL_CAPACITY = 64
+
+    def __init__(self, grid_size=1.0, connectivity_mode='INCREMENTAL'):
+        if np is None:
+            raise ImportError("ArrayShipDamageState requires NumPy")
+        super().__init__(grid_size=grid_size,
+                         connectivity_mode=connectivity_mode)
+        self._capacity = 0
+        self._resize(self._INITIAL_CAPACITY)
+
+    # -- storage ------------------------------------------------------------
+
+    _ARRAY_FIELDS = (
+        ('_hp', 'float64'),
+        ('_max_hp', 'float64'),
+        ('_mass', 'float64'),
+        ('_hull_weight', 'float64'),
+        ('_connected', 'bool'),
+        ('_present', 'bool'),
+        ('_timer', 'int32'),
+        ('_state', 'int8'),
+    )
+
+    def _resize(self, capacity):
+        """Grow every array to *capacity* entries, keeping existing data."""
+        for name, dtype in self._ARRAY_FIELDS:
+            grown = np.zeros(capacity, dtype=dtype)
+            if self._capacity:
+                grown[:self._capacity] = getattr(self, name)
+            setattr(self, name, grown)
+        self._capacity = capacity
+
+    def _new_entity(self, brick_id, brick_type, pos, archetype):
+        if brick_id >= self._capacity:
+            self._resize(max(self._capacity * 2, brick_id + 1))
+        self._present[brick_id] = True
+        return ArrayBrickEntity(self, brick_id, brick_type, pos, archetype)
+
+    def array_view(self, field):
+        """Return a live view of one per-brick array (``'hp'``,
+        ``'max_hp'``, ``'mass'``, ``'hull_weight'``, ``'connected'``,
+        ``'present'``, ``'timer'`` or ``'state'``) trimmed to the bricks
+        added so far."""
+        return getattr(self, '_' + field)[:self._next_id]
+
+    def _destroy_brick(self, entity):
+        self._present[entity.id] = False
+        return super()._destroy_brick(entity)
+
+    def restore(self, snapshot):
+        self._present[:] = False
+        super().restore(snapshot)
+        self._present[np.asarray(snapshot.ids, dtype=np.intp)] = True
+
+    # -- tick (frame update) ------------------------------------------------
+
+    def tick(self):
+        """Advance one frame with vectorised timer updates over the
+        unsupported set."""
+        if not self._unsupported:
+            return []
+
+        idx = np.fromiter(self._unsupported, dtype=np.intp,
+                          count=len(self._unsupported))
+        self._timer[idx] += 1
+        due = np.sort(idx[self._timer[idx] >= DETACH_TIMEOUT])
+        if not len(due):
+            return []
+
+        self._state[due] = DAMAGE_STATE_CODES['DETACHMENT']
+        self._present[due] = False
+        detached_this_frame = due.tolist()
+        self._detach(detached_this_frame)
+        return detached_this_frame
+
+    # -- queries ------------------------------------------------------------
+
+    def total_hull_weight(self):
+        n = self._next_id
+        return float(self._hull_weight[:n][self._present[:n]].sum())
+
+    def total_mass(self):
+        n = self._next_id
+        return float(self._mass[:n][self._present[:n]].sum())
+
+    def get_damage_summary(self):
+        n = self._next_id
+        counts = np.bincount(self._state[:n][self._present[:n]],
+                             minlength=len(_DAMAGE_STATE_NAMES))
+        return {name: int(counts[code])
+                for code, name in enumerate(_DAMAGE_STATE_NAMES)}
+
+
 # ---------------------------------------------------------------------------
 # Blender registration stubs
 # ---------------------------------------------------------------------------
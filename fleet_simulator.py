@@ -0,0 +1,342 @@
+"""
+Fleet-scale damage and power simulation.
+
+Drives many ships — each a :class:`damage_system.ShipDamageState` paired
+with a :class:`power_system.ShipPowerState` — from a single per-frame
+:meth:`FleetDamageSimulator.tick` call:
+
+- Hits queued for a ship during the frame are applied as one
+  :meth:`~damage_system.ShipDamageState.apply_damage_batch`.
+- Each ship then advances structural detachment and its power simulation.
+- Ships can optionally be sharded across worker processes; each worker owns
+  its ships for their whole lifetime, so only DNA, hits and events cross
+  the process boundary.
+
+Brick-type lookup tables (``BRICK_HP``, ``BRICK_MASS``, ``HULL_WEIGHTS``,
+``POWER_GENERATION`` …) are module-level constants, so every ship in a
+process shares one copy and each worker imports them exactly once.
+
+This module is a pure-Python reference implementation.  It does **not**
+depend on ``bpy`` so it can run on headless simulation servers.
+"""
+
+import multiprocessing
+import time
+from collections import deque
+
+try:
+    from . import damage_system
+    from . import power_system
+except ImportError:  # loaded outside the addon package (servers, workers)
+    import damage_system
+    import power_system
+
+# Number of recent tick timings kept for FleetDamageSimulator.get_tick_stats
+TICK_HISTORY = 120
+
+
+# ---------------------------------------------------------------------------
+# Ship shard (one per process)
+# ---------------------------------------------------------------------------
+
+
+class _ShipShard:
+    """A group of ships ticked together inside one process."""
+
+    def __init__(self, array_backend=False):
+        self.state_class = (damage_system.ArrayShipDamageState
+                            if array_backend
+                            else damage_system.ShipDamageState)
+        # With the array backend every ship's power lives in one engine
+        self.power_engine = (power_system.PowerEngine()
+                             if array_backend else None)
+        self.ships = {}  # ship_id → (ShipDamageState, ShipPowerState|None)
+
+    def add(self, ship_id, dna, seed=None):
+        damage = self.state_class.from_ship_dna(
+            dna.get('bricks', []), dna.get('grid_size', 1.0),
+            seed=dna.get('seed') if seed is None else seed)
+        power = power_system.ShipPowerState.from_damage_state(
+            damage, ship_class=dna.get('class', 'CRUISER'))
+        if self.power_engine is not None:
+            self.power_engine.add_ship(power, ship_id=ship_id)
+            power = None
+        self.ships[ship_id] = (damage, power)
+
+    def remove(self, ship_id):
+        if self.ships.pop(ship_id, None) and self.power_engine is not None:
+            self.power_engine.remove_ship(ship_id)
+
+    def tick(self, dt, hits):
+        engine = self.power_engine
+        outcomes = []
+        for ship_id, (damage, power) in self.ships.items():
+            ship_hits = hits.get(ship_id)
+            damage_events = (damage.apply_damage_batch(ship_hits)
+                             if ship_hits else [])
+            detached = damage.tick()
+            if engine is None:
+                power.sync_with_damage_state(damage)
+                power_events = power.tick(dt)
+            else:
+                engine.sync_with_damage_state(ship_id, damage)
+                power_events = None
+            outcomes.append((ship_id, damage_events, detached, power_events))
+
+        # One vectorised power pass for the whole shard
+        engine_events = engine.tick(dt) if engine is not None else {}
+        results = {}
+        for ship_id, damage_events, detached, power_events in outcomes:
+            if power_events is None:
+                power_events = engine_events.get(ship_id, [])
+            if damage_events or detached or power_events:
+                results[ship_id] = {
+                    'damage': damage_events,
+                    'detached': detached,
+                    'power': power_events,
+                }
+        return results
+
+    def summaries(self):
+        return {
+            ship_id: {
+                'alive_bricks': damage.alive_count(),
+                'total_mass': damage.total_mass(),
+                'hull_weight': damage.total_hull_weight(),
+                'damage': damage.get_damage_summary(),
+                'power': (power.get_power_summary() if power is not None
+                          else self.power_engine.get_power_summary(ship_id)),
+            }
+            for ship_id, (damage, power) in self.ships.items()
+        }
+
+
+def _shard_worker(conn, array_backend):
+    """Worker-process loop serving commands for one :class:`_ShipShard`."""
+    shard = _ShipShard(array_backend=array_backend)
+    while True:
+        command, args = conn.recv()
+        if command == 'stop':
+            break
+        try:
+            reply = getattr(shard, command)(*args)
+        except Exception as exc:  # report to the parent instead of dying
+            conn.send(('error', f"{type(exc).__name__}: {exc}"))
+        else:
+            conn.send(('ok', reply))
+    conn.close()
+
+
+# ---------------------------------------------------------------------------
+# Fleet simulator
+# ---------------------------------------------------------------------------
+
+
+class FleetDamageSimulator:
+    """Owns and ticks many ships' damage and power state.
+
+    Usage::
+
+        fleet = FleetDamageSimulator(workers=4)
+        ship = fleet.add_ship(dna)
+        fleet.queue_damage(ship, [(12, 250), (13, 250)])
+        events = fleet.tick(dt=1/60)   # {ship_id: {'damage', 'detached', 'power'}}
+        print(fleet.get_tick_stats())
+        fleet.close()
+
+    With ``workers=1`` (the default) every ship lives in this process and
+    :meth:`get_ship` returns its live state objects.  With ``workers > 1``
+    ships are distributed over that many worker processes, which tick
+    their shards in parallel.  Set ``array_backend=True`` to use
+    :class:`damage_system.ArrayShipDamageState` and tick each shard's power
+    in one :class:`power_system.PowerEngine` pass (requires NumPy).
+    """
+
+    def __init__(self, workers=1, array_backend=False):
+        self.workers = max(1, int(workers))
+        self.array_backend = array_backend
+        self.last_tick_seconds = 0.0
+        self.tick_count = 0
+        self._tick_times = deque(maxlen=TICK_HISTORY)
+        self._next_ship_id = 0
+        self._ship_shard = {}     # ship_id → shard index
+        self._pending_hits = {}   # ship_id → list of (brick_id, amount)
+
+        self._local = None
+        self._conns = []
+        self._procs = []
+        if self.workers == 1:
+            self._local = _ShipShard(array_backend=array_backend)
+        else:
+            ctx = multiprocessing.get_context()
+            for _ in range(self.workers):
+                parent_conn, child_conn = ctx.Pipe()
+                proc = ctx.Process(target=_shard_worker,
+                                   args=(child_conn, array_backend),
+                                   daemon=True)
+                proc.start()
+                child_conn.close()
+                self._conns.append(parent_conn)
+                self._procs.append(proc)
+        self._shard_sizes = [0] * self.workers
+
+    # -- shard plumbing -----------------------------------------------------
+
+    def _call(self, shard, command, *args):
+        if self._local is not None:
+            return getattr(self._local, command)(*args)
+        conn = self._conns[shard]
+        conn.send((command, args))
+        return self._reply(conn)
+
+    @staticmethod
+    def _reply(conn):
+        status, payload = conn.recv()
+        if status == 'error':
+            raise RuntimeError(f"Fleet worker failed: {payload}")
+        return payload
+
+    def _broadcast(self, command, args_for_shard):
+        """Run *command* on every shard concurrently and merge the dicts."""
+        if self._local is not None:
+            return getattr(self._local, command)(*args_for_shard(0))
+        for shard, conn in enumerate(self._conns):
+            conn.send((command, args_for_shard(shard)))
+        # Drain every pipe before raising so no stale reply is left behind
+        replies = [conn.recv() for conn in self._conns]
+        failed = [f"shard {shard}: {payload}"
+                  for shard, (status, payload) in enumerate(replies)
+                  if status == 'error']
+        if failed:
+            raise RuntimeError(f"Fleet worker failed: {'; '.join(failed)}")
+        merged = {}
+        for _, payload in replies:
+            merged.update(payload)
+        # Ship-id order, independent of which worker owns which ship
+        return {ship_id: merged[ship_id] for ship_id in sorted(merged)}
+
+    # -- ship management ----------------------------------------------------
+
+    def add_ship(self, dna, seed=None):
+        """Add a ship built from a Ship DNA dict and return its ship id.
+
+        *seed* overrides the DNA seed for the ship's salvage rolls.
+        """
+        ship_id = self._next_ship_id
+        self._next_ship_id += 1
+        shard = self._shard_sizes.index(min(self._shard_sizes))
+        self._call(shard, 'add', ship_id, dna, seed)
+        self._ship_shard[ship_id] = shard
+        self._shard_sizes[shard] += 1
+        return ship_id
+
+    def remove_ship(self, ship_id):
+        """Remove a ship from the simulation."""
+        shard = self._ship_shard.pop(ship_id, None)
+        if shard is None:
+            return
+        self._call(shard, 'remove', ship_id)
+        self._shard_sizes[shard] -= 1
+        self._pending_hits.pop(ship_id, None)
+
+    def get_ship(self, ship_id):
+        """Return ``(damage_state, power_state)`` for a local ship.
+
+        With ``array_backend=True`` power lives in the shard's
+        :class:`power_system.PowerEngine` and *power_state* is None.
+        """
+        if self._local is None:
+            raise RuntimeError(
+                "Ship state lives in a worker process; use get_summaries()")
+        return self._local.ships[ship_id]
+
+    @property
+    def ship_count(self):
+        return len(self._ship_shard)
+
+    # -- simulation ---------------------------------------------------------
+
+    def queue_damage(self, ship_id, hits):
+        """Queue ``(brick_id, amount)`` hits for *ship_id*; they are applied
+        as one batch on the next :meth:`tick`."""
+        if ship_id not in self._ship_shard:
+            raise KeyError(f"Unknown ship id: {ship_id}")
+        self._pending_hits.setdefault(ship_id, []).extend(hits)
+
+    def tick(self, dt=1.0 / 60.0):
+        """Advance every ship by one frame of *dt* seconds.
+
+        Returns ``{ship_id: {'damage': [...], 'detached': [...],
+        'power': [...]}}`` for ships that produced events this frame.
+        """
+        start = time.perf_counter()
+        hits = self._pending_hits
+        self._pending_hits = {}
+        if self._local is not None:
+            results = self._local.tick(dt, hits)
+        else:
+            per_shard = [{} for _ in range(self.workers)]
+            for ship_id, ship_hits in hits.items():
+                per_shard[self._ship_shard[ship_id]][ship_id] = ship_hits
+            results = self._broadcast(
+                'tick', lambda shard: (dt, per_shard[shard]))
+        self.last_tick_seconds = time.perf_counter() - start
+        self._tick_times.append(self.last_tick_seconds)
+        self.tick_count += 1
+        return results
+
+    def get_tick_stats(self):
+        """Return wall-time statistics over the recent ticks (seconds)."""
+        times = list(self._tick_times)
+        if not times:
+            return {'ticks': 0, 'ships': self.ship_count,
+                    'workers': self.workers, 'last': 0.0, 'mean': 0.0,
+                    'max': 0.0}
+        return {
+            'ticks': self.tick_count,
+            'ships': self.ship_count,
+            'workers': self.workers,
+            'last': self.last_tick_seconds,
+            'mean': sum(times) / len(times),
+            'max': max(times),
+        }
+
+    def get_summaries(self):
+        """Return ``{ship_id: summary_dict}`` for every ship."""
+        return self._broadcast('summaries', lambda shard: ())
+
+    # -- lifecycle ----------------------------------------------------------
+
+    def close(self):
+        """Stop all worker processes."""
+        for conn in self._conns:
+            try:
+                conn.send(('stop', ()))
+                conn.close()
+            except (OSError, BrokenPipeError):
+                pass
+        for proc in self._procs:
+            proc.join(timeout=5)
+        self._conns = []
+        self._procs = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+
+# ---------------------------------------------------------------------------
+# Blender registration stubs
+# ---------------------------------------------------------------------------
+
+
+def register():
+    """Register this module."""
+    pass
+
+
+def unregister():
+    """Unregister this module."""
+    pass
@@ -7,6 +7,8 @@ Designed for FPV exploration
 import bpy
 import random
 import math
+from . import ship_parts
+from . import material_registry
 
 
 # Standard human scale for FPV (in Blender units, approximately meters)
@@ -262,28 +264,26 @@ def generate_crew_quarters(scale=1.0, bunks=4, naming_prefix=''):
     room_width = max(3.0, bunks * 0.8)
     room_depth = 4.0
     
-    bpy.ops.mesh.primitive_cube_add(
+    floor = ship_parts.add_cube(
+        _prefixed_name(naming_prefix, "Quarters_Floor"),
         size=1,
-        location=(scale * 0.3, -scale * 0.3, -scale * 0.15)
+        location=(scale * 0.3, -scale * 0.3, -scale * 0.15),
+        scale=(room_width, room_depth, 0.05),
     )
-    floor = bpy.context.active_object
-    floor.name = _prefixed_name(naming_prefix, "Quarters_Floor")
-    floor.scale = (room_width, room_depth, 0.05)
-    bpy.ops.object.transform_apply(scale=True)
     objects.append(floor)
     
     # Create bunks
     bunk_spacing = room_width / bunks if bunks > 0 else 1.0
     for i in range(bunks):
         x_pos = scale * 0.3 - room_width / 2 + (i + 0.5) * bunk_spacing
-        bpy.ops.mesh.primitive_cube_add(
+        # Every bunk links one shared mesh
+        bunk = ship_parts.add_cube(
+            _prefixed_name(naming_prefix, f"Bunk_{i+1}"),
             size=1,
-            location=(x_pos, -scale * 0.3 + room_depth / 2 - 0.5, -scale * 0.1)
+            location=(x_pos, -scale * 0.3 + room_depth / 2 - 0.5, -scale * 0.1),
+            scale=(0.8, 2.0, 0.3),
+            shared=True,
         )
-        bunk = bpy.context.active_object
-        bunk.name = _prefixed_name(naming_prefix, f"Bunk_{i+1}")
-        bunk.scale = (0.8, 2.0, 0.3)
-        bpy.ops.object.transform_apply(scale=True)
         objects.append(bunk)
     
     return objects
@@ -367,14 +367,8 @@ def generate_engine_room(scale=1.0, naming_prefix=''):
     objects.append(core)
     
     # Add glowing material to core
-    mat = bpy.data.materials.new(name="Reactor_Glow")
-    mat.use_nodes = True
-    nodes = mat.node_tree.nodes
-    emission = nodes.new(type='ShaderNodeEmission')
-    emission.inputs['Color'].default_value = (0.8, 0.3, 0.1, 1.0)  # Orange glow
-    emission.inputs['Strength'].default_value = 3.0
-    output = nodes.get('Material Output')
-    mat.node_tree.links.new(emission.outputs['Emission'], output.inputs['Surface'])
+    mat = material_registry.emission_material(
+        "Reactor_Glow", (0.8, 0.3, 0.1, 1.0), 3.0)
     core.data.materials.append(mat)
     
     return objects
@@ -149,6 +149,7 @@ def generate_lods(hull_obj, ship_class='FRIGATE', naming_prefix=''):
         new_obj["lod_level"] = level
         new_obj["lod_ratio"] = cfg['ratio']
         new_obj["lod_distance"] = float(distances[level])
+        new_obj["lod_source"] = hull_obj.name
 
         created.append(new_obj)
 
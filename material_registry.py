@@ -0,0 +1,112 @@
+"""
+Shared material registry.
+
+Generators used to create a new ``bpy.data.materials`` entry for every
+turret, asteroid and station section even when the shader values were
+identical, so a 500-rock belt carried 500 duplicate ore materials.
+Materials are now looked up by their name and parameter tuple instead:
+
+- Every registered material stores its key in the ``material_key``
+  custom property, so the registry also finds materials saved in a
+  .blend file by an earlier session.
+- The name is part of the key, so callers pass a per-role name (no
+  per-object index).  A project naming prefix in the name keeps each
+  project's materials apart, and exports never see another role's or
+  another project's material name.
+"""
+
+import bpy
+
+
+# ---------------------------------------------------------------------------
+# Registry
+# ---------------------------------------------------------------------------
+
+# key → material name, rebuilt lazily from the material_key properties
+_registry = {}
+
+
+def get_material(name, key, build):
+    """Return the material registered under *key*, creating it if needed.
+
+    Args:
+        name: Material name; materials are only shared between requests
+            with the same name and *key*.
+        key: Hashable parameter tuple identifying the shader values.
+        build: Callable that sets up a freshly created material.
+
+    Returns:
+        The shared ``bpy.types.Material``.
+    """
+    key = repr((name, key))
+    mat = bpy.data.materials.get(_registry.get(key, ''))
+    if mat is None or mat.get("material_key") != key:
+        mat = _find_material(key)
+        if mat is None:
+            mat = bpy.data.materials.new(name=name)
+            build(mat)
+            mat["material_key"] = key
+        _registry[key] = mat.name
+    return mat
+
+
+def _find_material(key):
+    """Scan existing materials (e.g. loaded from a .blend) for *key*."""
+    for mat in bpy.data.materials:
+        if mat.get("material_key") == key:
+            return mat
+    return None
+
+
+# ---------------------------------------------------------------------------
+# Common shaders
+# ---------------------------------------------------------------------------
+
+
+def principled_material(name, color, metallic, roughness):
+    """Return a shared Principled BSDF material with the given values."""
+    def build(mat):
+        mat.use_nodes = True
+        bsdf = mat.node_tree.nodes.get('Principled BSDF')
+        if bsdf:
+            bsdf.inputs['Base Color'].default_value = color
+            bsdf.inputs['Metallic'].default_value = metallic
+            bsdf.inputs['Roughness'].default_value = roughness
+
+    return get_material(
+        name, ('PRINCIPLED', tuple(color), metallic, roughness), build)
+
+
+def emission_material(name, color, strength):
+    """Return a shared emission-only material."""
+    def build(mat):
+        mat.use_nodes = True
+        nodes = mat.node_tree.nodes
+        emission = nodes.new(type='ShaderNodeEmission')
+        emission.inputs['Color'].default_value = color
+        emission.inputs['Strength'].default_value = strength
+        output = nodes.get('Material Output')
+        mat.node_tree.links.new(emission.outputs['Emission'],
+                                output.inputs['Surface'])
+
+    return get_material(name, ('EMISSION', tuple(color), strength), build)
+
+
+# ---------------------------------------------------------------------------
+# Blender registration stubs
+# ---------------------------------------------------------------------------
+
+
+def clear_registry():
+    """Forget cached names; existing materials are found again by key."""
+    _registry.clear()
+
+
+def register():
+    """Register this module"""
+    pass
+
+
+def unregister():
+    """Unregister this module"""
+    clear_registry()
@@ -6,6 +6,8 @@ Allows ships to have additional modules attached
 import bpy
 import random
 import math
+from . import ship_layout
+from . import material_registry
 
 
 # Module types
@@ -118,16 +120,7 @@ def create_module(module_type, scale=1.0, index=0, naming_prefix='',
 
     # Distribute modules in hull surface zones to avoid overlap.
     # Zone layout: alternate port/starboard sides along the hull length.
-    total = max(total_count, 1)
-    t = (index + 0.5) / total          # 0..1 fractional position along hull
-    fore_offset = 0.4                   # forward-most position (fraction of scale)
-    length_span = 0.8                   # total fore-aft spread (fraction of scale)
-    y_pos = scale * (fore_offset - t * length_span)  # spread fore-to-aft
-    side = 1 if index % 2 == 0 else -1
-    x_pos = side * scale * 0.35
-    z_pos = scale * 0.05  # slightly above centreline
-
-    position = (x_pos, y_pos, z_pos)
+    position = ship_layout.module_position(index, total_count, scale)
     
     # Create module based on shape
     if config['shape'] == 'box':
@@ -271,14 +264,8 @@ def add_shield_emitter(parent, scale, naming_prefix=''):
     emitter.parent = parent
     
     # Add glowing material
-    mat = bpy.data.materials.new(name="Shield_Emitter")
-    mat.use_nodes = True
-    nodes = mat.node_tree.nodes
-    emission = nodes.new(type='ShaderNodeEmission')
-    emission.inputs['Color'].default_value = (0.3, 0.5, 1.0, 1.0)  # Blue shield color
-    emission.inputs['Strength'].default_value = 2.0
-    output = nodes.get('Material Output')
-    mat.node_tree.links.new(emission.outputs['Emission'], output.inputs['Surface'])
+    mat = material_registry.emission_material(
+        "Shield_Emitter", (0.3, 0.5, 1.0, 1.0), 2.0)
     emitter.data.materials.append(mat)
 
 
@@ -0,0 +1,173 @@
+"""
+Content-addressed cache for batch-exported ships.
+
+A batch job's outputs (OBJ/MTL, GLB, Ship DNA and thumbnails, i.e.
+every file listed in its manifest entry) depend only on the job and on
+the generator code.  They are stored under a key that hashes:
+
+- the whole job: name, :func:`novaforge_importer.ship_to_generator_params`
+  output, texture options and export flags;
+- the add-on version;
+- the Blender version, since evaluated geometry, the normals API and the
+  OBJ header all depend on the Blender build;
+- a digest of the add-on's Python sources (tests excluded), so that
+  editing the generator without bumping the version still invalidates
+  old results.
+
+The cache is laid out as ``<root>/<key[:2]>/<key>/`` with the cached files
+plus an ``entry.json``.  A rerun restores unchanged ships from it
+instead of regenerating them; only dirty ships reach Blender.
+
+This module is a pure-Python reference implementation.  It does **not**
+depend on ``bpy``.
+"""
+
+import filecmp
+import hashlib
+import json
+import os
+import shutil
+
+# Cache directory created inside the batch output directory
+CACHE_DIR = ".cache"
+
+# Per-key metadata file
+ENTRY_NAME = "entry.json"
+
+# Manifest fields that hold output paths (rewritten on restore)
+_PATH_FIELDS = ('file', 'glb', 'dna', 'thumbnail')
+
+
+def source_digest(package_dir=None):
+    """Return a SHA-256 digest of the add-on's ``*.py`` sources.
+
+    ``test_*.py`` files are skipped: editing tests does not change outputs.
+    """
+    package_dir = package_dir or os.path.dirname(os.path.abspath(__file__))
+    digest = hashlib.sha256()
+    for filename in sorted(os.listdir(package_dir)):
+        if filename.endswith('.py') and not filename.startswith('test_'):
+            digest.update(filename.encode('utf-8'))
+            with open(os.path.join(package_dir, filename), 'rb') as fh:
+                digest.update(fh.read())
+    return digest.hexdigest()
+
+
+class OutputCache:
+    """Stores and restores batch outputs keyed by job content.
+
+    Usage::
+
+        cache = OutputCache(os.path.join(output_dir, CACHE_DIR),
+                            version=bl_info['version'],
+                            blender_version=bpy.app.version)
+        key = cache.key(job)
+        entry = cache.restore(key, output_dir)   # None on a miss
+        if entry is None:
+            entry = batch_runner.run_job(job, output_dir)
+            cache.store(key, entry)
+    """
+
+    def __init__(self, root, version, package_dir=None,
+                 blender_version=None):
+        self.root = root
+        self.version = [
+            list(v) if isinstance(v, tuple) else v
+            for v in (version, blender_version)
+        ] + [source_digest(package_dir)]
+        self.hits = 0
+        self.misses = 0
+
+    def key(self, job):
+        """Return the cache key for *job* (its ``index`` is ignored)."""
+        payload = {
+            'job': {k: v for k, v in job.items() if k != 'index'},
+            'version': self.version,
+        }
+        text = json.dumps(payload, sort_keys=True, default=repr)
+        return hashlib.sha256(text.encode('utf-8')).hexdigest()
+
+    def _path(self, key):
+        return os.path.join(self.root, key[:2], key)
+
+    def restore(self, key, output_dir):
+        """Copy the cached outputs for *key* into *output_dir*.
+
+        Returns the cached manifest entry, with paths pointing into
+        *output_dir* and ``cached`` set, or None on a miss.
+        """
+        path = self._path(key)
+        try:
+            with open(os.path.join(path, ENTRY_NAME), 'r',
+                      encoding='utf-8') as fh:
+                entry = json.load(fh)
+        except (OSError, ValueError):
+            self.misses += 1
+            return None
+        if not all(os.path.isfile(os.path.join(path, name))
+                   for name in entry['files']):
+            self.misses += 1
+            return None
+
+        for name in entry['files']:
+            src = os.path.join(path, name)
+            dst = os.path.join(output_dir, name)
+            if not (os.path.isfile(dst) and filecmp.cmp(src, dst)):
+                shutil.copy2(src, dst)
+        for field in _PATH_FIELDS:
+            if entry.get(field):
+                entry[field] = os.path.join(output_dir, entry[field])
+        entry['files'] = [os.path.join(output_dir, name)
+                          for name in entry['files']]
+        entry['cached'] = True
+        entry['seconds'] = 0.0
+        self.hits += 1
+        return entry
+
+    def store(self, key, entry):
+        """Copy a successful entry's output files into the cache."""
+        if entry.get('status') != 'ok':
+            return
+        path = self._path(key)
+        staging = f"{path}.tmp{os.getpid()}"
+        shutil.rmtree(staging, ignore_errors=True)
+        os.makedirs(staging)
+
+        cached = {k: v for k, v in entry.items()
+                  if k not in ('index', 'worker', 'cached', 'resident_mb',
+                               'peak_mb')}
+        cached['files'] = [os.path.basename(f) for f in entry['files']]
+        for field in _PATH_FIELDS:
+            if cached.get(field):
+                cached[field] = os.path.basename(cached[field])
+        for src in entry['files']:
+            shutil.copy2(src, staging)
+        with open(os.path.join(staging, ENTRY_NAME), 'w',
+                  encoding='utf-8') as fh:
+            json.dump(cached, fh, indent=2)
+
+        # Publish atomically; a concurrent writer of the same key wins
+        shutil.rmtree(path, ignore_errors=True)
+        try:
+            os.replace(staging, path)
+        except OSError:
+            shutil.rmtree(staging, ignore_errors=True)
+
+    def stats(self):
+        """Return ``{'hits', 'misses'}`` counted by :meth:`restore`."""
+        return {'hits': self.hits, 'misses': self.misses}
+
+
+# ---------------------------------------------------------------------------
+# Blender registration stubs
+# ---------------------------------------------------------------------------
+
+
+def register():
+    """Register this module"""
+    pass
+
+
+def unregister():
+    """Unregister this module"""
+    pass
@@ -7,14 +7,22 @@ Implements the PowerFlowSystem from ENGINE_INTEGRATION.md §11:
 - A ship-wide capacitor stores excess generation.
 - When the capacitor is empty, non-essential systems (shields, weapons)
   are disabled.
-- Power flows only through bricks connected to the spine.
+- Power flows only through bricks connected to the spine, or — with
+  ``routing='GRAPH'`` — only through electrical islands of face-adjacent
+  REACTOR_CORE / POWER_BUS bricks, each with its own capacitor share.
 
 This module is a pure-Python reference implementation that works with
 Ship DNA brick lists and :class:`damage_system.ShipDamageState`.
 It does **not** depend on ``bpy`` so it can be tested outside Blender
-and ported to C++ for the Atlas engine.
+and ported to C++ for the Atlas engine.  :class:`PowerEngine` ticks many
+ships at once with NumPy arrays when NumPy is available.
 """
 
+try:
+    import numpy as np
+except ImportError:  # NumPy is only needed for PowerEngine
+    np = None
+
 # ---------------------------------------------------------------------------
 # Power generation / consumption per brick type (MW)
 # ---------------------------------------------------------------------------
@@ -72,6 +80,21 @@ ESSENTIAL_TYPES = frozenset([
     'DOCKING_CLAMP',
 ])
 
+# Brick types that carry power between bricks in graph routing
+CONDUCTOR_TYPES = frozenset([
+    'REACTOR_CORE',
+    'POWER_BUS',
+])
+
+# How ShipPowerState.from_damage_state decides which systems are powered
+POWER_ROUTING_MODES = ('SPINE', 'GRAPH')
+
+_NEIGHBOUR_OFFSETS = (
+    (1, 0, 0), (-1, 0, 0),
+    (0, 1, 0), (0, -1, 0),
+    (0, 0, 1), (0, 0, -1),
+)
+
 
 # ---------------------------------------------------------------------------
 # Power component (per-brick)
@@ -79,26 +102,58 @@ ESSENTIAL_TYPES = frozenset([
 
 
 class PowerComponent:
-    """Tracks power generation and consumption for a single brick."""
+    """Tracks power generation and consumption for a single brick.
+
+    Changing :attr:`active` or :attr:`connected` notifies the owning
+    :class:`ShipPowerState` so its running totals stay current.
+    """
 
-    __slots__ = ('brick_type', 'generation', 'consumption', 'active',
-                 'connected')
+    __slots__ = ('brick_type', 'generation', 'consumption', '_active',
+                 '_connected', '_owner', '_brick_id')
 
     def __init__(self, brick_type, connected=True):
         self.brick_type = brick_type
         self.generation = POWER_GENERATION.get(brick_type, 0.0)
         self.consumption = POWER_CONSUMPTION.get(brick_type, 0.0)
-        self.active = True
-        self.connected = connected
+        self._active = True
+        self._connected = connected
+        self._owner = None      # ShipPowerState holding this component
+        self._brick_id = None
+
+    @property
+    def active(self):
+        return self._active
+
+    @active.setter
+    def active(self, value):
+        self._set_flags(value, self._connected)
+
+    @property
+    def connected(self):
+        return self._connected
+
+    @connected.setter
+    def connected(self, value):
+        self._set_flags(self._active, value)
+
+    @property
+    def live(self):
+        """True if the component currently draws or supplies power."""
+        return bool(self._active and self._connected)
+
+    def _set_flags(self, active, connected):
+        was_live = self.live
+        self._active = active
+        self._connected = connected
+        if self._owner is not None and self.live != was_live:
+            self._owner._component_toggled(self, not was_live)
 
     @property
     def net_power(self):
         """Net power contribution (positive = generation, negative = draw)."""
-        if not self.connected:
+        if not self.live:
             return 0.0
-        gen = self.generation if self.active else 0.0
-        con = self.consumption if self.active else 0.0
-        return gen - con
+        return self.generation - self.consumption
 
     def __repr__(self):
         return (f"PowerComponent(type={self.brick_type}, "
@@ -106,12 +161,426 @@ class PowerComponent:
                 f"active={self.active})")
 
 
+class _ComponentMap(dict):
+    """``brick_id → PowerComponent`` dict that keeps its owner's running
+    totals in step as components are added, replaced or removed."""
+
+    __slots__ = ('_state',)
+
+    def __init__(self, state):
+        super().__init__()
+        self._state = state
+
+    def __setitem__(self, brick_id, comp):
+        old = self.get(brick_id)
+        if old is not None:
+            self._state._detach_component(old)
+        super().__setitem__(brick_id, comp)
+        self._state._attach_component(brick_id, comp)
+
+    def __delitem__(self, brick_id):
+        self._state._detach_component(self[brick_id])
+        super().__delitem__(brick_id)
+
+    _MISSING = object()
+
+    def pop(self, brick_id, default=_MISSING):
+        if brick_id in self:
+            comp = super().pop(brick_id)
+            self._state._detach_component(comp)
+            return comp
+        if default is self._MISSING:
+            raise KeyError(brick_id)
+        return default
+
+    def popitem(self):
+        brick_id, comp = super().popitem()
+        self._state._detach_component(comp)
+        return brick_id, comp
+
+    def setdefault(self, brick_id, comp=None):
+        if brick_id not in self:
+            self[brick_id] = comp
+        return self[brick_id]
+
+    def update(self, *args, **kwargs):
+        for brick_id, comp in dict(*args, **kwargs).items():
+            self[brick_id] = comp
+
+    def clear(self):
+        for comp in self.values():
+            self._state._detach_component(comp)
+        super().clear()
+
+    def __reduce__(self):
+        # A map only makes sense inside its owner, so a copy on its own is
+        # a plain dict; ShipPowerState.__setstate__ wraps it again.
+        return (dict, (dict(self),))
+
+
+# ---------------------------------------------------------------------------
+# Damage change feed helpers
+# ---------------------------------------------------------------------------
+
+
+def _feed_changes(feed, damage_state):
+    """Drain *feed* if it follows *damage_state*.
+
+    Returns the change dict, or None when the caller must resynchronise
+    from scratch (first sync, a different ship, or a snapshot restore).
+    """
+    if feed is None or feed.source is not damage_state:
+        return None
+    changes = feed.drain()
+    return None if changes['reset'] else changes
+
+
+def _follow(feed, damage_state):
+    """Return a change feed subscribed to *damage_state*, replacing
+    *feed* if it follows another ship.  None if the state has no feed."""
+    if feed is not None:
+        if feed.source is damage_state:
+            return feed
+        feed.source.unsubscribe_changes(feed)
+    subscribe = getattr(damage_state, 'subscribe_changes', None)
+    return subscribe() if subscribe is not None else None
+
+
+# ---------------------------------------------------------------------------
+# Running totals
+# ---------------------------------------------------------------------------
+
+
+class _PowerLedger:
+    """Running generation/consumption totals over live components.
+
+    Shared by :class:`ShipPowerState` (whole ship) and :class:`PowerIsland`
+    (one electrical island).
+    """
+
+    __slots__ = ()
+
+    def _reset_totals(self):
+        self._generation = 0.0
+        self._consumption = 0.0
+        self._live_count = 0
+        # Live non-essential components: the ones an empty capacitor disables
+        self._live_non_essential = set()
+
+    def _component_toggled(self, comp, live):
+        """Add (*live*) or subtract a component's contribution."""
+        if live:
+            self._generation += comp.generation
+            self._consumption += comp.consumption
+            self._live_count += 1
+            if comp.brick_type in NON_ESSENTIAL_TYPES:
+                self._live_non_essential.add(comp._brick_id)
+        else:
+            self._generation -= comp.generation
+            self._consumption -= comp.consumption
+            self._live_count -= 1
+            self._live_non_essential.discard(comp._brick_id)
+            if not self._live_count:
+                # Drop any floating-point residue once nothing is live
+                self._generation = 0.0
+                self._consumption = 0.0
+
+
+# ---------------------------------------------------------------------------
+# Power network (graph routing)
+# ---------------------------------------------------------------------------
+
+
+class PowerIsland(_PowerLedger):
+    """A face-connected group of conductor bricks and the systems they feed.
+
+    Island ids come from a per-network counter; an island keeps its id
+    for as long as it survives, and pieces split off it get new ids.
+    """
+
+    __slots__ = ('island_id', 'conductors', 'members', 'capacitor',
+                 'capacitor_max', 'disabled', '_generation', '_consumption',
+                 '_live_count', '_live_non_essential')
+
+    def __init__(self, island_id, conductors, capacitor_max, capacitor):
+        self.island_id = island_id
+        self.conductors = conductors  # set of REACTOR_CORE / POWER_BUS ids
+        self.members = set()          # attached non-conductor component ids
+        self.capacitor_max = capacitor_max
+        self.capacitor = capacitor
+        self.disabled = set()         # member ids disabled by this island
+        self._reset_totals()
+
+    @property
+    def net_power(self):
+        """Net power balance of the island (positive = surplus)."""
+        return self._generation - self._consumption
+
+    @property
+    def capacitor_fraction(self):
+        """Island capacitor charge as a fraction (0.0 – 1.0)."""
+        return self.capacitor / max(self.capacitor_max, 1.0)
+
+    def get_summary(self):
+        """Return a summary dict for this island."""
+        return {
+            'island_id': self.island_id,
+            'conductors': len(self.conductors),
+            'members': len(self.members),
+            'total_generation': self._generation,
+            'total_consumption': self._consumption,
+            'net_power': self.net_power,
+            'capacitor': round(self.capacitor, 2),
+            'capacitor_max': self.capacitor_max,
+            'disabled_systems': len(self.disabled),
+        }
+
+    def __repr__(self):
+        return (f"PowerIsland(id={self.island_id}, "
+                f"conductors={len(self.conductors)}, "
+                f"members={len(self.members)})")
+
+
+class PowerNetwork:
+    """Partitions a ship's power bricks into electrical islands.
+
+    Conductors (:data:`CONDUCTOR_TYPES`) that share a grid face form one
+    island.  Every other power component is fed by one island it touches
+    (the lowest-id one when it is first attached), or by none.  The ship
+    capacitor is spread evenly over the conductors, so each island's
+    capacitor is its share of the whole.
+
+    When conductors die, :meth:`remove_bricks` searches outwards from
+    their surviving neighbours in lock-step and stops as soon as those
+    searches meet, so the cost follows the size of the pieces that break
+    off rather than the size of the ship.
+    """
+
+    def __init__(self, cells, brick_types, capacitor_max):
+        self.cells = dict(cells)              # brick_id → grid cell
+        self.grid = {cell: bid for bid, cell in self.cells.items()}
+        self.brick_types = dict(brick_types)  # brick_id → brick type
+        self.islands = {}                     # island_id → PowerIsland
+        self.island_of = {}                   # brick_id → island_id
+        self._next_island_id = 0
+
+        conductors = [bid for bid, bt in self.brick_types.items()
+                      if bt in CONDUCTOR_TYPES]
+        self.capacitor_per_conductor = (capacitor_max / len(conductors)
+                                        if conductors else 0.0)
+        for group in self._flood(conductors):
+            share = self.capacitor_per_conductor * len(group)
+            self._add_island(group, share)
+        for bid in sorted(self.brick_types):
+            if bid not in self.island_of:
+                self._attach(bid)
+
+    @classmethod
+    def from_damage_state(cls, damage_state, brick_ids, capacitor_max):
+        """Build the network for *brick_ids* from a damage state's grid."""
+        cells = {bid: cell for cell, bid in damage_state.grid.items()
+                 if bid in brick_ids}
+        brick_types = {bid: damage_state.bricks[bid].brick_type
+                       for bid in cells}
+        return cls(cells, brick_types, capacitor_max)
+
+    # -- topology -----------------------------------------------------------
+
+    def _neighbours(self, brick_id):
+        return self._around(self.cells[brick_id])
+
+    def _around(self, cell):
+        x, y, z = cell
+        grid = self.grid
+        for dx, dy, dz in _NEIGHBOUR_OFFSETS:
+            nid = grid.get((x + dx, y + dy, z + dz))
+            if nid is not None:
+                yield nid
+
+    def _feeds(self, island_id, brick_id):
+        """True if *brick_id* touches a conductor of island *island_id*."""
+        return any(self.island_of.get(nid) == island_id
+                   and self.brick_types[nid] in CONDUCTOR_TYPES
+                   for nid in self._neighbours(brick_id))
+
+    def _flood(self, conductors):
+        """Group *conductors* into face-connected sets, lowest id first."""
+        remaining = set(conductors)
+        groups = []
+        for start in sorted(remaining):
+            if start not in remaining:
+                continue
+            remaining.discard(start)
+            group = {start}
+            stack = [start]
+            while stack:
+                for nid in self._neighbours(stack.pop()):
+                    if nid in remaining:
+                        remaining.discard(nid)
+                        group.add(nid)
+                        stack.append(nid)
+            groups.append(group)
+        return groups
+
+    def _split_off(self, frontier, conductors):
+        """Return the pieces of *conductors* cut off from the main body.
+
+        Runs one search per *frontier* conductor, expanding each by one
+        brick per round and merging searches that meet.  A search that
+        runs dry has mapped a detached piece; once a single search is
+        left, everything it has not yet reached belongs to it, so that
+        (usually largest) remainder is never walked.
+        """
+        parent = {}    # search → search it merged into
+        owner = {}     # conductor → search that reached it first
+        pieces = {}    # live search → conductors reached
+        stacks = {}    # live search → conductors still to expand
+        for start in sorted(frontier):
+            parent[start] = start
+            owner[start] = start
+            pieces[start] = [start]
+            stacks[start] = [start]
+
+        def find(search):
+            while parent[search] != search:
+                parent[search] = parent[parent[search]]
+                search = parent[search]
+            return search
+
+        detached = []
+        while len(stacks) > 1:
+            for search in list(stacks):
+                if len(stacks) <= 1:
+                    break
+                if search not in stacks:
+                    continue  # merged earlier this round
+                stack = stacks[search]
+                if not stack:
+                    detached.append(set(pieces.pop(search)))
+                    del stacks[search]
+                    continue
+                for nid in self._neighbours(stack.pop()):
+                    if nid not in conductors:
+                        continue
+                    other = owner.get(nid)
+                    if other is None:
+                        owner[nid] = search
+                        pieces[search].append(nid)
+                        stack.append(nid)
+                        continue
+                    other = find(other)
+                    if other != search:
+                        parent[other] = search
+                        pieces[search].extend(pieces.pop(other))
+                        stack.extend(stacks.pop(other))
+        return detached
+
+    def _add_island(self, conductors, capacitor_max, capacitor=None):
+        island = PowerIsland(self._next_island_id, conductors, capacitor_max,
+                             capacitor_max if capacitor is None else capacitor)
+        self._next_island_id += 1
+        self.islands[island.island_id] = island
+        for bid in conductors:
+            self.island_of[bid] = island.island_id
+        return island
+
+    def _attach(self, brick_id):
+        """Feed a non-conductor from the lowest-id adjacent island."""
+        island_ids = [self.island_of[nid]
+                      for nid in self._neighbours(brick_id)
+                      if self.brick_types[nid] in CONDUCTOR_TYPES]
+        if not island_ids:
+            return None
+        island = self.islands[min(island_ids)]
+        island.members.add(brick_id)
+        self.island_of[brick_id] = island.island_id
+        return island
+
+    # -- queries ------------------------------------------------------------
+
+    def island_for(self, brick_id):
+        """Return the :class:`PowerIsland` feeding *brick_id*, or None."""
+        island_id = self.island_of.get(brick_id)
+        return None if island_id is None else self.islands[island_id]
+
+    # -- damage -------------------------------------------------------------
+
+    def remove_bricks(self, brick_ids):
+        """Drop dead bricks and split every island that lost a conductor.
+
+        The largest surviving part of a damaged island keeps the island;
+        pieces cut off from it become new islands.  Charge is shared by
+        conductor count, so the share held by dead conductors is lost.
+
+        Returns ``[(brick_id, old_island, new_island_or_None), ...]`` for
+        every surviving brick whose island changed, so the caller can move
+        its contribution between the islands' running totals.
+        """
+        dead_cells = {}  # island_id → cells of its dead conductors
+        sizes = {}       # island_id → conductor count before the damage
+        for bid in brick_ids:
+            cell = self.cells.pop(bid, None)
+            if cell is None:
+                continue
+            del self.grid[cell]
+            brick_type = self.brick_types.pop(bid)
+            island = self.island_for(bid)
+            self.island_of.pop(bid, None)
+            if island is None:
+                continue
+            if brick_type in CONDUCTOR_TYPES:
+                if island.island_id not in dead_cells:
+                    dead_cells[island.island_id] = []
+                    sizes[island.island_id] = len(island.conductors)
+                dead_cells[island.island_id].append(cell)
+                island.conductors.discard(bid)
+            else:
+                island.members.discard(bid)
+                island.disabled.discard(bid)
+
+        moved = []
+        for island_id in sorted(dead_cells):
+            island = self.islands[island_id]
+            charge_per_conductor = island.capacitor / sizes[island_id]
+            near = set()
+            for cell in dead_cells[island_id]:
+                near.update(self._around(cell))
+            frontier = near & island.conductors
+
+            if len(frontier) > 1:
+                pieces = self._split_off(frontier, island.conductors)
+            else:
+                pieces = []
+            for group in pieces:
+                island.conductors -= group
+                piece = self._add_island(
+                    group, self.capacitor_per_conductor * len(group),
+                    charge_per_conductor * len(group))
+                moved.extend((bid, island, piece) for bid in sorted(group))
+                for bid in group:
+                    near.update(self._neighbours(bid))
+
+            count = len(island.conductors)
+            island.capacitor_max = self.capacitor_per_conductor * count
+            island.capacitor = charge_per_conductor * count
+            if not count:
+                del self.islands[island_id]
+
+            # Re-home members that lost every conductor of their island
+            for bid in sorted(near & island.members):
+                if not count or not self._feeds(island_id, bid):
+                    island.members.discard(bid)
+                    del self.island_of[bid]
+                    moved.append((bid, island, self._attach(bid)))
+        return moved
+
+
 # ---------------------------------------------------------------------------
 # Ship power state
 # ---------------------------------------------------------------------------
 
 
-class ShipPowerState:
+class ShipPowerState(_PowerLedger):
     """Manages power flow for an entire ship.
 
     Initialise from a Ship DNA dict::
@@ -121,14 +590,79 @@ class ShipPowerState:
     Then call :meth:`tick` each frame with a ``dt`` value::
 
         events = power.tick(dt=1/60)
+
+    Generation and consumption are kept as running totals, updated as
+    components are added, removed or toggled, so queries and :meth:`tick`
+    cost O(changes) rather than O(components).
+
+    Built with ``from_damage_state(..., routing='GRAPH')`` the ship also
+    keeps a :class:`PowerNetwork`: each electrical island charges and
+    drains its own capacitor share, and only systems fed by an island are
+    powered.
     """
 
     def __init__(self, ship_class='CRUISER'):
         self.ship_class = ship_class
         self.capacitor_max = CAPACITOR_SIZE.get(ship_class, 1000.0)
         self.capacitor = self.capacitor_max
-        self.components = {}      # brick_id → PowerComponent
+        self.components = _ComponentMap(self)  # brick_id → PowerComponent
         self.disabled_ids = set()  # brick IDs whose systems are disabled
+        self.network = None        # PowerNetwork when routing == 'GRAPH'
+        self._damage_feed = None   # DamageChangeFeed of the synced ship
+        self._reset_totals()
+
+    # -- running totals -----------------------------------------------------
+
+    def _attach_component(self, brick_id, comp):
+        if comp._owner is not None and comp._owner is not self:
+            raise ValueError(
+                f"{comp!r} already belongs to another ShipPowerState")
+        comp._owner = self
+        comp._brick_id = brick_id
+        if comp.live:
+            self._component_toggled(comp, True)
+
+    def _detach_component(self, comp):
+        if comp.live:
+            self._component_toggled(comp, False)
+        comp._owner = None
+        comp._brick_id = None
+
+    def _component_toggled(self, comp, live):
+        super()._component_toggled(comp, live)
+        if self.network is not None:
+            island = self.network.island_for(comp._brick_id)
+            if island is not None:
+                island._component_toggled(comp, live)
+
+    # -- copy / pickle ------------------------------------------------------
+
+    _TOTALS = ('_generation', '_consumption', '_live_count',
+               '_live_non_essential')
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state['components'] = dict(self.components)
+        for name in self._TOTALS:
+            del state[name]
+        # The feed would drag its whole ShipDamageState along; a copy
+        # resynchronises in full on its first sync_with_damage_state.
+        state['_damage_feed'] = None
+        return state
+
+    def __setstate__(self, state):
+        components = state.pop('components')
+        self.__dict__.update(state)
+        self._reset_totals()
+        self.components = _ComponentMap(self)
+        # Islands restore their own totals, so only the ship ledger is
+        # rebuilt here (not _component_toggled, which would count twice).
+        for brick_id, comp in components.items():
+            dict.__setitem__(self.components, brick_id, comp)
+            comp._owner = self
+            comp._brick_id = brick_id
+            if comp.live:
+                _PowerLedger._component_toggled(self, comp, True)
 
     # -- construction -------------------------------------------------------
 
@@ -145,14 +679,31 @@ class ShipPowerState:
         return state
 
     @classmethod
-    def from_damage_state(cls, damage_state, ship_class='CRUISER'):
-        """Build from a :class:`damage_system.ShipDamageState`."""
+    def from_damage_state(cls, damage_state, ship_class='CRUISER',
+                          routing='SPINE'):
+        """Build from a :class:`damage_system.ShipDamageState`.
+
+        With ``routing='SPINE'`` a system is powered while its brick is
+        connected to the spine.  With ``routing='GRAPH'`` it is powered
+        while an electrical island feeds it (see :class:`PowerNetwork`).
+        """
+        if routing not in POWER_ROUTING_MODES:
+            raise ValueError(f"Unknown power routing mode: {routing}")
         state = cls(ship_class=ship_class)
-        for bid, brick in damage_state.bricks.items():
-            bt = brick.brick_type
-            if bt in POWER_GENERATION or bt in POWER_CONSUMPTION:
-                comp = PowerComponent(bt, connected=brick.connected_to_spine)
-                state.components[bid] = comp
+        power_ids = [bid for bid, brick in damage_state.bricks.items()
+                     if brick.brick_type in POWER_GENERATION
+                     or brick.brick_type in POWER_CONSUMPTION]
+        if routing == 'GRAPH':
+            state.network = PowerNetwork.from_damage_state(
+                damage_state, set(power_ids), state.capacitor_max)
+            state.capacitor = state._island_charge()
+        for bid in power_ids:
+            if state.network is not None:
+                connected = bid in state.network.island_of
+            else:
+                connected = damage_state.bricks[bid].connected_to_spine
+            state.components[bid] = PowerComponent(
+                damage_state.bricks[bid].brick_type, connected=connected)
         return state
 
     # -- queries ------------------------------------------------------------
@@ -160,14 +711,12 @@ class ShipPowerState:
     @property
     def total_generation(self):
         """Total active power generation (MW)."""
-        return sum(c.generation for c in self.components.values()
-                   if c.active and c.connected)
+        return self._generation
 
     @property
     def total_consumption(self):
         """Total active power consumption (MW)."""
-        return sum(c.consumption for c in self.components.values()
-                   if c.active and c.connected)
+        return self._consumption
 
     @property
     def net_power(self):
@@ -191,6 +740,9 @@ class ShipPowerState:
 
         Returns a list of event tuples describing state changes.
         """
+        if self.network is not None:
+            return self._tick_islands(dt)
+
         events = []
 
         # Calculate net power
@@ -200,30 +752,83 @@ class ShipPowerState:
 
         # Disable non-essentials when capacitor is empty
         if self.capacitor <= 0:
-            for bid, comp in self.components.items():
-                if (comp.brick_type in NON_ESSENTIAL_TYPES
-                        and comp.active and comp.connected):
-                    comp.active = False
-                    self.disabled_ids.add(bid)
-                    events.append(('system_disabled', bid, comp.brick_type))
+            self._disable_systems(self._live_non_essential, events)
 
         # Re-enable non-essentials when capacitor is above 20 %
-        elif self.capacitor_fraction > 0.2:
-            for bid in list(self.disabled_ids):
-                comp = self.components.get(bid)
-                if comp is not None and not comp.active:
-                    comp.active = True
-                    events.append(('system_enabled', bid, comp.brick_type))
+        elif self.disabled_ids and self.capacitor_fraction > 0.2:
+            self._enable_systems(self.disabled_ids, events)
             self.disabled_ids.clear()
 
         return events
 
+    def _tick_islands(self, dt):
+        """Graph-routing tick: every island runs its own capacitor."""
+        events = []
+        islands = self.network.islands
+        for island_id in sorted(islands):
+            island = islands[island_id]
+            island.capacitor += island.net_power * dt
+            island.capacitor = max(0.0, min(island.capacitor,
+                                            island.capacitor_max))
+
+            if island.capacitor <= 0:
+                if island._live_non_essential:
+                    disabled = set(island._live_non_essential)
+                    self._disable_systems(disabled, events)
+                    island.disabled |= disabled
+            elif island.disabled and island.capacitor_fraction > 0.2:
+                self._enable_systems(island.disabled, events)
+                self.disabled_ids -= island.disabled
+                island.disabled.clear()
+
+        self.capacitor = self._island_charge()
+        return events
+
+    def _disable_systems(self, brick_ids, events):
+        for bid in sorted(brick_ids):
+            comp = self.components[bid]
+            comp.active = False
+            self.disabled_ids.add(bid)
+            events.append(('system_disabled', bid, comp.brick_type))
+
+    def _enable_systems(self, brick_ids, events):
+        for bid in sorted(brick_ids):
+            comp = self.components.get(bid)
+            if comp is not None and not comp.active:
+                comp.active = True
+                events.append(('system_enabled', bid, comp.brick_type))
+
+    def _island_charge(self):
+        return sum(island.capacitor
+                   for island in self.network.islands.values())
+
     # -- mutation -----------------------------------------------------------
 
     def remove_brick(self, brick_id):
         """Remove a brick from the power simulation (e.g. after destruction)."""
-        self.components.pop(brick_id, None)
-        self.disabled_ids.discard(brick_id)
+        self.remove_bricks((brick_id,))
+
+    def remove_bricks(self, brick_ids):
+        """Remove several bricks at once, splitting power islands once."""
+        for bid in brick_ids:
+            self.components.pop(bid, None)
+            self.disabled_ids.discard(bid)
+        if self.network is None:
+            return
+
+        for bid, old, new in self.network.remove_bricks(brick_ids):
+            comp = self.components[bid]
+            if comp.live:
+                old._component_toggled(comp, False)
+            if bid in old.disabled:
+                old.disabled.discard(bid)
+                if new is not None:
+                    new.disabled.add(bid)
+            if new is None:
+                comp.connected = False
+            elif comp.live:
+                new._component_toggled(comp, True)
+        self.capacitor = self._island_charge()
 
     def set_connected(self, brick_id, connected):
         """Update the connectivity flag for a brick."""
@@ -233,22 +838,54 @@ class ShipPowerState:
 
     def sync_with_damage_state(self, damage_state):
         """Synchronise power connectivity from a
-        :class:`damage_system.ShipDamageState`."""
+        :class:`damage_system.ShipDamageState`.
+
+        The first call scans every component and subscribes to the ship's
+        change feed; later calls only apply the destroyed / detached ids
+        and connectivity flips published since, so they cost O(changes).
+        """
+        changes = _feed_changes(self._damage_feed, damage_state)
+        if changes is None:
+            self._full_sync(damage_state)
+            self._damage_feed = _follow(self._damage_feed, damage_state)
+            return
+
+        gone = [bid for bid in changes['destroyed'] + changes['detached']
+                if bid in self.components]
+        if gone:
+            self.remove_bricks(gone)
+        if self.network is not None:
+            return
+        for bid, connected in changes['connectivity']:
+            comp = self.components.get(bid)
+            if comp is not None:
+                comp.connected = connected
+
+    def _full_sync(self, damage_state):
         # Remove destroyed bricks
         dead_ids = [bid for bid in self.components
                     if bid not in damage_state.bricks]
-        for bid in dead_ids:
-            self.remove_brick(bid)
+        if dead_ids:
+            self.remove_bricks(dead_ids)
 
-        # Update connectivity
+        # Update connectivity; graph routing owns it through the network
+        if self.network is not None:
+            return
         for bid, comp in self.components.items():
             brick = damage_state.bricks.get(bid)
             if brick is not None:
                 comp.connected = brick.connected_to_spine
 
+    def get_island_summaries(self):
+        """Return one summary dict per electrical island (graph routing)."""
+        if self.network is None:
+            return []
+        islands = self.network.islands
+        return [islands[i].get_summary() for i in sorted(islands)]
+
     def get_power_summary(self):
         """Return a summary dict of the current power state."""
-        return {
+        summary = {
             'total_generation': self.total_generation,
             'total_consumption': self.total_consumption,
             'net_power': self.net_power,
@@ -258,6 +895,376 @@ class ShipPowerState:
             'power_stable': self.power_stable,
             'disabled_systems': len(self.disabled_ids),
         }
+        if self.network is not None:
+            summary['power_islands'] = len(self.network.islands)
+        return summary
+
+
+# ---------------------------------------------------------------------------
+# Array-backed multi-ship engine
+# ---------------------------------------------------------------------------
+
+
+class PowerEngine:
+    """Advances the power state of many ships in one vectorised pass.
+
+    Ships are adopted from spine-routed :class:`ShipPowerState` objects::
+
+        engine = PowerEngine()
+        for ship_id, state in enumerate(power_states):
+            engine.add_ship(state, ship_id=ship_id)
+        events = engine.tick(dt=1/60)   # {ship_id: [event, ...]}
+
+    Per-ship generation, consumption and capacitor values and
+    per-component active / connected / disabled masks live in NumPy
+    arrays, with each ship's components in one contiguous block ordered by
+    brick id.  :meth:`tick` charges and clamps every capacitor at once and
+    only touches component masks for ships that cross the empty or 20 %
+    thresholds.  Events are the same ``('system_disabled', brick_id,
+    brick_type)`` / ``('system_enabled', ...)`` tuples, in the same order,
+    as :meth:`ShipPowerState.tick`.  Requires NumPy.
+    """
+
+    _INITIAL_CAPACITY = 64
+
+    _SHIP_FIELDS = (
+        ('_capacitor', 'float64'),
+        ('_capacitor_max', 'float64'),
+        ('_generation', 'float64'),
+        ('_consumption', 'float64'),
+        ('_disabled_count', 'int64'),
+        ('_ship_alive', 'bool'),
+    )
+
+    _COMPONENT_FIELDS = (
+        ('_comp_ship', 'intp'),
+        ('_comp_brick', 'int64'),
+        ('_comp_gen', 'float64'),
+        ('_comp_con', 'float64'),
+        ('_comp_type', 'int16'),
+        ('_active', 'bool'),
+        ('_connected', 'bool'),
+        ('_present', 'bool'),
+        ('_non_essential', 'bool'),
+        ('_disabled', 'bool'),
+    )
+
+    def __init__(self):
+        if np is None:
+            raise ImportError("PowerEngine requires NumPy")
+        self._ship_capacity = 0
+        self._comp_capacity = 0
+        self._resize(self._SHIP_FIELDS, '_ship_capacity',
+                     self._INITIAL_CAPACITY)
+        self._resize(self._COMPONENT_FIELDS, '_comp_capacity',
+                     self._INITIAL_CAPACITY)
+        self._ship_count = 0          # ship rows in use
+        self._comp_count = 0          # component rows in use
+        self._dead_rows = 0           # component rows of removed ships
+        self._ship_rows = {}          # ship_id → ship row
+        self._row_ships = []          # ship row → ship_id
+        self._comp_rows = {}          # ship_id → {brick_id: component row}
+        self._type_names = []         # type code → brick type
+        self._type_codes = {}         # brick type → type code
+        self._next_ship_id = 0
+        self._damage_feeds = {}       # ship_id → DamageChangeFeed
+
+    # -- storage ------------------------------------------------------------
+
+    def _resize(self, fields, capacity_attr, capacity):
+        """Grow every array in *fields* to *capacity* entries."""
+        old = getattr(self, capacity_attr)
+        for name, dtype in fields:
+            grown = np.zeros(capacity, dtype=dtype)
+            if old:
+                grown[:old] = getattr(self, name)
+            setattr(self, name, grown)
+        setattr(self, capacity_attr, capacity)
+
+    def _type_code(self, brick_type):
+        code = self._type_codes.get(brick_type)
+        if code is None:
+            code = self._type_codes[brick_type] = len(self._type_names)
+            self._type_names.append(brick_type)
+        return code
+
+    # -- ship management ----------------------------------------------------
+
+    def add_ship(self, state, ship_id=None):
+        """Adopt a :class:`ShipPowerState` and return its ship id.
+
+        The engine copies the state; later changes go through the engine's
+        own :meth:`set_connected`, :meth:`remove_brick` and
+        :meth:`sync_with_damage_state`.
+        """
+        if state.network is not None:
+            raise ValueError("PowerEngine only supports SPINE power routing")
+        if ship_id is None:
+            ship_id = self._next_ship_id
+        if ship_id in self._ship_rows:
+            raise ValueError(f"Ship id already in use: {ship_id}")
+        if isinstance(ship_id, int):
+            self._next_ship_id = max(self._next_ship_id, ship_id + 1)
+
+        row = self._ship_count
+        if row >= self._ship_capacity:
+            self._resize(self._SHIP_FIELDS, '_ship_capacity',
+                         self._ship_capacity * 2)
+        self._ship_count += 1
+        self._ship_rows[ship_id] = row
+        self._row_ships.append(ship_id)
+        self._capacitor[row] = state.capacitor
+        self._capacitor_max[row] = state.capacitor_max
+        self._generation[row] = state.total_generation
+        self._consumption[row] = state.total_consumption
+        self._ship_alive[row] = True
+
+        brick_ids = sorted(state.components)
+        start = self._comp_count
+        end = start + len(brick_ids)
+        if end > self._comp_capacity:
+            self._resize(self._COMPONENT_FIELDS, '_comp_capacity',
+                         max(self._comp_capacity * 2, end))
+        rows = {}
+        for offset, bid in enumerate(brick_ids):
+            comp = state.components[bid]
+            i = start + offset
+            rows[bid] = i
+            self._comp_ship[i] = row
+            self._comp_brick[i] = bid
+            self._comp_gen[i] = comp.generation
+            self._comp_con[i] = comp.consumption
+            self._comp_type[i] = self._type_code(comp.brick_type)
+            self._active[i] = comp.active
+            self._connected[i] = comp.connected
+            self._present[i] = True
+            self._non_essential[i] = comp.brick_type in NON_ESSENTIAL_TYPES
+            self._disabled[i] = bid in state.disabled_ids
+        self._comp_rows[ship_id] = rows
+        self._comp_count = end
+        self._disabled_count[row] = int(self._disabled[start:end].sum())
+        return ship_id
+
+    def remove_ship(self, ship_id):
+        """Drop a ship; its rows are reclaimed by the next compaction."""
+        row = self._ship_rows.pop(ship_id, None)
+        if row is None:
+            return
+        rows = self._comp_rows.pop(ship_id)
+        feed = self._damage_feeds.pop(ship_id, None)
+        if feed is not None:
+            feed.source.unsubscribe_changes(feed)
+        if rows:
+            idx = np.fromiter(rows.values(), dtype=np.intp, count=len(rows))
+            self._present[idx] = False
+            self._disabled[idx] = False
+        self._ship_alive[row] = False
+        self._row_ships[row] = None
+        self._dead_rows += len(rows)
+        self._maybe_compact()
+
+    def _maybe_compact(self):
+        if self._dead_rows * 2 > self._comp_count:
+            self._compact()
+
+    def _compact(self):
+        """Rebuild the arrays without removed ships and bricks."""
+        n = self._ship_count
+        m = self._comp_count
+        keep_ships = np.flatnonzero(self._ship_alive[:n])
+        keep = np.flatnonzero(self._present[:m])
+        new_row = np.full(max(n, 1), -1, dtype=np.intp)
+        new_row[keep_ships] = np.arange(len(keep_ships))
+
+        for name, _ in self._SHIP_FIELDS:
+            array = getattr(self, name)
+            array[:len(keep_ships)] = array[keep_ships]
+        self._ship_alive[len(keep_ships):n] = False
+        for name, _ in self._COMPONENT_FIELDS:
+            array = getattr(self, name)
+            array[:len(keep)] = array[keep]
+        self._present[len(keep):m] = False
+        self._comp_ship[:len(keep)] = new_row[self._comp_ship[:len(keep)]]
+
+        self._row_ships = [self._row_ships[r] for r in keep_ships]
+        self._ship_rows = {sid: r for r, sid in enumerate(self._row_ships)}
+        self._ship_count = len(keep_ships)
+        self._comp_count = len(keep)
+
+        self._comp_rows = {sid: {} for sid in self._row_ships}
+        bricks = self._comp_brick[:len(keep)].tolist()
+        ships = self._comp_ship[:len(keep)].tolist()
+        for i, (ship_row, bid) in enumerate(zip(ships, bricks)):
+            self._comp_rows[self._row_ships[ship_row]][bid] = i
+        self._dead_rows = 0
+
+    @property
+    def ship_count(self):
+        return len(self._ship_rows)
+
+    # -- per-ship mutation --------------------------------------------------
+
+    def _live(self, i):
+        return self._active[i] and self._connected[i] and self._present[i]
+
+    def _add_totals(self, i, sign):
+        row = self._comp_ship[i]
+        self._generation[row] += sign * self._comp_gen[i]
+        self._consumption[row] += sign * self._comp_con[i]
+
+    def set_connected(self, ship_id, brick_id, connected):
+        """Update the connectivity flag for one brick of a ship."""
+        i = self._comp_rows[ship_id].get(brick_id)
+        if i is None:
+            return
+        was_live = self._live(i)
+        self._connected[i] = connected
+        if self._live(i) != was_live:
+            self._add_totals(i, 1.0 if connected else -1.0)
+
+    def remove_brick(self, ship_id, brick_id):
+        """Remove a destroyed brick from a ship's power simulation."""
+        i = self._comp_rows[ship_id].pop(brick_id, None)
+        if i is None:
+            return
+        if self._live(i):
+            self._add_totals(i, -1.0)
+        self._present[i] = False
+        if self._disabled[i]:
+            self._disabled[i] = False
+            self._disabled_count[self._comp_ship[i]] -= 1
+        self._dead_rows += 1
+        self._maybe_compact()
+
+    def sync_with_damage_state(self, ship_id, damage_state):
+        """Synchronise one ship from a
+        :class:`damage_system.ShipDamageState`.
+
+        Like :meth:`ShipPowerState.sync_with_damage_state`, only the first
+        call scans the ship; later calls consume its change feed.
+        """
+        feed = self._damage_feeds.get(ship_id)
+        changes = _feed_changes(feed, damage_state)
+        if changes is None:
+            self._full_sync(ship_id, damage_state)
+            self._damage_feeds[ship_id] = _follow(feed, damage_state)
+            return
+
+        for bid in changes['destroyed'] + changes['detached']:
+            self.remove_brick(ship_id, bid)
+        for bid, connected in changes['connectivity']:
+            self.set_connected(ship_id, bid, connected)
+
+    def _full_sync(self, ship_id, damage_state):
+        bricks = damage_state.bricks
+        for bid in list(self._comp_rows[ship_id]):
+            brick = bricks.get(bid)
+            if brick is None:
+                self.remove_brick(ship_id, bid)
+            else:
+                self.set_connected(ship_id, bid, brick.connected_to_spine)
+
+    # -- tick ---------------------------------------------------------------
+
+    def tick(self, dt=1.0):
+        """Advance every ship by *dt* seconds.
+
+        Returns ``{ship_id: [event, ...]}`` for ships that produced events.
+        """
+        n = self._ship_count
+        cap = self._capacitor[:n]
+        cap_max = self._capacitor_max[:n]
+        cap += (self._generation[:n] - self._consumption[:n]) * dt
+        np.minimum(cap, cap_max, out=cap)
+        np.maximum(cap, 0.0, out=cap)
+
+        alive = self._ship_alive[:n]
+        empty = alive & (cap <= 0)
+        refill = (alive & ~empty & (self._disabled_count[:n] > 0)
+                  & (cap / np.maximum(cap_max, 1.0) > 0.2))
+
+        events = {}
+        if empty.any():
+            self._disable_systems(empty, events)
+        if refill.any():
+            self._enable_systems(refill, events)
+        return {sid: events[sid] for sid in sorted(events, key=self._order)}
+
+    def _order(self, ship_id):
+        return self._ship_rows[ship_id]
+
+    def _disable_systems(self, empty, events):
+        m = self._comp_count
+        ships = self._comp_ship[:m]
+        rows = np.flatnonzero(empty[ships] & self._non_essential[:m]
+                              & self._active[:m] & self._connected[:m]
+                              & self._present[:m])
+        if not len(rows):
+            return
+        np.subtract.at(self._generation, ships[rows], self._comp_gen[rows])
+        np.subtract.at(self._consumption, ships[rows], self._comp_con[rows])
+        self._active[rows] = False
+        newly = rows[~self._disabled[rows]]
+        np.add.at(self._disabled_count, ships[newly], 1)
+        self._disabled[rows] = True
+        self._emit('system_disabled', rows, events)
+
+    def _enable_systems(self, refill, events):
+        m = self._comp_count
+        ships = self._comp_ship[:m]
+        rows = np.flatnonzero(refill[ships] & self._disabled[:m])
+        self._disabled[rows] = False
+        self._disabled_count[:self._ship_count][refill] = 0
+        rows = rows[~self._active[rows]]
+        if not len(rows):
+            return
+        self._active[rows] = True
+        live = rows[self._connected[rows]]
+        np.add.at(self._generation, ships[live], self._comp_gen[live])
+        np.add.at(self._consumption, ships[live], self._comp_con[live])
+        self._emit('system_enabled', rows, events)
+
+    def _emit(self, kind, rows, events):
+        names = self._type_names
+        row_ships = self._row_ships
+        for ship_row, bid, code in zip(self._comp_ship[rows].tolist(),
+                                       self._comp_brick[rows].tolist(),
+                                       self._comp_type[rows].tolist()):
+            events.setdefault(row_ships[ship_row], []).append(
+                (kind, bid, names[code]))
+
+    # -- queries ------------------------------------------------------------
+
+    def array_view(self, field):
+        """Return a live view of one per-ship array (``'capacitor'``,
+        ``'capacitor_max'``, ``'generation'``, ``'consumption'``) trimmed
+        to the ship rows in use; :meth:`ship_rows` maps rows to ids."""
+        return getattr(self, '_' + field)[:self._ship_count]
+
+    def ship_rows(self):
+        """Return the ship id for every array row (None for removed)."""
+        return list(self._row_ships)
+
+    def get_power_summary(self, ship_id):
+        """Return the same summary dict as
+        :meth:`ShipPowerState.get_power_summary` for one ship."""
+        row = self._ship_rows[ship_id]
+        generation = float(self._generation[row])
+        consumption = float(self._consumption[row])
+        capacitor = float(self._capacitor[row])
+        capacitor_max = float(self._capacitor_max[row])
+        net = generation - consumption
+        return {
+            'total_generation': generation,
+            'total_consumption': consumption,
+            'net_power': net,
+            'capacitor': round(capacitor, 2),
+            'capacitor_max': capacitor_max,
+            'capacitor_fraction': round(
+                capacitor / max(capacitor_max, 1.0), 4),
+            'power_stable': net >= 0,
+            'disabled_systems': int(self._disabled_count[row]),
+        }
 
 
 # ---------------------------------------------------------------------------
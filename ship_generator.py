@@ -15,182 +15,19 @@ Generation pipeline (spine-first ordered assembly):
 import bpy
 import math
 import random
+import numpy as np
 from . import ship_parts
 from . import interior_generator
 from . import module_system
 from . import brick_system
 from . import novaforge_importer
+from . import ship_layout
 
 
-# Maximum number of turret hardpoints any ship may have
-MAX_TURRET_HARDPOINTS = 10
-
-
-# Ship class configurations (NovaForge classes only)
-SHIP_CONFIGS = {
-    'SHUTTLE': {
-        'scale': 1.0,
-        'hull_segments': 3,
-        'engines': 2,
-        'weapons': 0,
-        'turret_hardpoints': 0,
-        'wings': False,
-        'crew_capacity': 2,
-    },
-    'FIGHTER': {
-        'scale': 1.5,
-        'hull_segments': 4,
-        'engines': 2,
-        'weapons': 2,
-        'turret_hardpoints': 1,
-        'wings': True,
-        'crew_capacity': 1,
-    },
-    'CORVETTE': {
-        'scale': 3.0,
-        'hull_segments': 5,
-        'engines': 3,
-        'weapons': 4,
-        'turret_hardpoints': 2,
-        'wings': True,
-        'crew_capacity': 4,
-    },
-    'FRIGATE': {
-        'scale': 5.0,
-        'hull_segments': 6,
-        'engines': 4,
-        'weapons': 6,
-        'turret_hardpoints': 3,
-        'wings': False,
-        'crew_capacity': 10,
-    },
-    'DESTROYER': {
-        'scale': 8.0,
-        'hull_segments': 7,
-        'engines': 4,
-        'weapons': 8,
-        'turret_hardpoints': 4,
-        'wings': False,
-        'crew_capacity': 25,
-    },
-    'CRUISER': {
-        'scale': 12.0,
-        'hull_segments': 8,
-        'engines': 6,
-        'weapons': 12,
-        'turret_hardpoints': 6,
-        'wings': False,
-        'crew_capacity': 50,
-    },
-    'BATTLECRUISER': {
-        'scale': 15.0,
-        'hull_segments': 9,
-        'engines': 6,
-        'weapons': 14,
-        'turret_hardpoints': 7,
-        'wings': False,
-        'crew_capacity': 75,
-    },
-    'BATTLESHIP': {
-        'scale': 18.0,
-        'hull_segments': 10,
-        'engines': 8,
-        'weapons': 16,
-        'turret_hardpoints': 8,
-        'wings': False,
-        'crew_capacity': 100,
-    },
-    'CARRIER': {
-        'scale': 25.0,
-        'hull_segments': 12,
-        'engines': 10,
-        'weapons': 10,
-        'turret_hardpoints': 6,
-        'wings': False,
-        'crew_capacity': 200,
-    },
-    'DREADNOUGHT': {
-        'scale': 30.0,
-        'hull_segments': 14,
-        'engines': 5,
-        'weapons': 18,
-        'turret_hardpoints': 10,
-        'wings': False,
-        'crew_capacity': 400,
-    },
-    'TITAN': {
-        'scale': 50.0,
-        'hull_segments': 18,
-        'engines': 10,
-        'weapons': 24,
-        'turret_hardpoints': 10,
-        'wings': False,
-        'crew_capacity': 1000,
-    },
-    'INDUSTRIAL': {
-        'scale': 6.0,
-        'hull_segments': 5,
-        'engines': 3,
-        'weapons': 1,
-        'turret_hardpoints': 0,
-        'wings': False,
-        'crew_capacity': 5,
-    },
-    'MINING_BARGE': {
-        'scale': 4.0,
-        'hull_segments': 4,
-        'engines': 2,
-        'weapons': 0,
-        'turret_hardpoints': 0,
-        'wings': False,
-        'crew_capacity': 3,
-    },
-    'EXHUMER': {
-        'scale': 5.0,
-        'hull_segments': 5,
-        'engines': 3,
-        'weapons': 0,
-        'turret_hardpoints': 0,
-        'wings': False,
-        'crew_capacity': 4,
-    },
-    'CAPITAL': {
-        'scale': 35.0,
-        'hull_segments': 15,
-        'engines': 12,
-        'weapons': 20,
-        'turret_hardpoints': 10,
-        'wings': False,
-        'crew_capacity': 500,
-    },
-    'EXPLORER': {
-        'scale': 2.0,
-        'hull_segments': 5,
-        'engines': 2,
-        'weapons': 1,
-        'turret_hardpoints': 1,
-        'wings': True,
-        'crew_capacity': 1,
-    },
-    'HAULER': {
-        'scale': 5.5,
-        'hull_segments': 6,
-        'engines': 4,
-        'weapons': 0,
-        'turret_hardpoints': 0,
-        'wings': False,
-        'crew_capacity': 2,
-    },
-    'EXOTIC': {
-        'scale': 2.5,
-        'hull_segments': 7,
-        'engines': 2,
-        'weapons': 2,
-        'turret_hardpoints': 1,
-        'wings': True,
-        'crew_capacity': 1,
-    },
-}
+# Ship class configurations and the turret hardpoint cap are defined in
+# ship_layout so the headless layout pass reads the same table
+SHIP_CONFIGS = ship_layout.SHIP_CONFIGS
+MAX_TURRET_HARDPOINTS = ship_layout.MAX_TURRET_HARDPOINTS
 
 
 def _prefixed_name(prefix, name):
@@ -230,6 +67,10 @@ def generate_spaceship(ship_class='FRIGATE', seed=1, generate_interior=True,
         naming_prefix: Project naming prefix applied to all generated elements
         turret_hardpoints: Number of turret hardpoints to generate (0-10)
         hull_taper: Taper factor for hull silhouette shaping (0.5-1.0, 1.0=none)
+
+    Parts are positioned by the :mod:`ship_layout` placement helpers and
+    the Ship DNA comes from :func:`ship_layout.generate_ship_dna`, which
+    also returns it without building any geometry.
     """
     random.seed(seed)
 
@@ -238,9 +79,6 @@ def generate_spaceship(ship_class='FRIGATE', seed=1, generate_interior=True,
     scale = config['scale']
     grid_size = brick_system.get_grid_size(ship_class)
 
-    # Track placed bricks for Ship DNA export
-    placed_bricks = []
-
     # Create main collection for the ship
     collection_name = _prefixed_name(naming_prefix, f"Spaceship_{ship_class}_{seed}")
     collection = bpy.data.collections.new(collection_name)
@@ -260,7 +98,6 @@ def generate_spaceship(ship_class='FRIGATE', seed=1, generate_interior=True,
         seed=seed,
     )
     collection.objects.link(hull)
-    placed_bricks.append({'type': 'STRUCTURAL_SPINE', 'pos': [0, 0, 0]})
 
     # ------------------------------------------------------------------
     # Stage 2 – Cockpit / bridge
@@ -273,7 +110,6 @@ def generate_spaceship(ship_class='FRIGATE', seed=1, generate_interior=True,
         naming_prefix=naming_prefix
     )
     collection.objects.link(cockpit)
-    placed_bricks.append({'type': 'REACTOR_CORE', 'pos': [0, scale * 0.8, 0]})
 
     # ------------------------------------------------------------------
     # Stage 3 – Major structures (wings)
@@ -287,10 +123,6 @@ def generate_spaceship(ship_class='FRIGATE', seed=1, generate_interior=True,
         )
         for wing in wings:
             collection.objects.link(wing)
-            placed_bricks.append({
-                'type': 'HULL_PLATE',
-                'pos': list(wing.location),
-            })
 
         # Wing root fairings
         wing_roots = ship_parts.generate_wing_roots(
@@ -309,14 +141,8 @@ def generate_spaceship(ship_class='FRIGATE', seed=1, generate_interior=True,
         style=style,
         naming_prefix=naming_prefix
     )
-    for i, engine in enumerate(engines):
+    for engine in engines:
         collection.objects.link(engine)
-        archetype = brick_system.select_engine_archetype(i, len(engines))
-        placed_bricks.append({
-            'type': 'ENGINE_BLOCK',
-            'pos': list(engine.location),
-            'archetype': archetype,
-        })
 
     # ------------------------------------------------------------------
     # Stage 4b – Connecting geometry (pylons & fairings)
@@ -344,10 +170,6 @@ def generate_spaceship(ship_class='FRIGATE', seed=1, generate_interior=True,
         )
         for weapon in weapons:
             collection.objects.link(weapon)
-            placed_bricks.append({
-                'type': 'HARDPOINT_MOUNT',
-                'pos': list(weapon.location),
-            })
 
         # Weapon pylons
         weapon_pylons = ship_parts.generate_weapon_pylons(
@@ -366,10 +188,6 @@ def generate_spaceship(ship_class='FRIGATE', seed=1, generate_interior=True,
         )
         for turret in turrets:
             collection.objects.link(turret)
-            placed_bricks.append({
-                'type': 'HARDPOINT_MOUNT',
-                'pos': list(turret.location),
-            })
 
     # Launcher hardpoints
     if launcher_hardpoints > 0:
@@ -381,11 +199,6 @@ def generate_spaceship(ship_class='FRIGATE', seed=1, generate_interior=True,
         )
         for launcher in launchers:
             collection.objects.link(launcher)
-            placed_bricks.append({
-                'type': 'HARDPOINT_MOUNT',
-                'pos': list(launcher.location),
-                'subtype': 'launcher',
-            })
 
     # Drone bays
     if drone_bays > 0:
@@ -396,11 +209,6 @@ def generate_spaceship(ship_class='FRIGATE', seed=1, generate_interior=True,
         )
         for bay in drone_bay_objs:
             collection.objects.link(bay)
-            placed_bricks.append({
-                'type': 'DOCKING_CLAMP',
-                'pos': list(bay.location),
-                'subtype': 'drone_bay',
-            })
 
     # ------------------------------------------------------------------
     # Stage 6 – Detail modules
@@ -414,10 +222,6 @@ def generate_spaceship(ship_class='FRIGATE', seed=1, generate_interior=True,
         )
         for module in modules:
             collection.objects.link(module)
-            placed_bricks.append({
-                'type': 'CAPACITOR',
-                'pos': list(module.location),
-            })
 
     # ------------------------------------------------------------------
     # Stage 6b – Surface detail (greebles)
@@ -429,10 +233,6 @@ def generate_spaceship(ship_class='FRIGATE', seed=1, generate_interior=True,
     )
     for greeble in greebles:
         collection.objects.link(greeble)
-        placed_bricks.append({
-            'type': greeble.get('brick_type', 'PANEL'),
-            'pos': list(greeble.location),
-        })
 
     # ------------------------------------------------------------------
     # Stage 6c – Faction-specific details
@@ -476,13 +276,20 @@ def generate_spaceship(ship_class='FRIGATE', seed=1, generate_interior=True,
     # Center the ship at the 3D cursor
     hull.location = bpy.context.scene.cursor.location
 
-    # Store Ship DNA as a custom property on the hull
-    dna = brick_system.generate_ship_dna(
+    # Store Ship DNA as a custom property on the hull.  The parts above
+    # were placed by the same ship_layout helpers, so the layout pass is
+    # the single source of the brick list.
+    dna = ship_layout.generate_ship_dna(
         ship_class=ship_class,
         seed=seed,
-        bricks=placed_bricks,
+        module_slots=module_slots,
+        symmetry=symmetry,
         style=style,
         naming_prefix=naming_prefix,
+        turret_hardpoints=turret_hardpoints,
+        launcher_hardpoints=launcher_hardpoints,
+        drone_bays=drone_bays,
+        engine_count_override=engine_count_override,
     )
     hull["ship_dna"] = brick_system.ship_dna_to_json(dna)
 
@@ -495,7 +302,7 @@ def generate_spaceship(ship_class='FRIGATE', seed=1, generate_interior=True,
 
 
 # Greeble detail brick types and their associated shapes
-_GREEBLE_TYPES = ['PANEL', 'VENT', 'PIPE']
+_GREEBLE_TYPES = ship_layout.GREEBLE_TYPES
 
 
 def generate_greeble_details(hull, scale, count, seed, naming_prefix=''):
@@ -515,39 +322,29 @@ def generate_greeble_details(hull, scale, count, seed, naming_prefix=''):
     Returns:
         List of created greeble objects.
     """
-    rng = random.Random(seed + 99)  # offset to decouple from hull/engine seeds
     greebles = []
     detail_scale = scale * 0.04
 
-    half_w = scale * 0.4
-    half_l = scale * 0.8
-
-    for i in range(count):
-        brick_type = rng.choice(_GREEBLE_TYPES)
-        x_pos = rng.uniform(-half_w, half_w)
-        y_pos = rng.uniform(-half_l * 0.6, half_l * 0.5)
-        # Place on dorsal surface
-        z_pos = scale * 0.15
-
+    # Seeded separately (seed + 99) to decouple from hull/engine seeds
+    placements = ship_layout.greeble_placements(scale, count, seed)
+    for i, (brick_type, (x_pos, y_pos, z_pos)) in enumerate(placements):
+        name = _prefixed_name(naming_prefix, f"Greeble_{brick_type}_{i+1}")
+        location = (x_pos, y_pos, z_pos)
         if brick_type == 'PANEL':
-            bpy.ops.mesh.primitive_cube_add(
-                size=detail_scale,
-                location=(x_pos, y_pos, z_pos),
-            )
+            obj = ship_parts.add_cube(name, size=detail_scale,
+                                      location=location, shared=True)
         elif brick_type == 'VENT':
-            bpy.ops.mesh.primitive_cube_add(
-                size=detail_scale * 0.8,
-                location=(x_pos, y_pos, z_pos),
-            )
+            obj = ship_parts.add_cube(name, size=detail_scale * 0.8,
+                                      location=location, shared=True)
         else:  # PIPE
-            bpy.ops.mesh.primitive_cylinder_add(
+            obj = ship_parts.add_cylinder(
+                name,
                 radius=detail_scale * 0.15,
                 depth=detail_scale * 2,
-                location=(x_pos, y_pos, z_pos),
+                location=location,
+                shared=True,
             )
 
-        obj = bpy.context.active_object
-        obj.name = _prefixed_name(naming_prefix, f"Greeble_{brick_type}_{i+1}")
         obj["brick_type"] = brick_type
         greebles.append(obj)
 
@@ -570,22 +367,22 @@ def taper_hull(obj, axis='Y', factor=0.85):
 
     # Determine the extent along the taper axis
     axis_idx = {'X': 0, 'Y': 1, 'Z': 2}.get(axis, 1)
-    coords = [v.co[axis_idx] for v in mesh.vertices]
-    min_val = min(coords)
-    max_val = max(coords)
+    coords = ship_parts.get_vertex_array(mesh)
+    along = coords[:, axis_idx]
+    min_val = along.min()
+    max_val = along.max()
     span = max_val - min_val
     if span == 0:
         return
 
-    for v in mesh.vertices:
-        t = abs(v.co[axis_idx] - (min_val + max_val) / 2) / (span / 2)
-        scale = 1.0 - (1.0 - factor) * t
-        if axis_idx != 0:
-            v.co.x *= scale
-        if axis_idx != 2:
-            v.co.z *= scale
+    t = np.abs(along - (min_val + max_val) / 2) / (span / 2)
+    scale = 1.0 - (1.0 - factor) * t
+    if axis_idx != 0:
+        coords[:, 0] *= scale
+    if axis_idx != 2:
+        coords[:, 2] *= scale
 
-    mesh.update()
+    ship_parts.set_vertex_coords(mesh, coords)
 
 
 def apply_cleanup_pass(obj):
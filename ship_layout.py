@@ -0,0 +1,470 @@
+"""
+Headless ship layout pass.
+
+Computes a ship's brick layout — the ``placed_bricks`` list and Ship DNA
+that :func:`ship_generator.generate_spaceship` stores on the hull — without
+building any geometry:
+
+- The placement helpers below are the single source of truth for where
+  :mod:`ship_parts`, :mod:`module_system` and the greeble pass put their
+  objects, so the Blender and headless paths cannot drift apart.
+- :func:`plan_ship_layout` replays the generator's stages in the same
+  order and records the same bricks, including engine archetypes and
+  launcher / drone-bay subtypes.
+- :func:`generate_ship_dna` accepts the same keyword arguments as
+  ``generate_spaceship`` (e.g. the output of
+  :func:`novaforge_importer.ship_to_generator_params`) and returns the
+  identical DNA dict.
+
+Blender stores object locations in single precision, so positions taken
+from part objects are rounded to float32 here as well; the DNA JSON is
+byte-for-byte the one the Blender path writes.
+
+This module is a pure-Python reference implementation.  It does **not**
+depend on ``bpy`` so DNAs can be generated on content-pipeline servers.
+"""
+
+import random
+from array import array
+
+try:
+    from . import brick_system
+except ImportError:  # loaded outside the addon package (servers, CI)
+    import brick_system
+
+
+# Maximum number of turret hardpoints any ship may have
+MAX_TURRET_HARDPOINTS = 10
+
+# Greeble detail brick types, in the order the greeble RNG picks from
+GREEBLE_TYPES = ['PANEL', 'VENT', 'PIPE']
+
+# Offset added to the ship seed for the greeble RNG
+GREEBLE_SEED_OFFSET = 99
+
+# Ship class configurations (NovaForge classes only), re-exported by
+# ship_generator
+SHIP_CONFIGS = {
+    'SHUTTLE': {
+        'scale': 1.0,
+        'hull_segments': 3,
+        'engines': 2,
+        'weapons': 0,
+        'turret_hardpoints': 0,
+        'wings': False,
+        'crew_capacity': 2,
+    },
+    'FIGHTER': {
+        'scale': 1.5,
+        'hull_segments': 4,
+        'engines': 2,
+        'weapons': 2,
+        'turret_hardpoints': 1,
+        'wings': True,
+        'crew_capacity': 1,
+    },
+    'CORVETTE': {
+        'scale': 3.0,
+        'hull_segments': 5,
+        'engines': 3,
+        'weapons': 4,
+        'turret_hardpoints': 2,
+        'wings': True,
+        'crew_capacity': 4,
+    },
+    'FRIGATE': {
+        'scale': 5.0,
+        'hull_segments': 6,
+        'engines': 4,
+        'weapons': 6,
+        'turret_hardpoints': 3,
+        'wings': False,
+        'crew_capacity': 10,
+    },
+    'DESTROYER': {
+        'scale': 8.0,
+        'hull_segments': 7,
+        'engines': 4,
+        'weapons': 8,
+        'turret_hardpoints': 4,
+        'wings': False,
+        'crew_capacity': 25,
+    },
+    'CRUISER': {
+        'scale': 12.0,
+        'hull_segments': 8,
+        'engines': 6,
+        'weapons': 12,
+        'turret_hardpoints': 6,
+        'wings': False,
+        'crew_capacity': 50,
+    },
+    'BATTLECRUISER': {
+        'scale': 15.0,
+        'hull_segments': 9,
+        'engines': 6,
+        'weapons': 14,
+        'turret_hardpoints': 7,
+        'wings': False,
+        'crew_capacity': 75,
+    },
+    'BATTLESHIP': {
+        'scale': 18.0,
+        'hull_segments': 10,
+        'engines': 8,
+        'weapons': 16,
+        'turret_hardpoints': 8,
+        'wings': False,
+        'crew_capacity': 100,
+    },
+    'CARRIER': {
+        'scale': 25.0,
+        'hull_segments': 12,
+        'engines': 10,
+        'weapons': 10,
+        'turret_hardpoints': 6,
+        'wings': False,
+        'crew_capacity': 200,
+    },
+    'DREADNOUGHT': {
+        'scale': 30.0,
+        'hull_segments': 14,
+        'engines': 5,
+        'weapons': 18,
+        'turret_hardpoints': 10,
+        'wings': False,
+        'crew_capacity': 400,
+    },
+    'TITAN': {
+        'scale': 50.0,
+        'hull_segments': 18,
+        'engines': 10,
+        'weapons': 24,
+        'turret_hardpoints': 10,
+        'wings': False,
+        'crew_capacity': 1000,
+    },
+    'INDUSTRIAL': {
+        'scale': 6.0,
+        'hull_segments': 5,
+        'engines': 3,
+        'weapons': 1,
+        'turret_hardpoints': 0,
+        'wings': False,
+        'crew_capacity': 5,
+    },
+    'MINING_BARGE': {
+        'scale': 4.0,
+        'hull_segments': 4,
+        'engines': 2,
+        'weapons': 0,
+        'turret_hardpoints': 0,
+        'wings': False,
+        'crew_capacity': 3,
+    },
+    'EXHUMER': {
+        'scale': 5.0,
+        'hull_segments': 5,
+        'engines': 3,
+        'weapons': 0,
+        'turret_hardpoints': 0,
+        'wings': False,
+        'crew_capacity': 4,
+    },
+    'CAPITAL': {
+        'scale': 35.0,
+        'hull_segments': 15,
+        'engines': 12,
+        'weapons': 20,
+        'turret_hardpoints': 10,
+        'wings': False,
+        'crew_capacity': 500,
+    },
+    'EXPLORER': {
+        'scale': 2.0,
+        'hull_segments': 5,
+        'engines': 2,
+        'weapons': 1,
+        'turret_hardpoints': 1,
+        'wings': True,
+        'crew_capacity': 1,
+    },
+    'HAULER': {
+        'scale': 5.5,
+        'hull_segments': 6,
+        'engines': 4,
+        'weapons': 0,
+        'turret_hardpoints': 0,
+        'wings': False,
+        'crew_capacity': 2,
+    },
+    'EXOTIC': {
+        'scale': 2.5,
+        'hull_segments': 7,
+        'engines': 2,
+        'weapons': 2,
+        'turret_hardpoints': 1,
+        'wings': True,
+        'crew_capacity': 1,
+    },
+}
+
+
+
+# ---------------------------------------------------------------------------
+# Placement helpers
+# ---------------------------------------------------------------------------
+
+
+def object_location(position):
+    """Return *position* as Blender reports an object location: a list of
+    single-precision floats."""
+    return array('f', position).tolist()
+
+
+def wing_positions(scale, symmetry=True):
+    """Return the (x, y, z) location of each wing (left first)."""
+    wing_length = scale * 0.8
+    positions = [(wing_length * 0.5, 0, 0)]
+    if symmetry:
+        positions.append((-wing_length * 0.5, 0, 0))
+    return positions
+
+
+def engine_positions(count, scale, symmetry=True):
+    """Return engine locations in creation order.
+
+    Symmetric layouts (even *count*) alternate left/right pairs; other
+    layouts spread the engines along X.
+    """
+    rear_position = -scale * 0.9
+    positions = []
+    if symmetry and count % 2 == 0:
+        spacing = scale * 0.3
+        for i in range(count // 2):
+            offset = spacing * (i + 0.5)
+            positions.append((offset, rear_position, 0))
+            positions.append((-offset, rear_position, 0))
+    else:
+        for i in range(count):
+            x_offset = (i - count / 2) * scale * 0.3
+            positions.append((x_offset, rear_position, 0))
+    return positions
+
+
+def weapon_hardpoint_positions(count, scale, symmetry=True):
+    """Return weapon hardpoint locations on the ventral forward hull."""
+    positions = []
+    if symmetry and count % 2 == 0:
+        for i in range(count // 2):
+            y_pos = scale * 0.3 + (i * scale * 0.2)
+            x_offset = scale * 0.3 + (i * scale * 0.1)
+            positions.append((x_offset, y_pos, -scale * 0.1))
+            positions.append((-x_offset, y_pos, -scale * 0.1))
+    else:
+        for i in range(count):
+            y_pos = scale * 0.3 + (i * scale * 0.2)
+            x_pos = (i - count / 2) * scale * 0.2
+            positions.append((x_pos, y_pos, -scale * 0.1))
+    return positions
+
+
+def turret_hardpoint_positions(count, scale, symmetry=True):
+    """Return turret locations along the dorsal hull (at most
+    :data:`MAX_TURRET_HARDPOINTS`)."""
+    count = min(count, MAX_TURRET_HARDPOINTS)
+    positions = []
+    if symmetry and count % 2 == 0:
+        for i in range(count // 2):
+            y_pos = scale * 0.2 - (i * scale * 0.25)
+            x_offset = scale * 0.2 + (i * scale * 0.08)
+            positions.append((x_offset, y_pos, scale * 0.15))
+            positions.append((-x_offset, y_pos, scale * 0.15))
+    else:
+        for i in range(count):
+            y_pos = scale * 0.3 - (i * scale * 0.15)
+            x_pos = (i - count / 2) * scale * 0.15
+            positions.append((x_pos, y_pos, scale * 0.15))
+    return positions
+
+
+def launcher_hardpoint_positions(count, scale, symmetry=True):
+    """Return launcher bay locations along the dorsal-forward hull."""
+    positions = []
+    if symmetry and count % 2 == 0:
+        for i in range(count // 2):
+            y_pos = scale * 0.2 + (i * scale * 0.18)
+            x_offset = scale * 0.15 + (i * scale * 0.08)
+            positions.append((x_offset, y_pos, scale * 0.08))
+            positions.append((-x_offset, y_pos, scale * 0.08))
+    else:
+        for i in range(count):
+            y_pos = scale * 0.15 + (i * scale * 0.18)
+            x_pos = (i - count / 2) * scale * 0.15
+            positions.append((x_pos, y_pos, scale * 0.08))
+    return positions
+
+
+def drone_bay_positions(count, scale):
+    """Return drone bay locations on the ventral hull."""
+    return [(0, -scale * 0.1 + (i * scale * 0.15), -scale * 0.12)
+            for i in range(count)]
+
+
+def module_position(index, total_count, scale):
+    """Return the location of module *index* out of *total_count*.
+
+    Modules alternate port/starboard and are spread fore-to-aft so they
+    never overlap.
+    """
+    total = max(total_count, 1)
+    t = (index + 0.5) / total          # 0..1 fractional position along hull
+    fore_offset = 0.4                   # forward-most position (fraction of scale)
+    length_span = 0.8                   # total fore-aft spread (fraction of scale)
+    y_pos = scale * (fore_offset - t * length_span)
+    side = 1 if index % 2 == 0 else -1
+    return (side * scale * 0.35, y_pos, scale * 0.05)
+
+
+def greeble_placements(scale, count, seed):
+    """Return ``(brick_type, (x, y, z))`` for each dorsal greeble.
+
+    Uses its own RNG seeded from *seed* so placement is independent of
+    how much of the global RNG the other stages consumed.
+    """
+    rng = random.Random(seed + GREEBLE_SEED_OFFSET)
+    half_w = scale * 0.4
+    half_l = scale * 0.8
+    placements = []
+    for _ in range(count):
+        brick_type = rng.choice(GREEBLE_TYPES)
+        x_pos = rng.uniform(-half_w, half_w)
+        y_pos = rng.uniform(-half_l * 0.6, half_l * 0.5)
+        placements.append((brick_type, (x_pos, y_pos, scale * 0.15)))
+    return placements
+
+
+# ---------------------------------------------------------------------------
+# Layout pass
+# ---------------------------------------------------------------------------
+
+
+def plan_ship_layout(ship_class='FRIGATE', seed=1, module_slots=2,
+                     symmetry=True, turret_hardpoints=0,
+                     launcher_hardpoints=0, drone_bays=0,
+                     engine_count_override=0):
+    """Return the ``placed_bricks`` list ``generate_spaceship`` records.
+
+    Bricks are listed in generation-stage order: spine, reactor, wings,
+    engines, weapons, turrets, launchers, drone bays, modules, greebles.
+    """
+    config = SHIP_CONFIGS.get(ship_class, SHIP_CONFIGS['FRIGATE'])
+    scale = config['scale']
+
+    placed_bricks = [
+        {'type': 'STRUCTURAL_SPINE', 'pos': [0, 0, 0]},
+        {'type': 'REACTOR_CORE', 'pos': [0, scale * 0.8, 0]},
+    ]
+
+    if config['wings']:
+        for pos in wing_positions(scale, symmetry):
+            placed_bricks.append({'type': 'HULL_PLATE',
+                                  'pos': object_location(pos)})
+
+    engine_count = (engine_count_override if engine_count_override > 0
+                    else config['engines'])
+    engines = engine_positions(engine_count, scale, symmetry)
+    for i, pos in enumerate(engines):
+        placed_bricks.append({
+            'type': 'ENGINE_BLOCK',
+            'pos': object_location(pos),
+            'archetype': brick_system.select_engine_archetype(i, len(engines)),
+        })
+
+    if config['weapons'] > 0:
+        for pos in weapon_hardpoint_positions(config['weapons'], scale,
+                                              symmetry):
+            placed_bricks.append({'type': 'HARDPOINT_MOUNT',
+                                  'pos': object_location(pos)})
+
+    turret_count = (turret_hardpoints if turret_hardpoints > 0
+                    else config.get('turret_hardpoints', 0))
+    turret_count = min(turret_count, MAX_TURRET_HARDPOINTS)
+    if turret_count > 0:
+        for pos in turret_hardpoint_positions(turret_count, scale, symmetry):
+            placed_bricks.append({'type': 'HARDPOINT_MOUNT',
+                                  'pos': object_location(pos)})
+
+    if launcher_hardpoints > 0:
+        for pos in launcher_hardpoint_positions(launcher_hardpoints, scale,
+                                                symmetry):
+            placed_bricks.append({'type': 'HARDPOINT_MOUNT',
+                                  'pos': object_location(pos),
+                                  'subtype': 'launcher'})
+
+    if drone_bays > 0:
+        for pos in drone_bay_positions(drone_bays, scale):
+            placed_bricks.append({'type': 'DOCKING_CLAMP',
+                                  'pos': object_location(pos),
+                                  'subtype': 'drone_bay'})
+
+    if module_slots > 0:
+        for i in range(module_slots):
+            placed_bricks.append({
+                'type': 'CAPACITOR',
+                'pos': object_location(module_position(i, module_slots, scale)),
+            })
+
+    greeble_count = max(2, config['hull_segments'])
+    for brick_type, pos in greeble_placements(scale, greeble_count, seed):
+        placed_bricks.append({'type': brick_type,
+                              'pos': object_location(pos)})
+
+    return placed_bricks
+
+
+def generate_ship_dna(ship_class='FRIGATE', seed=1, generate_interior=True,
+                      module_slots=2, hull_complexity=1.0, symmetry=True,
+                      style='SOLARI', naming_prefix='', turret_hardpoints=0,
+                      hull_taper=0.85, launcher_hardpoints=0, drone_bays=0,
+                      engine_count_override=0, novaforge_scale=None):
+    """Return the Ship DNA ``generate_spaceship`` would store for these
+    arguments, without creating any geometry.
+
+    Takes exactly the keyword arguments of
+    :func:`ship_generator.generate_spaceship`; the mesh-only ones
+    (*generate_interior*, *hull_complexity*, *hull_taper*,
+    *novaforge_scale*) do not affect the layout and are ignored.
+    """
+    placed_bricks = plan_ship_layout(
+        ship_class=ship_class,
+        seed=seed,
+        module_slots=module_slots,
+        symmetry=symmetry,
+        turret_hardpoints=turret_hardpoints,
+        launcher_hardpoints=launcher_hardpoints,
+        drone_bays=drone_bays,
+        engine_count_override=engine_count_override,
+    )
+    return brick_system.generate_ship_dna(
+        ship_class=ship_class,
+        seed=seed,
+        bricks=placed_bricks,
+        style=style,
+        naming_prefix=naming_prefix,
+    )
+
+
+# ---------------------------------------------------------------------------
+# Blender registration stubs
+# ---------------------------------------------------------------------------
+
+
+def register():
+    """Register this module."""
+    pass
+
+
+def unregister():
+    """Unregister this module."""
+    pass
@@ -8,17 +8,26 @@ UTILITY_EXHAUST) for visual variety defined in :mod:`brick_system`.
 Hull generation uses per-class shape profiles so that different ship classes
 produce distinctive silhouettes (e.g. wide/flat carriers vs long/narrow
 frigates).  A seed-driven vertex noise pass adds organic uniqueness.
+
+Geometry is built with ``bmesh.ops`` directly into mesh data-blocks (see
+the geometry backend helpers) rather than through ``bpy.ops`` operators.
 """
 
 import bpy
 import bmesh
+import hashlib
 import random
 import math
+import numpy as np
+from contextlib import contextmanager
+from mathutils import Matrix
 from . import brick_system
+from . import ship_layout
+from . import material_registry
 
 
 # Maximum number of turret hardpoints any ship may have
-MAX_TURRET_HARDPOINTS = 10
+MAX_TURRET_HARDPOINTS = ship_layout.MAX_TURRET_HARDPOINTS
 
 # ---------------------------------------------------------------------------
 # Per-class hull shape profiles (NovaForge classes only)
@@ -68,6 +77,328 @@ def create_mesh_object(name, verts, edges, faces):
     return obj
 
 
+# ---------------------------------------------------------------------------
+# Geometry backend
+# ---------------------------------------------------------------------------
+# Primitives are built with bmesh.ops straight into new mesh data-blocks
+# instead of bpy.ops.mesh.primitive_*_add, which pays for a depsgraph
+# update, an undo push and a context lookup on every call.  Segment counts
+# and UVs match the operator defaults, *scale* is baked into the mesh the
+# way transform_apply(scale=True) did, and new objects are linked to the
+# active collection just like operator-created ones.  Repeated parts pass
+# shared=True to link one cached mesh per (part kind, size) instead of
+# building a copy per instance.
+
+# Operator default segment counts
+_CIRCLE_SEGMENTS = 32
+_SPHERE_SEGMENTS = (32, 16)
+_TORUS_SEGMENTS = (48, 12)
+
+
+def _radius_kwargs(**radii):
+    """bmesh.ops primitive radii were (mis)named ``diameter*`` before 3.0."""
+    if bpy.app.version >= (3, 0, 0):
+        return radii
+    return {key.replace('radius', 'diameter'): value
+            for key, value in radii.items()}
+
+
+def _new_bmesh():
+    bm = bmesh.new()
+    bm.loops.layers.uv.new("UVMap")
+    return bm
+
+
+def _scale_matrix(scale):
+    if scale is None:
+        return Matrix.Identity(4)
+    return Matrix.Diagonal((scale[0], scale[1], scale[2], 1.0))
+
+
+def _bmesh_to_mesh(name, bm, smooth=False):
+    """Write *bm* into a new mesh data-block and free it."""
+    if smooth:
+        for face in bm.faces:
+            face.smooth = True
+    bm.normal_update()
+    mesh = bpy.data.meshes.new(name)
+    bm.to_mesh(mesh)
+    bm.free()
+    return mesh
+
+
+def _link_object(name, mesh, location):
+    """Create an object for *mesh* at *location* and link it."""
+    obj = bpy.data.objects.new(name, mesh)
+    obj.location = location
+    bpy.context.collection.objects.link(obj)
+    return obj
+
+
+def _link_primitive(name, bm, location, smooth=False):
+    """Write *bm* into a new mesh object at *location* and link it."""
+    return _link_object(name, _bmesh_to_mesh(name, bm, smooth), location)
+
+
+def _part_key_value(value):
+    """Round floats (also inside tuples and lists) for a part-mesh key,
+    so float noise below 1e-6 maps to the same shared mesh."""
+    if isinstance(value, float):
+        return round(value, 6) + 0.0   # + 0.0 folds -0.0 into 0.0
+    if isinstance(value, (tuple, list)):
+        return type(value)(_part_key_value(v) for v in value)
+    return value
+
+
+def part_mesh(kind, params, build):
+    """Return the shared mesh for part *kind* built with *params*.
+
+    Repeated parts (turrets, greebles, exhaust rings, bunks …) have
+    identical geometry at a given size, so every instance links the same
+    mesh data-block.  Meshes are named after a hash of ``(kind, params)``
+    and tagged with the full key, so the cache survives reloading the
+    .blend file.  *build(mesh_name)* creates the mesh on a miss.
+    """
+    key = repr((kind,) + _part_key_value(tuple(params)))
+    digest = hashlib.sha1(key.encode('utf-8')).hexdigest()[:12]
+    name = f"Part_{kind}_{digest}"
+    mesh = bpy.data.meshes.get(name)
+    if mesh is None or mesh.get("part_key") != key:
+        mesh = build(name)
+        mesh["part_key"] = key
+    return mesh
+
+
+def _primitive(name, kind, params, build, location, shared):
+    mesh = part_mesh(kind, params, build) if shared else build(name)
+    return _link_object(name, mesh, location)
+
+
+def set_material(obj, material):
+    """Put *material* in the first material slot of *obj*.
+
+    When *obj* shares its mesh with other objects the slot is linked to
+    the object, so each instance keeps its own material without changing
+    the others.
+    """
+    mesh = obj.data
+    if mesh.users <= 1:
+        if mesh.materials:
+            mesh.materials[0] = material
+        else:
+            mesh.materials.append(material)
+        return
+    if not mesh.materials:
+        mesh.materials.append(None)
+    slot = obj.material_slots[0]
+    slot.link = 'OBJECT'
+    slot.material = material
+
+
+def add_cube(name, size=2.0, location=(0, 0, 0), scale=None, smooth=False,
+             shared=False):
+    """Create a cube object (``primitive_cube_add`` equivalent).
+
+    With *shared* the mesh comes from :func:`part_mesh`.
+    """
+    def build(mesh_name):
+        bm = _new_bmesh()
+        bmesh.ops.create_cube(bm, size=size, matrix=_scale_matrix(scale),
+                              calc_uvs=True)
+        return _bmesh_to_mesh(mesh_name, bm, smooth)
+
+    return _primitive(name, 'CUBE', (size, scale, smooth), build, location,
+                      shared)
+
+
+def add_cone(name, radius1=1.0, radius2=0.0, depth=2.0, location=(0, 0, 0),
+             scale=None, smooth=False, shared=False):
+    """Create a capped cone object (``primitive_cone_add`` equivalent)."""
+    def build(mesh_name):
+        bm = _new_bmesh()
+        bmesh.ops.create_cone(bm, cap_ends=True, cap_tris=False,
+                              segments=_CIRCLE_SEGMENTS, depth=depth,
+                              matrix=_scale_matrix(scale), calc_uvs=True,
+                              **_radius_kwargs(radius1=radius1,
+                                               radius2=radius2))
+        return _bmesh_to_mesh(mesh_name, bm, smooth)
+
+    return _primitive(name, 'CONE', (radius1, radius2, depth, scale, smooth),
+                      build, location, shared)
+
+
+def add_cylinder(name, radius=1.0, depth=2.0, location=(0, 0, 0),
+                 scale=None, smooth=False, shared=False):
+    """Create a capped cylinder object (``primitive_cylinder_add``
+    equivalent)."""
+    return add_cone(name, radius1=radius, radius2=radius, depth=depth,
+                    location=location, scale=scale, smooth=smooth,
+                    shared=shared)
+
+
+def add_uv_sphere(name, radius=1.0, location=(0, 0, 0), scale=None,
+                  smooth=False, shared=False):
+    """Create a UV sphere object (``primitive_uv_sphere_add`` equivalent)."""
+    def build(mesh_name):
+        bm = _new_bmesh()
+        u_segments, v_segments = _SPHERE_SEGMENTS
+        bmesh.ops.create_uvsphere(bm, u_segments=u_segments,
+                                  v_segments=v_segments,
+                                  matrix=_scale_matrix(scale), calc_uvs=True,
+                                  **_radius_kwargs(radius=radius))
+        return _bmesh_to_mesh(mesh_name, bm, smooth)
+
+    return _primitive(name, 'SPHERE', (radius, scale, smooth), build,
+                      location, shared)
+
+
+def add_torus(name, major_radius=1.0, minor_radius=0.25, location=(0, 0, 0),
+              shared=False):
+    """Create a torus object (``primitive_torus_add`` equivalent).
+
+    bmesh has no torus primitive, so the ring is laid out here exactly as
+    the torus operator does and written with ``from_pydata``.
+    """
+    def build(mesh_name):
+        return _torus_mesh(mesh_name, major_radius, minor_radius)
+
+    return _primitive(name, 'TORUS', (major_radius, minor_radius), build,
+                      location, shared)
+
+
+def _torus_mesh(name, major_radius, minor_radius):
+    major_seg, minor_seg = _TORUS_SEGMENTS
+    tot_verts = major_seg * minor_seg
+    verts = []
+    faces = []
+    i1 = 0
+    for major_index in range(major_seg):
+        angle = 2.0 * math.pi * major_index / major_seg
+        cos_major, sin_major = math.cos(angle), math.sin(angle)
+        for minor_index in range(minor_seg):
+            minor = 2.0 * math.pi * minor_index / minor_seg
+            radial = major_radius + math.cos(minor) * minor_radius
+            verts.append((radial * cos_major, radial * sin_major,
+                          math.sin(minor) * minor_radius))
+            if minor_index + 1 == minor_seg:
+                i2 = major_index * minor_seg
+                i3 = i1 + minor_seg
+                i4 = i2 + minor_seg
+            else:
+                i2 = i1 + 1
+                i3 = i1 + minor_seg
+                i4 = i3 + 1
+            faces.append((i1, i3 % tot_verts, i4 % tot_verts,
+                          i2 % tot_verts))
+            i1 += 1
+
+    mesh = bpy.data.meshes.new(name)
+    mesh.from_pydata(verts, [], faces)
+    _add_torus_uvs(mesh, major_seg, minor_seg)
+    mesh.update()
+    return mesh
+
+
+def _add_torus_uvs(mesh, major_seg, minor_seg):
+    """Lay out torus UVs as the torus operator does (one quad per face)."""
+    u_step = 1.0 / major_seg
+    v_step = 1.0 / minor_seg
+    # Round UVs, needed when segments aren't divisible by 4
+    u_init = 0.5 + math.fmod(0.5, u_step)
+    v_init = 0.5 + math.fmod(0.5, v_step)
+    # Wrap just under 1.0 so float error never wraps at the wrong step
+    u_wrap = 1.0 - (u_step / 2.0)
+    v_wrap = 1.0 - (v_step / 2.0)
+
+    uvs = []
+    u_prev = u_init
+    u_next = u_prev + u_step
+    for _ in range(major_seg):
+        v_prev = v_init
+        v_next = v_prev + v_step
+        for _ in range(minor_seg):
+            # Loop order of each face is (i1, i3, i4, i2)
+            uvs.extend((u_prev, v_prev, u_next, v_prev,
+                        u_next, v_next, u_prev, v_next))
+            v_prev = v_next - 1.0 if v_next > v_wrap else v_next
+            v_next = v_prev + v_step
+        u_prev = u_next - 1.0 if u_next > u_wrap else u_next
+        u_next = u_prev + u_step
+
+    mesh.uv_layers.new(name="UVMap").data.foreach_set("uv", uvs)
+
+
+@contextmanager
+def _edit_bmesh(obj):
+    """Yield a BMesh of *obj*'s mesh and write it back afterwards.
+
+    Replaces ``mode_set(mode='EDIT')`` … ``mode_set(mode='OBJECT')``
+    round trips around edit-mode operators.
+    """
+    bm = bmesh.new()
+    bm.from_mesh(obj.data)
+    try:
+        yield bm
+        bm.normal_update()
+        bm.to_mesh(obj.data)
+        obj.data.update()
+    finally:
+        bm.free()
+
+
+def _subdivide(bm, cuts):
+    """Subdivide every edge (edit-mode ``mesh.subdivide`` on everything)."""
+    bmesh.ops.subdivide_edges(bm, edges=bm.edges[:], cuts=cuts,
+                              use_grid_fill=True)
+
+
+def _bevel(bm, offset, segments):
+    """Bevel every edge with the edit-mode ``mesh.bevel`` defaults."""
+    if bpy.app.version >= (2, 90, 0):
+        affect = {'affect': 'EDGES'}
+    else:
+        affect = {'vertex_only': False}
+    bmesh.ops.bevel(bm, geom=bm.verts[:] + bm.edges[:], offset=offset,
+                    segments=segments, profile=0.5, loop_slide=True,
+                    clamp_overlap=False, material=-1, **affect)
+
+
+def _shade_smooth(obj):
+    """Mark every face of *obj* smooth (``object.shade_smooth``)."""
+    polygons = obj.data.polygons
+    polygons.foreach_set("use_smooth", [True] * len(polygons))
+    obj.data.update()
+
+
+def _evaluated_dimensions(obj):
+    """Return *obj*'s dimensions including its modifier stack.
+
+    Operator calls evaluated the depsgraph as a side effect; direct data
+    creation does not, so evaluate once before reading bounds.
+    """
+    bpy.context.view_layer.update()
+    return obj.dimensions
+
+
+def get_vertex_array(mesh, attr="co"):
+    """Return a per-vertex vector attribute of *mesh* as an (N, 3) array.
+
+    Values are read in one ``foreach_get`` call and widened to float64 so
+    arithmetic on them matches the double-precision Python maths the
+    per-vertex loops used to do.
+    """
+    values = np.empty(len(mesh.vertices) * 3, dtype=np.float32)
+    mesh.vertices.foreach_get(attr, values)
+    return values.reshape(-1, 3).astype(np.float64)
+
+
+def set_vertex_coords(mesh, coords):
+    """Write an (N, 3) coordinate array back to *mesh* and update it."""
+    mesh.vertices.foreach_set(
+        "co", np.ascontiguousarray(coords, dtype=np.float32).ravel())
+    mesh.update()
+
+
 def generate_hull(segments=5, scale=1.0, complexity=1.0, symmetry=True, style='SOLARI',
                   naming_prefix='', ship_class='FRIGATE', seed=0):
     """
@@ -86,26 +417,22 @@ def generate_hull(segments=5, scale=1.0, complexity=1.0, symmetry=True, style='S
         ship_class: Ship class key used to select hull profile
         seed: Random seed used for vertex noise
     """
-    # Create base hull mesh
-    bpy.ops.mesh.primitive_cube_add(size=1, location=(0, 0, 0))
-    hull = bpy.context.active_object
-    hull.name = _prefixed_name(naming_prefix, "Hull")
-
-    # Use per-class profile for distinctive silhouettes
+    # Create base hull mesh, using the per-class profile for distinctive
+    # silhouettes
     profile = HULL_PROFILES.get(ship_class, _DEFAULT_PROFILE)
-    hull.scale = (scale * profile[0], scale * profile[1], scale * profile[2])
-    bpy.ops.object.transform_apply(scale=True)
-    
-    # Enter edit mode to modify geometry
-    bpy.context.view_layer.objects.active = hull
-    bpy.ops.object.mode_set(mode='EDIT')
-    
+    bm = _new_bmesh()
+    bmesh.ops.create_cube(
+        bm, size=1,
+        matrix=_scale_matrix((scale * profile[0], scale * profile[1],
+                              scale * profile[2])),
+        calc_uvs=True,
+    )
+
     # Add subdivisions based on complexity
     subdiv_levels = max(1, int(complexity * 2))
-    bpy.ops.mesh.subdivide(number_cuts=subdiv_levels)
-    
-    # Add some variation to vertices
-    bpy.ops.object.mode_set(mode='OBJECT')
+    _subdivide(bm, subdiv_levels)
+    hull = _link_primitive(_prefixed_name(naming_prefix, "Hull"), bm,
+                           (0, 0, 0))
     
     # Apply NovaForge faction style modifications
     if style == 'SOLARI':
@@ -123,7 +450,7 @@ def generate_hull(segments=5, scale=1.0, complexity=1.0, symmetry=True, style='S
     _apply_hull_vertex_noise(hull, scale, seed, complexity)
 
     # Add smooth shading
-    bpy.ops.object.shade_smooth()
+    _shade_smooth(hull)
 
     # Add subdivision surface modifier for smoother look
     modifier = hull.modifiers.new(name="Subdivision", type='SUBSURF')
@@ -139,10 +466,8 @@ def generate_hull(segments=5, scale=1.0, complexity=1.0, symmetry=True, style='S
 
 def apply_solari_style(hull, scale):
     """Apply Solari faction style - golden, elegant, armor-focused"""
-    bpy.context.view_layer.objects.active = hull
-    bpy.ops.object.mode_set(mode='EDIT')
-    bpy.ops.mesh.bevel(offset=0.08 * scale, segments=3)
-    bpy.ops.object.mode_set(mode='OBJECT')
+    with _edit_bmesh(hull) as bm:
+        _bevel(bm, offset=0.08 * scale, segments=3)
 
     # Add smooth curves for elegant look
     cast_mod = hull.modifiers.new(name="Cast", type='CAST')
@@ -152,18 +477,14 @@ def apply_solari_style(hull, scale):
 
 def apply_veyren_style(hull, scale):
     """Apply Veyren faction style - angular, utilitarian, shield-focused"""
-    bpy.context.view_layer.objects.active = hull
-    bpy.ops.object.mode_set(mode='EDIT')
-    bpy.ops.mesh.bevel(offset=0.12 * scale, segments=1)
-    bpy.ops.object.mode_set(mode='OBJECT')
+    with _edit_bmesh(hull) as bm:
+        _bevel(bm, offset=0.12 * scale, segments=1)
 
 
 def apply_aurelian_style(hull, scale):
     """Apply Aurelian faction style - sleek, organic, drone-focused"""
-    bpy.context.view_layer.objects.active = hull
-    bpy.ops.object.mode_set(mode='EDIT')
-    bpy.ops.mesh.subdivide(number_cuts=1)
-    bpy.ops.object.mode_set(mode='OBJECT')
+    with _edit_bmesh(hull) as bm:
+        _subdivide(bm, 1)
 
     cast_mod = hull.modifiers.new(name="Cast", type='CAST')
     cast_mod.factor = 0.25
@@ -172,10 +493,8 @@ def apply_aurelian_style(hull, scale):
 
 def apply_keldari_style(hull, scale):
     """Apply Keldari faction style - rugged, industrial, missile-focused"""
-    bpy.context.view_layer.objects.active = hull
-    bpy.ops.object.mode_set(mode='EDIT')
-    bpy.ops.mesh.bevel(offset=0.15 * scale, segments=1)
-    bpy.ops.object.mode_set(mode='OBJECT')
+    with _edit_bmesh(hull) as bm:
+        _bevel(bm, offset=0.15 * scale, segments=1)
 
 
 # ---------------------------------------------------------------------------
@@ -201,34 +520,25 @@ def generate_launcher_hardpoints(count=2, scale=1.0, symmetry=True, naming_prefi
     launchers = []
     launcher_size = scale * 0.08
 
-    positions = []
-    if symmetry and count % 2 == 0:
-        for i in range(count // 2):
-            y_pos = scale * 0.2 + (i * scale * 0.18)
-            x_offset = scale * 0.15 + (i * scale * 0.08)
-            positions.append((x_offset, y_pos, scale * 0.08))
-            positions.append((-x_offset, y_pos, scale * 0.08))
-    else:
-        for i in range(count):
-            y_pos = scale * 0.15 + (i * scale * 0.18)
-            x_pos = (i - count / 2) * scale * 0.15
-            positions.append((x_pos, y_pos, scale * 0.08))
+    positions = ship_layout.launcher_hardpoint_positions(count, scale, symmetry)
 
     for i, pos in enumerate(positions):
-        bpy.ops.mesh.primitive_cube_add(size=launcher_size, location=pos)
-        launcher = bpy.context.active_object
-        launcher.name = _prefixed_name(naming_prefix, f"Launcher_{i+1}")
-        launcher.scale = (0.6, 1.4, 0.5)
-        bpy.ops.object.transform_apply(scale=True)
+        launcher = add_cube(
+            _prefixed_name(naming_prefix, f"Launcher_{i+1}"),
+            size=launcher_size,
+            location=pos,
+            scale=(0.6, 1.4, 0.5),
+            shared=True,
+        )
 
         # Recessed bay opening (smaller cube subtracted visually)
         bay_pos = (pos[0], pos[1] + launcher_size * 0.4, pos[2])
-        bpy.ops.mesh.primitive_cube_add(
+        bay = add_cube(
+            _prefixed_name(naming_prefix, f"Launcher_Bay_{i+1}"),
             size=launcher_size * 0.5,
             location=bay_pos,
+            shared=True,
         )
-        bay = bpy.context.active_object
-        bay.name = _prefixed_name(naming_prefix, f"Launcher_Bay_{i+1}")
         bay.parent = launcher
 
         launcher["hardpoint_type"] = "launcher"
@@ -254,28 +564,27 @@ def generate_drone_bays(count=1, scale=1.0, naming_prefix=''):
     bays = []
     bay_size = scale * 0.12
 
-    for i in range(count):
-        y_pos = -scale * 0.1 + (i * scale * 0.15)
-        pos = (0, y_pos, -scale * 0.12)
-
-        bpy.ops.mesh.primitive_cube_add(size=bay_size, location=pos)
-        bay = bpy.context.active_object
-        bay.name = _prefixed_name(naming_prefix, f"Drone_Bay_{i+1}")
-        bay.scale = (1.8, 1.2, 0.3)
-        bpy.ops.object.transform_apply(scale=True)
+    for i, pos in enumerate(ship_layout.drone_bay_positions(count, scale)):
+        bay = add_cube(
+            _prefixed_name(naming_prefix, f"Drone_Bay_{i+1}"),
+            size=bay_size,
+            location=pos,
+            scale=(1.8, 1.2, 0.3),
+            shared=True,
+        )
 
         # Bay door lines (two thin cubes)
         for side in (-1, 1):
             door_pos = (pos[0] + side * bay_size * 0.5, pos[1], pos[2])
-            bpy.ops.mesh.primitive_cube_add(
+            door = add_cube(
+                _prefixed_name(
+                    naming_prefix,
+                    f"Drone_Bay_{i+1}_Door_{'L' if side < 0 else 'R'}"),
                 size=bay_size * 0.1,
                 location=door_pos,
+                scale=(0.2, 1.0, 0.5),
+                shared=True,
             )
-            door = bpy.context.active_object
-            door.name = _prefixed_name(
-                naming_prefix, f"Drone_Bay_{i+1}_Door_{'L' if side < 0 else 'R'}")
-            door.scale = (0.2, 1.0, 0.5)
-            bpy.ops.object.transform_apply(scale=True)
             door.parent = bay
 
         bay["hardpoint_type"] = "drone_bay"
@@ -326,24 +635,18 @@ def _add_solari_spires(hull, scale, rng, naming_prefix):
         x_pos = rng.uniform(-scale * 0.08, scale * 0.08)
         height = scale * rng.uniform(0.12, 0.22)
 
-        bpy.ops.mesh.primitive_cone_add(
+        spire = add_cone(
+            _prefixed_name(naming_prefix, f"Solari_Spire_{i+1}"),
             radius1=scale * 0.02,
             radius2=0,
             depth=height,
             location=(x_pos, y_pos, scale * 0.15 + height * 0.5),
         )
-        spire = bpy.context.active_object
-        spire.name = _prefixed_name(naming_prefix, f"Solari_Spire_{i+1}")
         spire.parent = hull
 
         # Gold material
-        mat = bpy.data.materials.new(name=f"Solari_Gold_{i}")
-        mat.use_nodes = True
-        bsdf = mat.node_tree.nodes.get('Principled BSDF')
-        if bsdf:
-            bsdf.inputs['Base Color'].default_value = (0.8, 0.65, 0.2, 1.0)
-            bsdf.inputs['Metallic'].default_value = 0.95
-            bsdf.inputs['Roughness'].default_value = 0.2
+        mat = material_registry.principled_material(
+            "Solari_Gold", (0.8, 0.65, 0.2, 1.0), 0.95, 0.2)
         spire.data.materials.append(mat)
         details.append(spire)
 
@@ -360,23 +663,17 @@ def _add_veyren_panels(hull, scale, rng, naming_prefix):
         side = rng.choice([-1, 1])
         x_pos = side * scale * rng.uniform(0.18, 0.28)
 
-        bpy.ops.mesh.primitive_cube_add(
+        z_pos = scale * rng.uniform(0.05, 0.14)
+        panel = add_cube(
+            _prefixed_name(naming_prefix, f"Veyren_Panel_{i+1}"),
             size=scale * 0.06,
-            location=(x_pos, y_pos, scale * rng.uniform(0.05, 0.14)),
+            location=(x_pos, y_pos, z_pos),
+            scale=(1.0, rng.uniform(1.2, 2.0), 0.4),
         )
-        panel = bpy.context.active_object
-        panel.name = _prefixed_name(naming_prefix, f"Veyren_Panel_{i+1}")
-        panel.scale = (1.0, rng.uniform(1.2, 2.0), 0.4)
-        bpy.ops.object.transform_apply(scale=True)
         panel.parent = hull
 
-        mat = bpy.data.materials.new(name=f"Veyren_Steel_{i}")
-        mat.use_nodes = True
-        bsdf = mat.node_tree.nodes.get('Principled BSDF')
-        if bsdf:
-            bsdf.inputs['Base Color'].default_value = (0.35, 0.45, 0.55, 1.0)
-            bsdf.inputs['Metallic'].default_value = 0.85
-            bsdf.inputs['Roughness'].default_value = 0.35
+        mat = material_registry.principled_material(
+            "Veyren_Steel", (0.35, 0.45, 0.55, 1.0), 0.85, 0.35)
         panel.data.materials.append(mat)
         details.append(panel)
 
@@ -393,24 +690,17 @@ def _add_aurelian_curves(hull, scale, rng, naming_prefix):
         side = rng.choice([-1, 1])
         x_pos = side * scale * rng.uniform(0.2, 0.3)
 
-        bpy.ops.mesh.primitive_uv_sphere_add(
+        pod = add_uv_sphere(
+            _prefixed_name(naming_prefix, f"Aurelian_Pod_{i+1}"),
             radius=scale * 0.04,
             location=(x_pos, y_pos, 0),
+            scale=(0.8, 1.5, 0.6),
+            smooth=True,
         )
-        pod = bpy.context.active_object
-        pod.name = _prefixed_name(naming_prefix, f"Aurelian_Pod_{i+1}")
-        pod.scale = (0.8, 1.5, 0.6)
-        bpy.ops.object.transform_apply(scale=True)
-        bpy.ops.object.shade_smooth()
         pod.parent = hull
 
-        mat = bpy.data.materials.new(name=f"Aurelian_Organic_{i}")
-        mat.use_nodes = True
-        bsdf = mat.node_tree.nodes.get('Principled BSDF')
-        if bsdf:
-            bsdf.inputs['Base Color'].default_value = (0.2, 0.45, 0.35, 1.0)
-            bsdf.inputs['Metallic'].default_value = 0.6
-            bsdf.inputs['Roughness'].default_value = 0.35
+        mat = material_registry.principled_material(
+            "Aurelian_Organic", (0.2, 0.45, 0.35, 1.0), 0.6, 0.35)
         pod.data.materials.append(mat)
         details.append(pod)
 
@@ -428,24 +718,18 @@ def _add_keldari_framework(hull, scale, rng, naming_prefix):
         x_pos = side * scale * rng.uniform(0.15, 0.3)
         z_pos = rng.uniform(-scale * 0.05, scale * 0.12)
 
-        bpy.ops.mesh.primitive_cylinder_add(
+        strut = add_cylinder(
+            _prefixed_name(naming_prefix, f"Keldari_Strut_{i+1}"),
             radius=scale * 0.01,
             depth=scale * rng.uniform(0.08, 0.18),
             location=(x_pos, y_pos, z_pos),
         )
-        strut = bpy.context.active_object
-        strut.name = _prefixed_name(naming_prefix, f"Keldari_Strut_{i+1}")
         angle = rng.uniform(-0.4, 0.4)
         strut.rotation_euler = (angle, rng.uniform(-0.3, 0.3), 0)
         strut.parent = hull
 
-        mat = bpy.data.materials.new(name=f"Keldari_Rust_{i}")
-        mat.use_nodes = True
-        bsdf = mat.node_tree.nodes.get('Principled BSDF')
-        if bsdf:
-            bsdf.inputs['Base Color'].default_value = (0.45, 0.3, 0.2, 1.0)
-            bsdf.inputs['Metallic'].default_value = 0.7
-            bsdf.inputs['Roughness'].default_value = 0.65
+        mat = material_registry.principled_material(
+            "Keldari_Rust", (0.45, 0.3, 0.2, 1.0), 0.7, 0.65)
         strut.data.materials.append(mat)
         details.append(strut)
 
@@ -455,15 +739,14 @@ def _add_keldari_framework(hull, scale, rng, naming_prefix):
         y_pos = rng.uniform(-scale * 0.4, scale * 0.3)
         x_pos = rng.uniform(-scale * 0.25, scale * 0.25)
 
-        bpy.ops.mesh.primitive_cube_add(
+        z_pos = scale * rng.uniform(0.08, 0.15)
+        plate = add_cube(
+            _prefixed_name(naming_prefix, f"Keldari_Plate_{i+1}"),
             size=scale * 0.05,
-            location=(x_pos, y_pos, scale * rng.uniform(0.08, 0.15)),
+            location=(x_pos, y_pos, z_pos),
+            scale=(rng.uniform(0.8, 1.5), rng.uniform(0.8, 1.5), 0.3),
         )
-        plate = bpy.context.active_object
-        plate.name = _prefixed_name(naming_prefix, f"Keldari_Plate_{i+1}")
-        plate.scale = (rng.uniform(0.8, 1.5), rng.uniform(0.8, 1.5), 0.3)
         plate.rotation_euler = (0, 0, rng.uniform(-0.2, 0.2))
-        bpy.ops.object.transform_apply(scale=True)
         plate.parent = hull
         details.append(plate)
 
@@ -485,12 +768,15 @@ def _apply_hull_vertex_noise(hull, scale, seed, complexity):
     rng = random.Random(seed)
     magnitude = scale * _VERTEX_NOISE_BASE_MAGNITUDE * complexity
     mesh = hull.data
-    for v in mesh.vertices:
-        offset = rng.uniform(-magnitude, magnitude)
-        v.co.x += v.normal.x * offset
-        v.co.y += v.normal.y * offset
-        v.co.z += v.normal.z * offset
-    mesh.update()
+    if not mesh.vertices:
+        return
+    # Same draws, in vertex order, and same formula as rng.uniform(low, high)
+    low, high = -magnitude, magnitude
+    draws = np.array([rng.random() for _ in range(len(mesh.vertices))])
+    offsets = low + (high - low) * draws
+    coords = get_vertex_array(mesh)
+    coords += get_vertex_array(mesh, "normal") * offsets[:, None]
+    set_vertex_coords(mesh, coords)
 
 
 def generate_cockpit(scale=1.0, position=(0, 0, 0), ship_class='FRIGATE', style='SOLARI',
@@ -505,23 +791,18 @@ def generate_cockpit(scale=1.0, position=(0, 0, 0), ship_class='FRIGATE', style=
         style: Design style
         naming_prefix: Project naming prefix
     """
-    # Create cockpit as a modified cube
-    bpy.ops.mesh.primitive_cube_add(size=scale * 0.3, location=position)
-    cockpit = bpy.context.active_object
-    cockpit.name = _prefixed_name(naming_prefix, "Cockpit")
-    
-    # Scale to appropriate proportions
-    cockpit.scale = (0.8, 1.2, 0.6)
-    bpy.ops.object.transform_apply(scale=True)
+    # Create cockpit as a modified cube, scaled to appropriate proportions
+    bm = _new_bmesh()
+    bmesh.ops.create_cube(bm, size=scale * 0.3,
+                          matrix=_scale_matrix((0.8, 1.2, 0.6)),
+                          calc_uvs=True)
     
     # Taper the front for viewing angle
-    bpy.context.view_layer.objects.active = cockpit
-    bpy.ops.object.mode_set(mode='EDIT')
-    bpy.ops.mesh.subdivide(number_cuts=2)
-    bpy.ops.object.mode_set(mode='OBJECT')
+    _subdivide(bm, 2)
     
     # Add smooth shading
-    bpy.ops.object.shade_smooth()
+    cockpit = _link_primitive(_prefixed_name(naming_prefix, "Cockpit"), bm,
+                              position, smooth=True)
     
     return cockpit
 
@@ -544,8 +825,8 @@ def generate_engines(count=2, scale=1.0, symmetry=True, style='SOLARI', naming_p
     engines = []
     base_engine_size = scale * 0.2
 
-    # Position engines at the rear of the ship
-    rear_position = -scale * 0.9
+    # Engines sit at the rear of the ship (see ship_layout.engine_positions)
+    positions = ship_layout.engine_positions(count, scale, symmetry)
 
     # Pre-compute archetype for each logical engine slot
     archetypes = [
@@ -555,23 +836,19 @@ def generate_engines(count=2, scale=1.0, symmetry=True, style='SOLARI', naming_p
 
     if symmetry and count % 2 == 0:
         # Symmetric engine placement
-        spacing = scale * 0.3
         for i in range(count // 2):
-            offset = spacing * (i + 0.5)
-
             arch_name = archetypes[i * 2]
             arch = brick_system.get_engine_archetype(arch_name)
             engine_size = base_engine_size * arch['radius_factor']
             depth = engine_size * 2 * random.uniform(*arch['depth_range'])
 
             # Left engine
-            bpy.ops.mesh.primitive_cylinder_add(
+            left_engine = add_cylinder(
+                _prefixed_name(naming_prefix, f"Engine_L{i+1}"),
                 radius=engine_size,
                 depth=depth,
-                location=(offset, rear_position, 0)
+                location=positions[i * 2]
             )
-            left_engine = bpy.context.active_object
-            left_engine.name = _prefixed_name(naming_prefix, f"Engine_L{i+1}")
             left_engine.rotation_euler = (math.radians(90), 0, 0)
             left_engine["engine_archetype"] = arch_name
             engines.append(left_engine)
@@ -586,13 +863,12 @@ def generate_engines(count=2, scale=1.0, symmetry=True, style='SOLARI', naming_p
                                    arch['exhaust_rings'], naming_prefix)
 
             # Right engine
-            bpy.ops.mesh.primitive_cylinder_add(
+            right_engine = add_cylinder(
+                _prefixed_name(naming_prefix, f"Engine_R{i+1}"),
                 radius=engine_size,
                 depth=depth,
-                location=(-offset, rear_position, 0)
+                location=positions[i * 2 + 1]
             )
-            right_engine = bpy.context.active_object
-            right_engine.name = _prefixed_name(naming_prefix, f"Engine_R{i+1}")
             right_engine.rotation_euler = (math.radians(90), 0, 0)
             right_engine["engine_archetype"] = arch_name
             engines.append(right_engine)
@@ -607,20 +883,17 @@ def generate_engines(count=2, scale=1.0, symmetry=True, style='SOLARI', naming_p
     else:
         # Non-symmetric or odd count
         for i in range(count):
-            x_offset = (i - count / 2) * scale * 0.3
-
             arch_name = archetypes[i]
             arch = brick_system.get_engine_archetype(arch_name)
             engine_size = base_engine_size * arch['radius_factor']
             depth = engine_size * 2 * random.uniform(*arch['depth_range'])
 
-            bpy.ops.mesh.primitive_cylinder_add(
+            engine = add_cylinder(
+                _prefixed_name(naming_prefix, f"Engine_{i+1}"),
                 radius=engine_size,
                 depth=depth,
-                location=(x_offset, rear_position, 0)
+                location=positions[i]
             )
-            engine = bpy.context.active_object
-            engine.name = _prefixed_name(naming_prefix, f"Engine_{i+1}")
             engine.rotation_euler = (math.radians(90), 0, 0)
             engine["engine_archetype"] = arch_name
             engines.append(engine)
@@ -638,18 +911,8 @@ def generate_engines(count=2, scale=1.0, symmetry=True, style='SOLARI', naming_p
         arch_name = engine.get("engine_archetype", "MAIN_THRUST")
         arch = brick_system.get_engine_archetype(arch_name) or brick_system.ENGINE_ARCHETYPES['MAIN_THRUST']
 
-        mat = bpy.data.materials.new(name="Engine_Glow")
-        mat.use_nodes = True
-        nodes = mat.node_tree.nodes
-
-        # Add emission shader
-        emission = nodes.new(type='ShaderNodeEmission')
-        emission.inputs['Color'].default_value = (0.2, 0.5, 1.0, 1.0)  # Blue glow
-        emission.inputs['Strength'].default_value = arch['glow_strength']
-
-        output = nodes.get('Material Output')
-        mat.node_tree.links.new(emission.outputs['Emission'], output.inputs['Surface'])
-
+        mat = material_registry.emission_material(
+            "Engine_Glow", (0.2, 0.5, 1.0, 1.0), arch['glow_strength'])
         engine.data.materials.append(mat)
 
     return engines
@@ -658,14 +921,14 @@ def generate_engines(count=2, scale=1.0, symmetry=True, style='SOLARI', naming_p
 def _add_nozzle_flare(engine_obj, engine_size, naming_prefix=''):
     """Add a cone-shaped nozzle flare to a main-thrust engine."""
     loc = engine_obj.location
-    bpy.ops.mesh.primitive_cone_add(
+    flare = add_cone(
+        _prefixed_name(naming_prefix, f"{engine_obj.name}_Flare"),
         radius1=engine_size * 1.3,
         radius2=engine_size * 0.9,
         depth=engine_size * 0.5,
-        location=(loc.x, loc.y - engine_size * 1.2, loc.z)
+        location=(loc.x, loc.y - engine_size * 1.2, loc.z),
+        shared=True,
     )
-    flare = bpy.context.active_object
-    flare.name = _prefixed_name(naming_prefix, f"{engine_obj.name}_Flare")
     flare.rotation_euler = (math.radians(90), 0, 0)
     flare.parent = engine_obj
 
@@ -677,14 +940,14 @@ def _add_exhaust_rings(engine_obj, engine_size, ring_count, naming_prefix=''):
     ring_spacing = 0.5   # spacing between successive rings
     for r in range(ring_count):
         ring_offset = -engine_size * (base_offset + r * ring_spacing)
-        bpy.ops.mesh.primitive_torus_add(
+        ring = add_torus(
+            _prefixed_name(
+                naming_prefix, f"{engine_obj.name}_ExhaustRing_{r+1}"),
             major_radius=engine_size * (1.05 + r * 0.05),
             minor_radius=engine_size * 0.04,
-            location=(loc.x, loc.y + ring_offset, loc.z)
+            location=(loc.x, loc.y + ring_offset, loc.z),
+            shared=True,
         )
-        ring = bpy.context.active_object
-        ring.name = _prefixed_name(
-            naming_prefix, f"{engine_obj.name}_ExhaustRing_{r+1}")
         ring.rotation_euler = (math.radians(90), 0, 0)
         ring.parent = engine_obj
 
@@ -692,14 +955,14 @@ def _add_exhaust_rings(engine_obj, engine_size, ring_count, naming_prefix=''):
 def _add_inner_cone(engine_obj, engine_size, naming_prefix=''):
     """Add an inner cone detail inside main thrust engines."""
     loc = engine_obj.location
-    bpy.ops.mesh.primitive_cone_add(
+    cone = add_cone(
+        _prefixed_name(naming_prefix, f"{engine_obj.name}_InnerCone"),
         radius1=engine_size * 0.5,
         radius2=engine_size * 0.15,
         depth=engine_size * 0.8,
-        location=(loc.x, loc.y - engine_size * 0.3, loc.z)
+        location=(loc.x, loc.y - engine_size * 0.3, loc.z),
+        shared=True,
     )
-    cone = bpy.context.active_object
-    cone.name = _prefixed_name(naming_prefix, f"{engine_obj.name}_InnerCone")
     cone.rotation_euler = (math.radians(90), 0, 0)
     cone.parent = engine_obj
 
@@ -717,28 +980,25 @@ def generate_wings(scale=1.0, symmetry=True, style='SOLARI', naming_prefix=''):
     wings = []
     wing_length = scale * 0.8
     wing_width = scale * 0.15
+    positions = ship_layout.wing_positions(scale, symmetry)
     
     # Left wing
-    bpy.ops.mesh.primitive_cube_add(
+    left_wing = add_cube(
+        _prefixed_name(naming_prefix, "Wing_Left"),
         size=1,
-        location=(wing_length * 0.5, 0, 0)
+        location=positions[0],
+        scale=(wing_length, wing_width, wing_width * 0.3),
     )
-    left_wing = bpy.context.active_object
-    left_wing.name = _prefixed_name(naming_prefix, "Wing_Left")
-    left_wing.scale = (wing_length, wing_width, wing_width * 0.3)
-    bpy.ops.object.transform_apply(scale=True)
     wings.append(left_wing)
     
     if symmetry:
         # Right wing
-        bpy.ops.mesh.primitive_cube_add(
+        right_wing = add_cube(
+            _prefixed_name(naming_prefix, "Wing_Right"),
             size=1,
-            location=(-wing_length * 0.5, 0, 0)
+            location=positions[1],
+            scale=(wing_length, wing_width, wing_width * 0.3),
         )
-        right_wing = bpy.context.active_object
-        right_wing.name = _prefixed_name(naming_prefix, "Wing_Right")
-        right_wing.scale = (wing_length, wing_width, wing_width * 0.3)
-        bpy.ops.object.transform_apply(scale=True)
         wings.append(right_wing)
     
     return wings
@@ -757,29 +1017,16 @@ def generate_weapon_hardpoints(count=2, scale=1.0, symmetry=True, naming_prefix=
     hardpoints = []
     hardpoint_size = scale * 0.1
     
-    positions = []
-    if symmetry and count % 2 == 0:
-        # Symmetric placement
-        for i in range(count // 2):
-            y_pos = scale * 0.3 + (i * scale * 0.2)
-            x_offset = scale * 0.3 + (i * scale * 0.1)
-            positions.append((x_offset, y_pos, -scale * 0.1))
-            positions.append((-x_offset, y_pos, -scale * 0.1))
-    else:
-        # Non-symmetric
-        for i in range(count):
-            y_pos = scale * 0.3 + (i * scale * 0.2)
-            x_pos = (i - count / 2) * scale * 0.2
-            positions.append((x_pos, y_pos, -scale * 0.1))
+    positions = ship_layout.weapon_hardpoint_positions(count, scale, symmetry)
     
     for i, pos in enumerate(positions):
-        bpy.ops.mesh.primitive_cylinder_add(
+        hardpoint = add_cylinder(
+            _prefixed_name(naming_prefix, f"Weapon_Hardpoint_{i+1}"),
             radius=hardpoint_size,
             depth=hardpoint_size * 2,
-            location=pos
+            location=pos,
+            shared=True,
         )
-        hardpoint = bpy.context.active_object
-        hardpoint.name = _prefixed_name(naming_prefix, f"Weapon_Hardpoint_{i+1}")
         hardpoint.rotation_euler = (math.radians(90), 0, 0)
         hardpoints.append(hardpoint)
     
@@ -810,52 +1057,41 @@ def generate_turret_hardpoints(count=2, scale=1.0, symmetry=True, naming_prefix=
     turrets = []
     turret_size = scale * 0.12
 
-    # Calculate positions along the dorsal (top) surface of the hull
-    positions = []
-    if symmetry and count % 2 == 0:
-        for i in range(count // 2):
-            y_pos = scale * 0.2 - (i * scale * 0.25)
-            x_offset = scale * 0.2 + (i * scale * 0.08)
-            positions.append((x_offset, y_pos, scale * 0.15))
-            positions.append((-x_offset, y_pos, scale * 0.15))
-    else:
-        for i in range(count):
-            y_pos = scale * 0.3 - (i * scale * 0.15)
-            x_pos = (i - count / 2) * scale * 0.15
-            positions.append((x_pos, y_pos, scale * 0.15))
+    # Positions along the dorsal (top) surface of the hull
+    positions = ship_layout.turret_hardpoint_positions(count, scale, symmetry)
 
     for i, pos in enumerate(positions):
         turret_name = _prefixed_name(naming_prefix, f"Turret_Hardpoint_{i+1}")
 
         # --- Turret base (flat cylinder) ---
-        bpy.ops.mesh.primitive_cylinder_add(
+        base = add_cylinder(
+            turret_name,
             radius=turret_size,
             depth=turret_size * 0.4,
-            location=pos
+            location=pos,
+            shared=True,
         )
-        base = bpy.context.active_object
-        base.name = turret_name
 
         # --- Rotation ring (torus around the base) ---
         ring_pos = (pos[0], pos[1], pos[2] + turret_size * 0.25)
-        bpy.ops.mesh.primitive_torus_add(
+        ring = add_torus(
+            _prefixed_name(naming_prefix, f"Turret_Ring_{i+1}"),
             major_radius=turret_size * 0.8,
             minor_radius=turret_size * 0.08,
-            location=ring_pos
+            location=ring_pos,
+            shared=True,
         )
-        ring = bpy.context.active_object
-        ring.name = _prefixed_name(naming_prefix, f"Turret_Ring_{i+1}")
         ring.parent = base
 
         # --- Barrel ---
         barrel_pos = (pos[0], pos[1] + turret_size * 0.9, pos[2] + turret_size * 0.25)
-        bpy.ops.mesh.primitive_cylinder_add(
+        barrel = add_cylinder(
+            _prefixed_name(naming_prefix, f"Turret_Barrel_{i+1}"),
             radius=turret_size * 0.1,
             depth=turret_size * 1.6,
-            location=barrel_pos
+            location=barrel_pos,
+            shared=True,
         )
-        barrel = bpy.context.active_object
-        barrel.name = _prefixed_name(naming_prefix, f"Turret_Barrel_{i+1}")
         barrel.rotation_euler = (math.radians(90), 0, 0)
         barrel.parent = base
 
@@ -867,18 +1103,12 @@ def generate_turret_hardpoints(count=2, scale=1.0, symmetry=True, naming_prefix=
         base["hardpoint_size"] = turret_size
 
         # Apply turret material
-        mat = bpy.data.materials.new(
-            name=_prefixed_name(naming_prefix, f"Turret_Mat_{i+1}"))
-        mat.use_nodes = True
-        nodes = mat.node_tree.nodes
-        bsdf = nodes.get('Principled BSDF')
-        if bsdf:
-            bsdf.inputs['Base Color'].default_value = (0.35, 0.35, 0.4, 1.0)
-            bsdf.inputs['Metallic'].default_value = 0.9
-            bsdf.inputs['Roughness'].default_value = 0.3
-        base.data.materials.append(mat)
-        ring.data.materials.append(mat)
-        barrel.data.materials.append(mat)
+        mat = material_registry.principled_material(
+            _prefixed_name(naming_prefix, "Turret_Mat"),
+            (0.35, 0.35, 0.4, 1.0), 0.9, 0.3)
+        set_material(base, mat)
+        set_material(ring, mat)
+        set_material(barrel, mat)
 
         turrets.append(base)
 
@@ -900,19 +1130,20 @@ def generate_cockpit_neck(hull, cockpit, scale, naming_prefix=''):
     Returns:
         The neck fairing object.
     """
-    hull_front_y = hull.dimensions.y * 0.5
+    hull_front_y = _evaluated_dimensions(hull).y * 0.5
     cockpit_y = cockpit.location.y
     mid_y = (hull_front_y + cockpit_y) * 0.5
     length = abs(cockpit_y - hull_front_y) + scale * 0.05
     width = cockpit.dimensions.x * 0.9
     height = cockpit.dimensions.z * 0.85
 
-    bpy.ops.mesh.primitive_cube_add(size=1, location=(0, mid_y, 0))
-    neck = bpy.context.active_object
-    neck.name = _prefixed_name(naming_prefix, "Cockpit_Neck")
-    neck.scale = (width, length, height)
-    bpy.ops.object.transform_apply(scale=True)
-    bpy.ops.object.shade_smooth()
+    neck = add_cube(
+        _prefixed_name(naming_prefix, "Cockpit_Neck"),
+        size=1,
+        location=(0, mid_y, 0),
+        scale=(width, length, height),
+        smooth=True,
+    )
     return neck
 
 
@@ -932,7 +1163,7 @@ def generate_engine_pylons(engines, hull, scale, naming_prefix=''):
         List of pylon objects.
     """
     pylons = []
-    hull_rear_y = -hull.dimensions.y * 0.5
+    hull_rear_y = -_evaluated_dimensions(hull).y * 0.5
 
     for i, engine in enumerate(engines):
         ex, ey, ez = engine.location
@@ -941,13 +1172,12 @@ def generate_engine_pylons(engines, hull, scale, naming_prefix=''):
         length = abs(ey - hull_rear_y) + scale * 0.02
         radius = scale * 0.03
 
-        bpy.ops.mesh.primitive_cylinder_add(
+        pylon = add_cylinder(
+            _prefixed_name(naming_prefix, f"Engine_Pylon_{i+1}"),
             radius=radius,
             depth=length,
             location=(mid_x, mid_y, ez),
         )
-        pylon = bpy.context.active_object
-        pylon.name = _prefixed_name(naming_prefix, f"Engine_Pylon_{i+1}")
         # Angle the pylon toward the engine offset
         pylon_angle = math.atan2(ex - mid_x, abs(ey - hull_rear_y)) if abs(ey - hull_rear_y) > 0 else 0
         pylon.rotation_euler = (math.radians(90), 0, pylon_angle)
@@ -973,7 +1203,7 @@ def generate_wing_roots(wings, hull, scale, naming_prefix=''):
         List of wing root fairing objects.
     """
     fairings = []
-    hull_half_w = hull.dimensions.x * 0.5
+    hull_half_w = _evaluated_dimensions(hull).x * 0.5
 
     for i, wing in enumerate(wings):
         wx = wing.location.x
@@ -983,12 +1213,13 @@ def generate_wing_roots(wings, hull, scale, naming_prefix=''):
         depth = wing.dimensions.y * 0.8
         height = wing.dimensions.z * 1.2
 
-        bpy.ops.mesh.primitive_cube_add(size=1, location=(mid_x, 0, 0))
-        fairing = bpy.context.active_object
-        fairing.name = _prefixed_name(naming_prefix, f"Wing_Root_{i+1}")
-        fairing.scale = (width, depth, height)
-        bpy.ops.object.transform_apply(scale=True)
-        bpy.ops.object.shade_smooth()
+        fairing = add_cube(
+            _prefixed_name(naming_prefix, f"Wing_Root_{i+1}"),
+            size=1,
+            location=(mid_x, 0, 0),
+            scale=(width, depth, height),
+            smooth=True,
+        )
         fairings.append(fairing)
 
     return fairings
@@ -1010,7 +1241,7 @@ def generate_weapon_pylons(weapons, hull, scale, naming_prefix=''):
         List of weapon pylon objects.
     """
     pylons = []
-    hull_bottom_z = -hull.dimensions.z * 0.5
+    hull_bottom_z = -_evaluated_dimensions(hull).z * 0.5
 
     for i, weapon in enumerate(weapons):
         wx, wy, wz = weapon.location
@@ -1018,13 +1249,12 @@ def generate_weapon_pylons(weapons, hull, scale, naming_prefix=''):
         length = abs(wz - hull_bottom_z) + scale * 0.01
         radius = scale * 0.015
 
-        bpy.ops.mesh.primitive_cylinder_add(
+        pylon = add_cylinder(
+            _prefixed_name(naming_prefix, f"Weapon_Pylon_{i+1}"),
             radius=radius,
             depth=length,
             location=(wx, wy, mid_z),
         )
-        pylon = bpy.context.active_object
-        pylon.name = _prefixed_name(naming_prefix, f"Weapon_Pylon_{i+1}")
         pylons.append(pylon)
 
     return pylons
@@ -13,6 +13,7 @@ EVEOFFLINE project: https://github.com/shifty81/EVEOFFLINE
 import bpy
 import random
 import math
+from . import material_registry
 
 
 # Station type configurations
@@ -224,7 +225,7 @@ def _generate_sections(count, scale, style):
         section.rotation_euler = (0, 0, angle)
         bpy.ops.object.transform_apply(scale=True, rotation=True)
 
-        _apply_station_material(section, f"Section_Mat_{i}", style['color'],
+        _apply_station_material(section, "Section_Mat", style['color'],
                                 style['emissive'])
         sections.append(section)
 
@@ -257,14 +258,8 @@ def _generate_docking_bays(count, scale, style):
         bpy.ops.object.transform_apply(scale=True)
         strip.parent = bay
 
-        mat = bpy.data.materials.new(name=f"Dock_Emissive_{i}")
-        mat.use_nodes = True
-        nodes = mat.node_tree.nodes
-        emission = nodes.new(type='ShaderNodeEmission')
-        emission.inputs['Color'].default_value = (*style['emissive'], 1.0)
-        emission.inputs['Strength'].default_value = 3.0
-        output = nodes.get('Material Output')
-        mat.node_tree.links.new(emission.outputs['Emission'], output.inputs['Surface'])
+        mat = material_registry.emission_material(
+            "Dock_Emissive", (*style['emissive'], 1.0), 3.0)
         strip.data.materials.append(mat)
 
         bays.append(bay)
@@ -287,7 +282,7 @@ def _generate_spires(scale, style):
         )
         spire = bpy.context.active_object
         spire.name = f"Spire_{i+1}"
-        _apply_station_material(spire, f"Spire_Mat_{i}", style['color'],
+        _apply_station_material(spire, "Spire_Mat", style['color'],
                                 style['emissive'])
         spires.append(spire)
 
@@ -305,7 +300,7 @@ def _generate_domes(scale, style):
         dome.scale = (1.0, 1.0, 0.5)
         bpy.ops.object.transform_apply(scale=True)
         bpy.ops.object.shade_smooth()
-        _apply_station_material(dome, f"Dome_Mat_{i}", style['color'],
+        _apply_station_material(dome, "Dome_Mat", style['color'],
                                 style['emissive'])
         domes.append(dome)
 
@@ -329,14 +324,7 @@ def _generate_hangars(scale, style):
 
 def _apply_station_material(obj, name, color, emissive):
     """Apply a basic station material with color and emissive accent."""
-    mat = bpy.data.materials.new(name=name)
-    mat.use_nodes = True
-    nodes = mat.node_tree.nodes
-    bsdf = nodes.get('Principled BSDF')
-    if bsdf:
-        bsdf.inputs['Base Color'].default_value = color
-        bsdf.inputs['Metallic'].default_value = 0.7
-        bsdf.inputs['Roughness'].default_value = 0.4
+    mat = material_registry.principled_material(name, color, 0.7, 0.4)
     obj.data.materials.append(mat)
 
 
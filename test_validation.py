@@ -43,6 +43,12 @@ def test_addon_structure():
         'damage_system.py',
         'power_system.py',
         'build_validator.py',
+        'fleet_simulator.py',
+        'bulk_validator.py',
+        'ship_layout.py',
+        'material_registry.py',
+        'batch_runner.py',
+        'output_cache.py',
     ]
     
     all_exist = True
@@ -81,6 +87,12 @@ def test_file_syntax():
         'damage_system.py',
         'power_system.py',
         'build_validator.py',
+        'fleet_simulator.py',
+        'bulk_validator.py',
+        'ship_layout.py',
+        'material_registry.py',
+        'batch_runner.py',
+        'output_cache.py',
     ]
     
     all_valid = True
@@ -172,6 +184,12 @@ def test_register_functions():
         'damage_system.py',
         'power_system.py',
         'build_validator.py',
+        'fleet_simulator.py',
+        'bulk_validator.py',
+        'ship_layout.py',
+        'material_registry.py',
+        'batch_runner.py',
+        'output_cache.py',
     ]
     
     all_valid = True
@@ -228,9 +246,9 @@ def test_turret_hardpoint_configs():
     print("\nTesting turret hardpoint configurations...")
 
     addon_path = os.path.dirname(os.path.abspath(__file__))
-    sg_path = os.path.join(addon_path, 'ship_generator.py')
+    sl_path = os.path.join(addon_path, 'ship_layout.py')
 
-    with open(sg_path, 'r') as f:
+    with open(sl_path, 'r') as f:
         content = f.read()
 
     tree = ast.parse(content)
@@ -244,7 +262,7 @@ def test_turret_hardpoint_configs():
                     break
 
     if ship_configs is None:
-        print("✗ SHIP_CONFIGS not found in ship_generator.py")
+        print("✗ SHIP_CONFIGS not found in ship_layout.py")
         return False
 
     if not isinstance(ship_configs, ast.Dict):
@@ -466,12 +484,12 @@ def test_hull_profiles():
 
     addon_path = os.path.dirname(os.path.abspath(__file__))
     sp_path = os.path.join(addon_path, 'ship_parts.py')
-    sg_path = os.path.join(addon_path, 'ship_generator.py')
+    sl_path = os.path.join(addon_path, 'ship_layout.py')
 
     with open(sp_path, 'r') as f:
         sp_content = f.read()
-    with open(sg_path, 'r') as f:
-        sg_content = f.read()
+    with open(sl_path, 'r') as f:
+        sl_content = f.read()
 
     all_valid = True
 
@@ -482,7 +500,7 @@ def test_hull_profiles():
     print("✓ HULL_PROFILES dictionary found")
 
     # Check that every ship class in SHIP_CONFIGS has a profile
-    tree = ast.parse(sg_content)
+    tree = ast.parse(sl_content)
     class_names = []
     for node in ast.walk(tree):
         if isinstance(node, ast.Assign):
@@ -516,6 +534,8 @@ def test_vertex_noise():
     checks = {
         'def _apply_hull_vertex_noise(': 'vertex noise helper function',
         'ship_class': 'ship_class parameter in generate_hull',
+        'foreach_get(': 'bulk vertex reads',
+        'foreach_set(': 'bulk vertex writes',
     }
 
     all_valid = True
@@ -526,6 +546,15 @@ def test_vertex_noise():
             print(f"✗ {description} not found")
             all_valid = False
 
+    # Hull deform passes must not loop over vertices in Python
+    for filename in ('ship_parts.py', 'ship_generator.py'):
+        with open(os.path.join(addon_path, filename), 'r') as f:
+            if 'in mesh.vertices' in f.read():
+                print(f"✗ {filename} still edits vertices one at a time")
+                all_valid = False
+            else:
+                print(f"✓ {filename} deforms vertices as arrays")
+
     return all_valid
 
 
@@ -828,6 +857,7 @@ def test_lod_generator():
         '"lod_level"': 'lod_level custom property',
         '"lod_ratio"': 'lod_ratio custom property',
         '"lod_distance"': 'lod_distance custom property',
+        '"lod_source"': 'lod_source custom property',
         'def register()': 'register function',
         'def unregister()': 'unregister function',
     }
@@ -854,11 +884,11 @@ def test_lod_generator():
     finally:
         del sys.modules['bpy']
 
-    sg_path = os.path.join(addon_path, 'ship_generator.py')
-    with open(sg_path, 'r') as f:
-        sg_content = f.read()
+    sl_path = os.path.join(addon_path, 'ship_layout.py')
+    with open(sl_path, 'r') as f:
+        sl_content = f.read()
 
-    tree = ast.parse(sg_content)
+    tree = ast.parse(sl_content)
     for node in ast.walk(tree):
         if isinstance(node, ast.Assign):
             for target in node.targets:
@@ -968,6 +998,16 @@ def test_animation_system():
     return all_valid
 
 
+class _UntouchableDict(dict):
+    """Dict that fails the test if its values are iterated."""
+
+    def values(self):
+        raise AssertionError("bricks were iterated")
+
+    def __iter__(self):
+        raise AssertionError("bricks were iterated")
+
+
 def test_damage_system():
     """Test that damage_system.py has proper structure and functions"""
     print("\nTesting damage system module...")
@@ -1005,6 +1045,21 @@ def test_damage_system():
         'def tick(': 'tick method',
         'def total_hull_weight(': 'total_hull_weight method',
         'def get_damage_summary(': 'get_damage_summary method',
+        'CONNECTIVITY_MODES': 'connectivity mode constants',
+        'def verify_connections(': 'verify_connections method',
+        'def _descendant_counts(': 'iterative load count pass',
+        'def get_critical_bricks(': 'get_critical_bricks method',
+        'def apply_damage_batch(': 'apply_damage_batch method',
+        'def query_sphere(': 'query_sphere spatial query',
+        'def query_box(': 'query_box spatial query',
+        'def query_ray(': 'query_ray spatial query',
+        'def apply_area_damage(': 'apply_area_damage method',
+        'class ArrayShipDamageState': 'ArrayShipDamageState class',
+        '_unsupported': 'unsupported brick set',
+        'class DamageSnapshot': 'DamageSnapshot class',
+        'class DamageDelta': 'DamageDelta class',
+        'def snapshot(': 'snapshot method',
+        'def restore(': 'restore method',
         'def register()': 'register function',
         'def unregister()': 'unregister function',
     }
@@ -1058,6 +1113,252 @@ def test_damage_system():
         print("✗ Spine destruction did not cascade correctly")
         all_valid = False
 
+    # Incremental connectivity must match a full rebuild after every hit
+    import random as _random
+    rng = _random.Random(7)
+    cells = {(0, 0, 0): 'STRUCTURAL_SPINE'}
+    brick_types = sorted(ds.BRICK_HP)
+    while len(cells) < 120:
+        cx, cy, cz = rng.choice(sorted(cells))
+        dx, dy, dz = rng.choice(ds.ShipDamageState._NEIGHBOUR_OFFSETS)
+        cells.setdefault((cx + dx, cy + dy, cz + dz), rng.choice(brick_types))
+    blob = [{'type': bt, 'pos': [c * 2 for c in cell]}
+            for cell, bt in cells.items()]
+    inc = ds.ShipDamageState.from_ship_dna(
+        blob, grid_size=2.0, seed=3, connectivity_mode='VERIFY')
+    full = ds.ShipDamageState.from_ship_dna(
+        blob, grid_size=2.0, seed=3, connectivity_mode='REBUILD')
+    order = sorted(inc.bricks)
+    rng.shuffle(order)
+    matched = True
+    for bid in order[:80]:
+        inc.apply_damage(bid, 99999)
+        full.apply_damage(bid, 99999)
+        if (sorted(inc.get_unsupported_bricks())
+                != sorted(full.get_unsupported_bricks())):
+            matched = False
+            break
+    if matched and not inc.verify_connections():
+        print("✓ Incremental connectivity matches full rebuild")
+    else:
+        print("✗ Incremental connectivity diverged from full rebuild")
+        all_valid = False
+
+    # A hull section with an alternate path survives losing its parent
+    ring = [
+        {'type': 'STRUCTURAL_SPINE', 'pos': [0, 0, 0]},
+        {'type': 'HULL_PLATE', 'pos': [1, 0, 0]},
+        {'type': 'HULL_PLATE', 'pos': [1, 1, 0]},
+        {'type': 'HULL_PLATE', 'pos': [0, 1, 0]},
+        {'type': 'HULL_PLATE', 'pos': [1, 2, 0]},
+    ]
+    ring_state = ds.ShipDamageState.from_ship_dna(ring, seed=1)
+    ring_state.apply_damage(1, 99999)
+    if (not ring_state.get_unsupported_bricks()
+            and ring_state.bricks[0].load_count == 3
+            and not ring_state.verify_connections()):
+        print("✓ Orphaned bricks reattach through alternate neighbours")
+    else:
+        print("✗ Orphaned bricks did not reattach through alternate path")
+        all_valid = False
+
+    # Load counts on a chain far deeper than the recursion limit
+    chain_len = sys.getrecursionlimit() * 3
+    chain = [{'type': 'STRUCTURAL_SPINE', 'pos': [0, 0, 0]}]
+    chain += [{'type': 'PIPE', 'pos': [0, i, 0]}
+              for i in range(1, chain_len)]
+    chain_state = ds.ShipDamageState.from_ship_dna(chain, seed=1)
+    if chain_state.bricks[0].load_count == chain_len - 1:
+        print("✓ Load counts computed without recursion on long chains")
+    else:
+        print(f"✗ Expected spine load {chain_len - 1}, "
+              f"got {chain_state.bricks[0].load_count}")
+        all_valid = False
+
+    chain_state.apply_damage(10, 99999)
+    if (chain_state.bricks[0].load_count == 9
+            and chain_state.get_critical_bricks(2) == [0, 1]):
+        print("✓ Load counts update when a subtree detaches")
+    else:
+        print("✗ Load counts not updated after subtree detached")
+        all_valid = False
+
+    # Batched hits: same outcome as sequential hits, one structural pass
+    hits = [(bid, 400) for bid in order[80:110]] + [(order[85], 400)]
+    seq = ds.ShipDamageState.from_ship_dna(blob, grid_size=2.0, seed=9)
+    batch = ds.ShipDamageState.from_ship_dna(
+        blob, grid_size=2.0, seed=9, connectivity_mode='REBUILD')
+    seq_events = []
+    for bid, amount in hits:
+        seq_events.extend(seq.apply_damage(bid, amount))
+    rebuilds = []
+    original_rebuild = batch.rebuild_connections
+    batch.rebuild_connections = lambda: (rebuilds.append(1),
+                                         original_rebuild())
+    batch_events = batch.apply_damage_batch(hits)
+    strip = [e[:2] for e in seq_events if e[0] != 'unsupported_bricks']
+    if (sorted(seq.bricks) == sorted(batch.bricks)
+            and [s_.condition for s_ in seq.salvage]
+            == [s_.condition for s_ in batch.salvage]
+            and [e[:2] for e in batch_events[:-1]] == strip
+            and batch_events[-1][0] == 'unsupported_bricks'
+            and len(rebuilds) == 1):
+        print("✓ apply_damage_batch matches sequential hits with one pass")
+    else:
+        print("✗ apply_damage_batch diverged from sequential hits")
+        all_valid = False
+
+    # Spatial queries agree with a brute-force scan
+    import math as _math
+    aoe = ds.ShipDamageState.from_ship_dna(blob, grid_size=2.0, seed=5)
+    center, radius = (2.0, -1.0, 3.0), 5.0
+    expected = sorted(
+        (_math.dist(b.pos, center), b.id) for b in aoe.bricks.values()
+        if _math.dist(b.pos, center) <= radius)
+    sphere = aoe.query_sphere(center, radius)
+    if ([bid for bid, _, _ in sphere] == [bid for _, bid in expected]
+            and all(0.0 <= f <= 1.0 for _, _, f in sphere)):
+        print("✓ query_sphere matches brute-force distance scan")
+    else:
+        print("✗ query_sphere disagrees with brute-force scan")
+        all_valid = False
+
+    box = aoe.query_box((-4, -4, -4), (4, 4, 4))
+    if box == sorted(b.id for b in aoe.bricks.values()
+                     if all(-4 <= c <= 4 for c in b.pos)):
+        print("✓ query_box matches brute-force bounds scan")
+    else:
+        print("✗ query_box disagrees with brute-force scan")
+        all_valid = False
+
+    line = ds.ShipDamageState.from_ship_dna(
+        [{'type': 'HULL_PLATE', 'pos': [x * 2, 0, 0]} for x in range(5)],
+        grid_size=2.0)
+    ray = line.query_ray((-5.0, 0.0, 0.0), (1, 0, 0), 20.0, max_hits=3)
+    if [bid for bid, _ in ray] == [0, 1, 2] and abs(ray[0][1] - 4.0) < 1e-9:
+        print("✓ query_ray walks grid cells in hit order")
+    else:
+        print(f"✗ query_ray returned unexpected hits: {ray}")
+        all_valid = False
+
+    # Unbounded rays stop at the grid's bounding box instead of walking
+    # forever (a miss with max_distance=inf used to never return)
+    import math
+    missed = line.query_ray((-5.0, 5.0, 0.0), (1, 0, 0), math.inf)
+    behind = line.query_ray((-5.0, 0.0, 0.0), (-1, 0, 0), math.inf)
+    through = line.query_ray((-1e6, 0.0, 0.0), (1, 0, 0), math.inf)
+    if (missed == [] and behind == []
+            and [bid for bid, _ in through] == [0, 1, 2, 3, 4]
+            and abs(through[0][1] - (1e6 - 1.0)) < 1e-6):
+        print("✓ query_ray with an infinite range is clipped to the grid")
+    else:
+        print(f"✗ Unexpected infinite-range rays: {missed}, {behind}, "
+              f"{through}")
+        all_valid = False
+
+    events = line.apply_area_damage((0, 0, 0), 3.0, 300, falloff='LINEAR')
+    if (('brick_destroyed', 0) in events and 1 in line.bricks
+            and abs(line.bricks[1].hp - (150 - 100)) < 1e-6):
+        print("✓ apply_area_damage scales damage by distance falloff")
+    else:
+        print("✗ apply_area_damage did not apply falloff correctly")
+        all_valid = False
+
+    # Event-driven tick only visits unsupported bricks
+    intact = ds.ShipDamageState.from_ship_dna(chain[:50], seed=1)
+    intact.bricks = _UntouchableDict(intact.bricks)
+    quiet = intact.tick() == [] and not intact.get_unsupported_bricks()
+    intact.bricks = dict(intact.bricks)
+    intact.apply_damage(40, 99999)
+    for _ in range(ds.DETACH_TIMEOUT - 1):
+        intact.tick()
+    timers = {bid: b.unsupported_timer for bid, b in intact.bricks.items()}
+    detached = intact.tick()
+    if (quiet and detached == list(range(41, 50))
+            and all(timers[bid] == ds.DETACH_TIMEOUT - 1 for bid in detached)
+            and all(timers[bid] == 0 for bid in range(40))):
+        print("✓ tick only counts down unsupported bricks")
+    else:
+        print("✗ Event-driven tick touched or missed bricks")
+        all_valid = False
+
+    # Snapshots: rollback + replay is bit-identical, deltas chain up
+    replay = ds.ShipDamageState.from_ship_dna(blob, grid_size=2.0, seed=11)
+    frames = []
+    volleys = [[(bid, 120) for bid in order[i:i + 4]]
+               for i in range(0, 80, 4)]
+    for volley in volleys:
+        frames.append(replay.snapshot())
+        replay.apply_damage_batch(volley)
+        replay.tick()
+    final = replay.snapshot()
+    replay.restore(frames[5])
+    for volley in volleys[5:]:
+        replay.apply_damage_batch(volley)
+        replay.tick()
+    if replay.snapshot() == final and len(final.salvage) > 0:
+        print("✓ Restore + replay reproduces state and salvage rolls")
+    else:
+        print("✗ Replay after restore diverged")
+        all_valid = False
+
+    chained = frames[0]
+    for prev, cur in zip(frames, frames[1:] + [final]):
+        chained = chained.apply_delta(cur.delta_from(prev))
+    if (chained == final
+            and ds.DamageSnapshot.from_bytes(final.to_bytes()) == final
+            and final.delta_from(final).empty):
+        print("✓ Snapshot deltas and binary encoding round-trip")
+    else:
+        print("✗ Snapshot delta / binary round-trip mismatch")
+        all_valid = False
+
+    # Array-backed state mirrors the object state (needs NumPy)
+    if ds.np is None:
+        print("⚠ NumPy not available — skipping ArrayShipDamageState checks")
+    else:
+        arr = ds.ArrayShipDamageState.from_ship_dna(blob, grid_size=2.0,
+                                                    seed=4)
+        obj = ds.ShipDamageState.from_ship_dna(blob, grid_size=2.0, seed=4)
+        same = True
+        for bid in order[:60]:
+            same &= ([e[:2] for e in arr.apply_damage(bid, 250)]
+                     == [e[:2] for e in obj.apply_damage(bid, 250)])
+            same &= arr.tick() == obj.tick()
+        for _ in range(ds.DETACH_TIMEOUT):
+            same &= arr.tick() == obj.tick()
+        same &= arr.get_damage_summary() == obj.get_damage_summary()
+        same &= abs(arr.total_mass() - obj.total_mass()) < 1e-6
+        same &= abs(arr.total_hull_weight() - obj.total_hull_weight()) < 1e-6
+        same &= arr.get_unsupported_bricks() == obj.get_unsupported_bricks()
+        if same:
+            print("✓ ArrayShipDamageState matches ShipDamageState")
+        else:
+            print("✗ ArrayShipDamageState diverged from ShipDamageState")
+            all_valid = False
+
+    # Change feed: destroyed ids, connectivity flips, detached ids
+    chain = ds.ShipDamageState.from_ship_dna(
+        [{'type': 'STRUCTURAL_SPINE', 'pos': [0, 0, 0]}]
+        + [{'type': 'HULL_PLATE', 'pos': [0, i, 0]} for i in range(1, 5)])
+    feed = chain.subscribe_changes()
+    mark = chain.snapshot()
+    chain.apply_damage(2, 99999)
+    first = feed.drain()
+    for _ in range(ds.DETACH_TIMEOUT):
+        chain.tick()
+    second = feed.drain()
+    chain.restore(mark)
+    third = feed.drain()
+    if (first['destroyed'] == [2]
+            and first['connectivity'] == [(3, False), (4, False)]
+            and second['detached'] == [3, 4] and not second['connectivity']
+            and third['reset'] and not feed.drain()['reset']):
+        print("✓ Change feed publishes destroyed, flipped and detached ids")
+    else:
+        print(f"✗ Unexpected change feed: {first}, {second}, {third}")
+        all_valid = False
+
     return all_valid
 
 
@@ -1179,6 +1480,218 @@ def test_power_system():
             print(f"✗ CAPACITOR_SIZE missing entry for {ship_class}")
             all_valid = False
 
+    # Running totals follow toggles, replacements and removals
+    mixed = ps.ShipPowerState.from_ship_dna({'class': 'FRIGATE', 'bricks': [
+        {'type': 'REACTOR_CORE', 'pos': [0, 0, 0]},
+        {'type': 'SHIELD_EMITTER', 'pos': [1, 0, 0]},
+        {'type': 'ENGINE_BLOCK', 'pos': [2, 0, 0]},
+        {'type': 'HARDPOINT_MOUNT', 'pos': [3, 0, 0]},
+    ]})
+    mixed.set_connected(1, False)
+    mixed.components[2].active = False
+    mixed.components[3] = ps.PowerComponent('THRUSTER')
+    mixed.remove_brick(0)
+    del mixed.components[2]
+    expected = (0.0, 5.0)
+    if (mixed.total_generation, mixed.total_consumption) == expected:
+        print("✓ Running power totals track component changes")
+    else:
+        print(f"✗ Expected totals {expected}, got "
+              f"{(mixed.total_generation, mixed.total_consumption)}")
+        all_valid = False
+
+    mixed.set_connected(1, True)
+    for _ in range(200):
+        mixed.tick(dt=1.0)
+    fresh_total = sum(c.consumption for c in mixed.components.values()
+                      if c.active and c.connected)
+    if (mixed.disabled_ids == {1}
+            and mixed.total_consumption == fresh_total == 5.0):
+        print("✓ Capacitor drain disables only live non-essential systems")
+    else:
+        print(f"✗ Unexpected drain state: {mixed.disabled_ids}, "
+              f"{mixed.total_consumption}")
+        all_valid = False
+
+    # Graph routing: islands of REACTOR_CORE / POWER_BUS conductors
+    ds_path = os.path.join(addon_path, 'damage_system.py')
+    spec3 = importlib.util.spec_from_file_location("damage_system", ds_path)
+    ds = importlib.util.module_from_spec(spec3)
+    spec3.loader.exec_module(ds)
+
+    # reactor(0) bus(1) bus(2) bus(3) reactor(4) along x, shields above
+    # the reactors, and a shield touching no conductor at all
+    grid_bricks = [
+        {'type': 'REACTOR_CORE', 'pos': [0, 0, 0]},
+        {'type': 'POWER_BUS', 'pos': [1, 0, 0]},
+        {'type': 'POWER_BUS', 'pos': [2, 0, 0]},
+        {'type': 'POWER_BUS', 'pos': [3, 0, 0]},
+        {'type': 'REACTOR_CORE', 'pos': [4, 0, 0]},
+        {'type': 'SHIELD_EMITTER', 'pos': [0, 1, 0]},
+        {'type': 'SHIELD_EMITTER', 'pos': [4, 1, 0]},
+        {'type': 'STRUCTURAL_SPINE', 'pos': [2, -1, 0]},
+        {'type': 'SHIELD_EMITTER', 'pos': [2, -2, 0]},
+    ]
+    damage = ds.ShipDamageState.from_ship_dna(grid_bricks, 1.0)
+    graph = ps.ShipPowerState.from_damage_state(
+        damage, ship_class='FRIGATE', routing='GRAPH')
+    if (len(graph.network.islands) == 1
+            and not graph.components[8].connected
+            and graph.total_consumption == 30.0
+            and graph.capacitor == graph.capacitor_max):
+        print("✓ Conductors form one island feeding adjacent systems")
+    else:
+        print(f"✗ Unexpected islands: {graph.get_island_summaries()}")
+        all_valid = False
+
+    damage.apply_damage(2, 99999)
+    graph.sync_with_damage_state(damage)
+    islands = graph.get_island_summaries()
+    shares = sorted((i['conductors'], i['members'], i['capacitor_max'])
+                    for i in islands)
+    per_conductor = graph.capacitor_max / 5
+    if (shares == [(2, 1, per_conductor * 2), (2, 1, per_conductor * 2)]
+            and graph.get_power_summary()['power_islands'] == 2):
+        print("✓ Destroying a bus splits the island and its capacitor")
+    else:
+        print(f"✗ Unexpected split: {islands}")
+        all_valid = False
+
+    damage.apply_damage(0, 99999)
+    graph.sync_with_damage_state(damage)
+    islands = graph.get_island_summaries()
+    if (sorted(i['members'] for i in islands) == [0, 1]
+            and not graph.components[5].connected
+            and graph.total_generation == 100.0):
+        print("✓ Systems lose power with the island that fed them")
+    else:
+        print(f"✗ Unexpected islands after reactor loss: {islands}")
+        all_valid = False
+
+    # Syncing from the damage change feed matches a full rescan
+    ship = ds.ShipDamageState.from_ship_dna(grid_bricks, 1.0)
+    fed = ps.ShipPowerState.from_damage_state(ship, ship_class='FRIGATE')
+    fed.sync_with_damage_state(ship)
+    ship.apply_damage(7, 99999)   # spine: everything loses support
+    fed.sync_with_damage_state(ship)
+    ship.apply_damage(1, 99999)
+    fed.sync_with_damage_state(ship)
+    rescanned = ps.ShipPowerState.from_damage_state(ship,
+                                                    ship_class='FRIGATE')
+    if (fed.get_power_summary() == rescanned.get_power_summary()
+            and sorted(fed.components) == sorted(rescanned.components)
+            and not any(c.connected for c in fed.components.values())):
+        print("✓ Feed-driven sync matches a full damage-state rescan")
+    else:
+        print(f"✗ Feed-driven sync diverged: {fed.get_power_summary()}")
+        all_valid = False
+
+    try:
+        ps.ShipPowerState.from_damage_state(damage, routing='WIRELESS')
+        print("✗ Unknown routing mode should raise ValueError")
+        all_valid = False
+    except ValueError:
+        print("✓ Unknown routing mode rejected")
+
+    # deepcopy / pickle rebuild the component map and running totals
+    import copy
+    import pickle
+    source = ps.ShipPowerState.from_ship_dna({'class': 'FRIGATE', 'bricks': [
+        {'type': 'REACTOR_CORE', 'pos': [0, 0, 0]},
+        {'type': 'SHIELD_EMITTER', 'pos': [1, 0, 0]},
+        {'type': 'POWER_BUS', 'pos': [2, 0, 0]},
+    ]})
+    source.components[1].active = False
+    sys.modules['power_system'] = ps   # pickle looks classes up by module
+    try:
+        clones = [copy.deepcopy(source),
+                  pickle.loads(pickle.dumps(source)),
+                  copy.deepcopy(graph)]
+        graph_size = len(pickle.dumps(graph))
+    except Exception as exc:
+        print(f"✗ ShipPowerState copy failed: {exc!r}")
+        clones = []
+        all_valid = False
+    finally:
+        del sys.modules['power_system']
+    if clones:
+        dna_copy, pickled, graph_copy = clones
+        dna_copy.components[1].active = True
+        del pickled.components[0]
+        if (graph._damage_feed is not None
+                and graph_copy._damage_feed is None
+                and isinstance(dna_copy.components, ps._ComponentMap)
+                and all(c._owner is dna_copy
+                        for c in dna_copy.components.values())
+                and dna_copy.total_consumption
+                == source.total_consumption + 15.0
+                and pickled.total_generation == 0.0
+                and source.total_generation == 100.0
+                and graph_copy.get_power_summary()
+                == graph.get_power_summary()
+                and graph_copy.get_island_summaries()
+                == graph.get_island_summaries()):
+            print("✓ ShipPowerState survives deepcopy and pickle")
+        else:
+            print("✗ Copied ShipPowerState totals diverged")
+            all_valid = False
+
+        # Copies leave the damage feed behind and resync from scratch
+        damage.apply_damage(3, 99999)
+        graph_copy.sync_with_damage_state(damage)
+        graph.sync_with_damage_state(damage)
+        if (graph_size < 8192
+                and graph_copy._damage_feed is not None
+                and graph_copy.get_power_summary()
+                == graph.get_power_summary()):
+            print("✓ Copied power states resync without the damage feed")
+        else:
+            print("✗ Copied power state did not resync after damage")
+            all_valid = False
+
+    # Vectorised multi-ship engine mirrors per-ship ticks (needs NumPy)
+    if ps.np is None:
+        print("⚠ NumPy not available — skipping PowerEngine checks")
+    else:
+        engine = ps.PowerEngine()
+        reference = {}
+        for ship_id, ship_class in enumerate(['SHUTTLE', 'FRIGATE',
+                                              'SHUTTLE', 'CRUISER']):
+            bricks = [{'type': 'SHIELD_EMITTER', 'pos': [0, 0, 0]},
+                      {'type': 'SENSOR_MAST', 'pos': [1, 0, 0]},
+                      {'type': 'THRUSTER', 'pos': [2, 0, 0]}]
+            if ship_id % 2:
+                bricks.append({'type': 'REACTOR_CORE', 'pos': [3, 0, 0]})
+            state = ps.ShipPowerState.from_ship_dna(
+                {'class': ship_class, 'bricks': bricks})
+            engine.add_ship(state, ship_id=ship_id)
+            reference[ship_id] = state
+
+        same = True
+        for step in range(60):
+            if step == 10:
+                engine.remove_ship(2)
+                del reference[2]
+            if step == 20:
+                engine.remove_brick(0, 2)
+                reference[0].remove_brick(2)
+                engine.set_connected(0, 0, False)
+                reference[0].set_connected(0, False)
+            expected = {}
+            for ship_id, state in reference.items():
+                events = state.tick(dt=5.0)
+                if events:
+                    expected[ship_id] = events
+            same &= engine.tick(dt=5.0) == expected
+            same &= all(engine.get_power_summary(ship_id)
+                        == state.get_power_summary()
+                        for ship_id, state in reference.items())
+        if same and engine.ship_count == 3:
+            print("✓ PowerEngine matches per-ship ShipPowerState ticks")
+        else:
+            print("✗ PowerEngine diverged from ShipPowerState")
+            all_valid = False
+
     return all_valid
 
 
@@ -1212,6 +1725,10 @@ def test_build_validator():
         'def check_connectivity(': 'check_connectivity method',
         'def check_power_connectivity(': 'check_power_connectivity method',
         'def from_ship_dna(': 'from_ship_dna constructor',
+        'class _ConnectivityIndex': 'disjoint-set connectivity index',
+        'def is_connected_to_spine(': 'is_connected_to_spine query',
+        'def is_powered(': 'is_powered query',
+        'def build_compatibility_table(': 'precomputed compatibility table',
         'def register()': 'register function',
         'def unregister()': 'unregister function',
     }
@@ -1261,6 +1778,1033 @@ def test_build_validator():
         print("✗ check_connectivity failed")
         all_valid = False
 
+    # Live connectivity / power state follows placements and removals
+    validator.place_brick('HULL_PLATE', (2, 0, 0))
+    validator.place_brick('REACTOR_CORE', (4, 0, 0))
+    validator.place_brick('HULL_PLATE', (8, 0, 0))
+    live_ok = (validator.is_connected_to_spine((4, 0, 0))
+               and validator.is_powered((0, 0, 0))
+               and not validator.is_connected_to_spine((8, 0, 0))
+               and not validator.check_connectivity()
+               and validator.check_power_connectivity() == [(4, 0, 0)])
+    validator.place_brick('POWER_BUS', (6, 0, 0))
+    live_ok &= validator.check_connectivity()
+    validator.remove_brick((2, 0, 0))
+    live_ok &= (not validator.is_connected_to_spine((4, 0, 0))
+                and validator.is_powered((8, 0, 0))
+                and not validator.is_powered((0, 0, 0))
+                and validator.check_power_connectivity() == [(0, 0, 0)])
+    if live_ok:
+        print("✓ Disjoint-set index tracks spine and power connectivity")
+    else:
+        print("✗ Disjoint-set connectivity index out of date")
+        all_valid = False
+
+    # Precomputed compatibility table agrees with a per-hardpoint check
+    table = bv.get_compatibility_table(bs.BRICK_TYPES)
+    mismatches = [
+        key for key in table
+        if table[key] != any(
+            (ra, rb) in bv.COMPATIBLE_ROLES
+            for ra in bv._roles_facing(bs.BRICK_TYPES[key[0]], key[1])
+            for rb in bv._roles_facing(bs.BRICK_TYPES[key[2]],
+                                       bv._neg(key[1])))
+    ]
+    n_types = len(bs.BRICK_TYPES)
+    if (not mismatches and len(table) == n_types * n_types * 6
+            and bv.get_compatibility_table(dict(bs.BRICK_TYPES)) is table):
+        print("✓ Hardpoint compatibility table matches direct checks")
+    else:
+        print(f"✗ Compatibility table mismatches: {mismatches[:5]}")
+        all_valid = False
+
+    return all_valid
+
+
+def test_fleet_simulator():
+    """Test that fleet_simulator.py has proper structure and functions"""
+    print("\nTesting fleet simulator module...")
+
+    addon_path = os.path.dirname(os.path.abspath(__file__))
+    fs_path = os.path.join(addon_path, 'fleet_simulator.py')
+
+    if not os.path.exists(fs_path):
+        print("✗ fleet_simulator.py not found")
+        return False
+
+    valid, error = test_python_syntax(fs_path)
+    if not valid:
+        print(f"✗ fleet_simulator.py has syntax error: {error}")
+        return False
+    print("✓ fleet_simulator.py has valid syntax")
+
+    with open(fs_path, 'r') as f:
+        content = f.read()
+
+    checks = {
+        'class FleetDamageSimulator': 'FleetDamageSimulator class',
+        'def add_ship(': 'add_ship method',
+        'def queue_damage(': 'queue_damage method',
+        'def tick(': 'tick method',
+        'def get_tick_stats(': 'get_tick_stats method',
+        'def get_summaries(': 'get_summaries method',
+        'def register()': 'register function',
+        'def unregister()': 'unregister function',
+    }
+
+    all_valid = True
+    for pattern, description in checks.items():
+        if pattern in content:
+            print(f"✓ {description} found")
+        else:
+            print(f"✗ {description} not found")
+            all_valid = False
+
+    # Functional test — sibling modules are imported by absolute name
+    import importlib.util
+    if addon_path not in sys.path:
+        sys.path.insert(0, addon_path)
+    spec = importlib.util.spec_from_file_location("fleet_simulator", fs_path)
+    fs = importlib.util.module_from_spec(spec)
+    sys.modules['fleet_simulator'] = fs
+    spec.loader.exec_module(fs)
+
+    def make_dna(length):
+        bricks = [{'type': 'STRUCTURAL_SPINE', 'pos': [0, 0, 0]},
+                  {'type': 'REACTOR_CORE', 'pos': [0, 0, 1]}]
+        bricks += [{'type': 'SHIELD_EMITTER', 'pos': [0, i, 0]}
+                   for i in range(1, length)]
+        return {'class': 'FRIGATE', 'seed': length, 'grid_size': 1.0,
+                'bricks': bricks}
+
+    outcomes = []
+    for workers in (1, 2):
+        with fs.FleetDamageSimulator(workers=workers) as fleet:
+            ships = [fleet.add_ship(make_dna(n)) for n in (4, 6, 8)]
+            fleet.queue_damage(ships[1], [(2, 9999), (3, 9999)])
+            events = fleet.tick(dt=1 / 60)
+            for _ in range(60):
+                fleet.tick(dt=1 / 60)
+            stats = fleet.get_tick_stats()
+            outcomes.append((sorted(events), fleet.get_summaries()))
+
+    if outcomes[0][0] == [1] and stats['ticks'] == 61 and stats['mean'] > 0:
+        print("✓ Fleet tick applies queued hits and reports wall time")
+    else:
+        print(f"✗ Unexpected fleet tick result: {outcomes[0][0]}, {stats}")
+        all_valid = False
+
+    summary = outcomes[0][1][1]
+    if (summary['alive_bricks'] == 2
+            and summary['power']['total_consumption'] == 0.0):
+        print("✓ Detached bricks leave ship damage and power state")
+    else:
+        print(f"✗ Unexpected ship summary: {summary}")
+        all_valid = False
+
+    if outcomes[0][1] == outcomes[1][1]:
+        print("✓ Process-sharded fleet matches in-process fleet")
+    else:
+        print("✗ Process-sharded fleet diverged from in-process fleet")
+        all_valid = False
+
+    # A failing shard must not leave other shards' replies in their pipes
+    with fs.FleetDamageSimulator(workers=2) as fleet:
+        ships = [fleet.add_ship(make_dna(n)) for n in (4, 6)]
+        fleet.queue_damage(ships[0], [(1, 'not a number')])
+        try:
+            fleet.tick(dt=1 / 60)
+            error = None
+        except RuntimeError as exc:
+            error = str(exc)
+        summaries = fleet.get_summaries()
+    if (error and 'shard 0' in error and 'shard 1' not in error
+            and sorted(summaries) == ships
+            and all('alive_bricks' in s for s in summaries.values())):
+        print("✓ Shard errors are reported after every reply is read")
+    else:
+        print(f"✗ Unexpected shard error handling: {error}, {summaries}")
+        all_valid = False
+
+    return all_valid
+
+
+def test_bulk_validator():
+    """Test that bulk_validator.py validates DNA libraries in bulk"""
+    print("\nTesting bulk validator module...")
+
+    addon_path = os.path.dirname(os.path.abspath(__file__))
+    bv_path = os.path.join(addon_path, 'bulk_validator.py')
+
+    if not os.path.exists(bv_path):
+        print("✗ bulk_validator.py not found")
+        return False
+
+    valid, error = test_python_syntax(bv_path)
+    if not valid:
+        print(f"✗ bulk_validator.py has syntax error: {error}")
+        return False
+    print("✓ bulk_validator.py has valid syntax")
+
+    with open(bv_path, 'r') as f:
+        content = f.read()
+
+    checks = {
+        'class BulkValidator': 'BulkValidator class',
+        'def iter_dna_sources(': 'iter_dna_sources function',
+        'def validate_dna(': 'validate_dna function',
+        'def run(': 'run method',
+        'def main(': 'command-line entry point',
+        'def register()': 'register function',
+        'def unregister()': 'unregister function',
+    }
+
+    all_valid = True
+    for pattern, description in checks.items():
+        if pattern in content:
+            print(f"✓ {description} found")
+        else:
+            print(f"✗ {description} not found")
+            all_valid = False
+
+    # Functional test — sibling modules are imported by absolute name
+    import importlib.util
+    import io
+    import json
+    import tempfile
+    if addon_path not in sys.path:
+        sys.path.insert(0, addon_path)
+    spec = importlib.util.spec_from_file_location("bulk_validator", bv_path)
+    bulk = importlib.util.module_from_spec(spec)
+    sys.modules['bulk_validator'] = bulk
+    spec.loader.exec_module(bulk)
+
+    good = {'class': 'FRIGATE', 'seed': 1, 'grid_size': 1.0, 'bricks': [
+        {'type': 'STRUCTURAL_SPINE', 'pos': [0, 0, 0]},
+        {'type': 'REACTOR_CORE', 'pos': [0, 0, 1]}]}
+    floating = {'class': 'FRIGATE', 'seed': 2, 'grid_size': 1.0, 'bricks': [
+        {'type': 'STRUCTURAL_SPINE', 'pos': [0, 0, 0]},
+        {'type': 'REACTOR_CORE', 'pos': [0, 0, 5]}]}
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for name, dna in (('a_good.json', good), ('b_floating.json', floating),
+                          ('c_good.json', good)):
+            with open(os.path.join(tmp, name), 'w') as f:
+                json.dump(dna, f)
+        with open(os.path.join(tmp, 'd_broken.json'), 'w') as f:
+            f.write('{not json')
+
+        runs = []
+        for workers in (1, 2):
+            validator = bulk.BulkValidator(workers=workers, chunksize=1)
+            summaries = list(validator.run(bulk.iter_dna_sources(tmp)))
+            runs.append(([(os.path.basename(s['source']), s['valid'])
+                          for s in summaries], validator.stats))
+
+        expected = [('a_good.json', True), ('b_floating.json', False),
+                    ('c_good.json', True), ('d_broken.json', False)]
+        stats = runs[0][1]
+        if (runs[0][0] == expected and stats['ships'] == 4
+                and stats['invalid'] == 2 and stats['bricks'] == 6):
+            print("✓ Directory validation reports each ship in order")
+        else:
+            print(f"✗ Unexpected bulk results: {runs[0]}")
+            all_valid = False
+
+        if runs[1][0] == expected:
+            print("✓ Process pool matches in-process validation")
+        else:
+            print(f"✗ Process pool diverged: {runs[1][0]}")
+            all_valid = False
+
+        validator = bulk.BulkValidator(workers=1, fail_fast=True)
+        summaries = list(validator.run(bulk.iter_dna_sources(tmp)))
+        if len(summaries) == 2 and validator.stats['stopped_early']:
+            print("✓ Fail-fast stops at the first invalid ship")
+        else:
+            print(f"✗ Fail-fast returned {len(summaries)} ships")
+            all_valid = False
+
+        stream = io.StringIO(json.dumps(good) + '\n\n' + json.dumps(good))
+        out, err = io.StringIO(), io.StringIO()
+        code = bulk.main(['-', '--workers', '1'], stdin=stream,
+                         stdout=out, stderr=err)
+        lines = [json.loads(line) for line in out.getvalue().splitlines()]
+        if (code == 0 and [l['source'] for l in lines]
+                == ['<stdin>:1', '<stdin>:3']
+                and json.loads(err.getvalue())['ships'] == 2):
+            print("✓ CLI streams JSON lines and throughput stats")
+        else:
+            print(f"✗ Unexpected CLI output: {code}, {out.getvalue()}")
+            all_valid = False
+
+    return all_valid
+
+
+def test_ship_layout():
+    """Test that ship_layout.py reproduces the generator's Ship DNA headlessly"""
+    print("\nTesting headless ship layout module...")
+
+    addon_path = os.path.dirname(os.path.abspath(__file__))
+    sl_path = os.path.join(addon_path, 'ship_layout.py')
+
+    if not os.path.exists(sl_path):
+        print("✗ ship_layout.py not found")
+        return False
+
+    valid, error = test_python_syntax(sl_path)
+    if not valid:
+        print(f"✗ ship_layout.py has syntax error: {error}")
+        return False
+    print("✓ ship_layout.py has valid syntax")
+
+    with open(sl_path, 'r') as f:
+        content = f.read()
+
+    checks = {
+        'SHIP_CONFIGS': 'ship configurations',
+        'def plan_ship_layout(': 'plan_ship_layout function',
+        'def generate_ship_dna(': 'generate_ship_dna function',
+        'def engine_positions(': 'engine placement helper',
+        'def greeble_placements(': 'greeble placement helper',
+        'def register()': 'register function',
+        'def unregister()': 'unregister function',
+    }
+
+    all_valid = True
+    for pattern, description in checks.items():
+        if pattern in content:
+            print(f"✓ {description} found")
+        else:
+            print(f"✗ {description} not found")
+            all_valid = False
+
+    if 'import bpy' in content:
+        print("✗ ship_layout.py must not import bpy")
+        all_valid = False
+
+    # ship_generator / ship_parts re-export the table instead of copying it
+    for filename, names in (('ship_generator.py',
+                             ('SHIP_CONFIGS', 'MAX_TURRET_HARDPOINTS')),
+                            ('ship_parts.py', ('MAX_TURRET_HARDPOINTS',))):
+        with open(os.path.join(addon_path, filename), 'r') as f:
+            other = f.read()
+        if all(f"{name} = ship_layout.{name}" in other for name in names):
+            print(f"✓ {filename} reads {', '.join(names)} from ship_layout")
+        else:
+            print(f"✗ {filename} keeps its own {', '.join(names)}")
+            all_valid = False
+
+    # Functional test — sibling modules are imported by absolute name
+    import importlib.util
+    if addon_path not in sys.path:
+        sys.path.insert(0, addon_path)
+    spec = importlib.util.spec_from_file_location("ship_layout", sl_path)
+    sl = importlib.util.module_from_spec(spec)
+    sys.modules['ship_layout'] = sl
+    spec.loader.exec_module(sl)
+
+    dna = sl.generate_ship_dna(ship_class='CRUISER', seed=3,
+                               turret_hardpoints=14, launcher_hardpoints=2,
+                               drone_bays=1, hull_taper=0.7)
+    bricks = dna['bricks']
+    types = [b['type'] for b in bricks]
+    engines = [b for b in bricks if b['type'] == 'ENGINE_BLOCK']
+    if (types[:2] == ['STRUCTURAL_SPINE', 'REACTOR_CORE']
+            and bricks[1]['pos'] == [0, 12.0 * 0.8, 0]
+            and len(engines) == 6
+            and all('archetype' in b for b in engines)
+            and types.count('HARDPOINT_MOUNT') == 12 + 10 + 2
+            and sum(b.get('subtype') == 'launcher' for b in bricks) == 2
+            and types.count('DOCKING_CLAMP') == 1
+            and types.count('CAPACITOR') == 2
+            and len(bricks) == 35 + 8):
+        print("✓ Layout follows the generator's stages and counts")
+    else:
+        print(f"✗ Unexpected layout: {types}")
+        all_valid = False
+
+    again = sl.generate_ship_dna(ship_class='CRUISER', seed=3,
+                                 turret_hardpoints=14, launcher_hardpoints=2,
+                                 drone_bays=1)
+    other = sl.generate_ship_dna(ship_class='CRUISER', seed=4,
+                                 turret_hardpoints=14, launcher_hardpoints=2,
+                                 drone_bays=1)
+    if again == dna and other['bricks'][-8:] != bricks[-8:]:
+        print("✓ Layout is deterministic per seed")
+    else:
+        print("✗ Layout is not deterministic per seed")
+        all_valid = False
+
+    # Positions taken from part objects carry Blender's float32 rounding
+    wing = sl.plan_ship_layout('CORVETTE', seed=1)[2]
+    if (wing['type'] == 'HULL_PLATE'
+            and wing['pos'] == sl.object_location((3.0 * 0.8 * 0.5, 0, 0))
+            and wing['pos'][0] != 1.2
+            and all(isinstance(v, float) for v in wing['pos'])):
+        print("✓ Object-derived positions use single precision")
+    else:
+        print(f"✗ Unexpected wing brick: {wing}")
+        all_valid = False
+
+    # generate_spaceship stores the layout's DNA and puts a part object
+    # at every brick position (run against stand-ins for bpy/bmesh)
+    import importlib
+    import struct
+    import types as types_module
+    from unittest import mock
+
+    def f32(value):
+        return struct.unpack('f', struct.pack('f', float(value)))[0]
+
+    class StubVector(list):
+        x = property(lambda self: self[0])
+        y = property(lambda self: self[1])
+        z = property(lambda self: self[2])
+
+    class StubObject(dict):
+        __hash__ = object.__hash__
+        __eq__ = object.__eq__
+
+        def __init__(self, name='Object'):
+            super().__init__()
+            self.name = name
+            self.location = (0, 0, 0)
+            self.scale = (1, 1, 1)
+            self.rotation_euler = (0, 0, 0)
+            self.dimensions = StubVector((1.0, 1.0, 1.0))
+            self.parent = None
+            self.data = mock.MagicMock(vertices=[], users=1)
+            self.modifiers = mock.MagicMock()
+            self.modifiers.__iter__ = lambda s: iter([])
+
+        def __setattr__(self, attr, value):
+            if attr == 'location':   # Blender stores float32
+                value = StubVector(f32(v) for v in value)
+            super().__setattr__(attr, value)
+
+    class StubLinks(list):
+        def link(self, obj):
+            self.append(obj)
+
+    collections = []
+
+    def new_collection(name):
+        coll = mock.MagicMock(objects=StubLinks(), children=StubLinks())
+        collections.append(coll)
+        return coll
+
+    def add_primitive(*args, location=(0, 0, 0), **kwargs):
+        obj = StubObject()
+        obj.location = location
+        bpy_stub.context.active_object = obj
+        bpy_stub.context.object = obj
+        return {'FINISHED'}
+
+    bpy_stub = mock.MagicMock()
+    bpy_stub.app.version = (4, 1, 0)
+    bpy_stub.context.scene.cursor.location = StubVector((0.0, 0.0, 0.0))
+    bpy_stub.data.objects.new = lambda name, data=None: StubObject(name)
+    bpy_stub.data.collections.new = new_collection
+    for name in ('cube', 'cylinder', 'cone', 'torus', 'uv_sphere',
+                 'ico_sphere', 'plane', 'circle'):
+        setattr(bpy_stub.ops.mesh, f'primitive_{name}_add', add_primitive)
+
+    stubs = {'bpy': bpy_stub, 'bmesh': mock.MagicMock(),
+             'mathutils': mock.MagicMock()}
+    saved = {name: sys.modules.get(name) for name in stubs}
+    try:
+        sys.modules.update(stubs)
+        package = types_module.ModuleType('_layout_check')
+        package.__path__ = [addon_path]
+        sys.modules['_layout_check'] = package
+        sg = importlib.import_module('_layout_check.ship_generator')
+        mismatched = []
+        for params in (dict(ship_class='FIGHTER', seed=1),
+                       dict(ship_class='CRUISER', seed=3, symmetry=False,
+                            turret_hardpoints=4, launcher_hardpoints=2,
+                            drone_bays=1),
+                       dict(ship_class='TITAN', seed=42, module_slots=3,
+                            engine_count_override=5)):
+            collections.clear()
+            hull = sg.generate_spaceship(**params)
+            dna = sl.generate_ship_dna(**params)
+            objects = [obj for coll in collections for obj in coll.objects
+                       if isinstance(obj, StubObject)]
+            unmatched = list(objects)
+            for brick in dna['bricks'][1:]:   # the spine is the hull origin
+                match = next((obj for obj in unmatched
+                              if all(abs(a - b) < 1e-5 for a, b in
+                                     zip(obj.location, brick['pos']))),
+                             None)
+                if match is None:
+                    mismatched.append((params['ship_class'], brick))
+                else:
+                    unmatched.remove(match)
+            if hull['ship_dna'] != sl.brick_system.ship_dna_to_json(dna):
+                mismatched.append((params['ship_class'], 'ship_dna'))
+    except Exception as exc:
+        mismatched = [f"{type(exc).__name__}: {exc}"]
+    finally:
+        for name in list(sys.modules):
+            if name == '_layout_check' or name.startswith('_layout_check.'):
+                del sys.modules[name]
+        for name, module in saved.items():
+            if module is None:
+                sys.modules.pop(name, None)
+            else:
+                sys.modules[name] = module
+
+    if not mismatched:
+        print("✓ generate_spaceship places parts at the layout's bricks")
+    else:
+        print(f"✗ Generated ship diverges from ship_layout: {mismatched[:3]}")
+        all_valid = False
+
+    return all_valid
+
+
+def test_geometry_backend():
+    """Test that ship_parts.py builds primitives without bpy.ops"""
+    print("\nTesting ship parts geometry backend...")
+
+    addon_path = os.path.dirname(os.path.abspath(__file__))
+    sp_path = os.path.join(addon_path, 'ship_parts.py')
+
+    with open(sp_path, 'r') as f:
+        content = f.read()
+
+    checks = {
+        'def add_cube(': 'add_cube primitive',
+        'def add_cylinder(': 'add_cylinder primitive',
+        'def add_cone(': 'add_cone primitive',
+        'def add_uv_sphere(': 'add_uv_sphere primitive',
+        'def add_torus(': 'add_torus primitive',
+        'bmesh.ops.create_cone(': 'bmesh cone/cylinder construction',
+        'bmesh.ops.subdivide_edges(': 'bmesh subdivision',
+        'bmesh.ops.bevel(': 'bmesh bevel',
+        'def _evaluated_dimensions(': 'evaluated bounds helper',
+        'def part_mesh(': 'shared part-mesh cache',
+        'def set_material(': 'per-object material helper',
+    }
+
+    all_valid = True
+    for pattern, description in checks.items():
+        if pattern in content:
+            print(f"✓ {description} found")
+        else:
+            print(f"✗ {description} not found")
+            all_valid = False
+
+    tree = ast.parse(content)
+    operator_calls = [
+        node.lineno for node in ast.walk(tree)
+        if isinstance(node, ast.Attribute) and node.attr == 'ops'
+        and isinstance(node.value, ast.Name) and node.value.id == 'bpy'
+    ]
+    if not operator_calls:
+        print("✓ ship_parts.py makes no bpy.ops calls")
+    else:
+        print(f"✗ bpy.ops still used on lines {operator_calls}")
+        all_valid = False
+
+    # Repeated parts link one cached mesh instead of building copies
+    for filename, part in (('ship_parts.py', 'turret'),
+                           ('ship_generator.py', 'greeble'),
+                           ('interior_generator.py', 'bunk')):
+        with open(os.path.join(addon_path, filename), 'r') as f:
+            if 'shared=True' in f.read():
+                print(f"✓ {part} meshes are shared")
+            else:
+                print(f"✗ {part} meshes are not shared")
+                all_valid = False
+
+    # Part keys round floats nested in scale tuples too (bpy-free helper)
+    helper = [node for node in tree.body
+              if isinstance(node, ast.FunctionDef)
+              and node.name == '_part_key_value']
+    namespace = {}
+    if helper:
+        exec(compile(ast.Module(body=helper, type_ignores=[]), sp_path,
+                     'exec'), namespace)
+    key_value = namespace.get('_part_key_value')
+    if (key_value is not None
+            and key_value((0.1 + 0.2, (1.0, 1.0000000001, -1e-9)))
+            == key_value((0.3, (1.0, 1.0, 0.0)))):
+        print("✓ Part-mesh keys ignore float noise in nested params")
+    else:
+        print("✗ Part-mesh keys keep float noise in nested params")
+        all_valid = False
+
+    return all_valid
+
+
+def test_material_registry():
+    """Test that repeated materials come from the shared registry"""
+    print("\nTesting shared material registry...")
+
+    addon_path = os.path.dirname(os.path.abspath(__file__))
+
+    with open(os.path.join(addon_path, 'material_registry.py'), 'r') as f:
+        content = f.read()
+
+    checks = {
+        'def get_material(': 'keyed material lookup',
+        '"material_key"': 'material key stored on the data-block',
+        'def principled_material(': 'Principled BSDF helper',
+        'def emission_material(': 'emission helper',
+    }
+
+    all_valid = True
+    for pattern, description in checks.items():
+        if pattern in content:
+            print(f"✓ {description} found")
+        else:
+            print(f"✗ {description} not found")
+            all_valid = False
+
+    # Generators must not create one material per object any more
+    for filename in ('ship_parts.py', 'asteroid_generator.py',
+                     'station_generator.py', 'module_system.py',
+                     'interior_generator.py'):
+        with open(os.path.join(addon_path, filename), 'r') as f:
+            if 'bpy.data.materials.new(' in f.read():
+                print(f"✗ {filename} still creates materials directly")
+                all_valid = False
+            else:
+                print(f"✓ {filename} uses the material registry")
+
+    # Functional test with a minimal stand-in for bpy.data.materials
+    import importlib.util
+    import types
+
+    class Material(dict):
+        def __init__(self, name):
+            super().__init__()
+            self.name = name
+
+    class Materials(list):
+        def new(self, name):
+            mat = Material(name)
+            self.append(mat)
+            return mat
+
+        def get(self, name, default=None):
+            return next((m for m in self if m.name == name), default)
+
+    bpy_mock = types.ModuleType('bpy')
+    bpy_mock.data = types.SimpleNamespace(materials=Materials())
+    sys.modules['bpy'] = bpy_mock
+    try:
+        spec = importlib.util.spec_from_file_location(
+            "material_registry",
+            os.path.join(addon_path, 'material_registry.py'))
+        mr = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(mr)
+
+        shader = ('PRINCIPLED', (0.35, 0.35, 0.4, 1.0), 0.9, 0.3)
+        first = mr.get_material("A_Turret_Mat", shader, lambda mat: None)
+        again = mr.get_material("A_Turret_Mat", shader, lambda mat: None)
+        other = mr.get_material("B_Turret_Mat", shader, lambda mat: None)
+        mr.clear_registry()
+        reloaded = mr.get_material("A_Turret_Mat", shader, lambda mat: None)
+    finally:
+        del sys.modules['bpy']
+
+    if (first is again is reloaded and other.name == "B_Turret_Mat"
+            and len(bpy_mock.data.materials) == 2):
+        print("✓ Materials are shared per name and kept apart by prefix")
+    else:
+        print(f"✗ Unexpected registry materials: "
+              f"{[m.name for m in bpy_mock.data.materials]}")
+        all_valid = False
+
+    return all_valid
+
+
+def test_batch_runner():
+    """Test batch_runner.py job splitting and worker failure handling"""
+    print("\nTesting multi-process batch runner...")
+
+    addon_path = os.path.dirname(os.path.abspath(__file__))
+    br_path = os.path.join(addon_path, 'batch_runner.py')
+
+    valid, error = test_python_syntax(br_path)
+    if not valid:
+        print(f"✗ batch_runner.py has syntax error: {error}")
+        return False
+    print("✓ batch_runner.py has valid syntax")
+
+    with open(br_path, 'r') as f:
+        content = f.read()
+
+    checks = {
+        'class BatchRunner': 'BatchRunner orchestrator',
+        'def run_worker(': 'worker entry point',
+        '"--background"': 'headless Blender workers',
+        'read_homefile(use_empty=True)': 'clean scene per ship',
+        'def purge_ship(': 'per-ship data-block purge',
+        'def memory_usage(': 'memory reporting',
+        'def register()': 'register function',
+        'def unregister()': 'unregister function',
+    }
+
+    all_valid = True
+    for pattern, description in checks.items():
+        if pattern in content:
+            print(f"✓ {description} found")
+        else:
+            print(f"✗ {description} not found")
+            all_valid = False
+
+    top_level = [node for node in ast.parse(content).body
+                 if isinstance(node, (ast.Import, ast.ImportFrom))]
+    if any(alias.name == 'bpy' for node in top_level for alias in node.names):
+        print("✗ batch_runner.py imports bpy at module level")
+        all_valid = False
+    else:
+        print("✓ Orchestrator imports without bpy")
+
+    with open(os.path.join(addon_path, '__init__.py'), 'r') as f:
+        init_content = f.read()
+    for pattern, description in (('batch_workers', 'Batch Workers property'),
+                                 ("'RUNNING_MODAL'", 'modal progress')):
+        if pattern in init_content:
+            print(f"✓ {description} found in __init__.py")
+        else:
+            print(f"✗ {description} not found in __init__.py")
+            all_valid = False
+
+    # Functional test
+    import importlib.util
+    import json
+    import tempfile
+    spec = importlib.util.spec_from_file_location("batch_runner", br_path)
+    br = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(br)
+
+    jobs = [{'name': f"ship_{i}", 'params': {'seed': i}, 'texture': None}
+            for i in range(7)]
+    chunks = br.split_jobs(jobs, 3)
+    if ([[job['index'] for job in chunk] for chunk in chunks]
+            == [[0, 3, 6], [1, 4], [2, 5]]
+            and len(br.split_jobs(jobs[:2], 8)) == 2):
+        print("✓ Jobs are dealt round-robin over the workers")
+    else:
+        print("✗ Unexpected job split")
+        all_valid = False
+
+    # A "Blender" that rejects its arguments: every job must come back
+    # as an error and the manifest must still be written in job order
+    with tempfile.TemporaryDirectory() as tmp:
+        runner = br.BatchRunner(jobs, tmp, sys.executable, workers=3)
+        manifest = runner.run(interval=0.05)
+        with open(os.path.join(tmp, br.MANIFEST_NAME), 'r') as f:
+            saved = json.load(f)
+    memory = br.memory_usage()
+    if set(memory) == {'resident_mb', 'peak_mb'}:
+        print("✓ memory_usage reports resident and peak memory")
+    else:
+        print(f"✗ Unexpected memory report: {memory}")
+        all_valid = False
+
+    if (manifest['failed'] == 7 and manifest['workers'] == 3
+            and [e['name'] for e in saved['ships']]
+            == [job['name'] for job in jobs]
+            and all('exited with code' in e['error'] for e in saved['ships'])):
+        print("✓ Failed workers are reported in the manifest")
+    else:
+        print(f"✗ Unexpected manifest: {manifest}")
+        all_valid = False
+
+    # Cancelling still writes a manifest, with the unfinished jobs marked
+    if os.name == 'posix':
+        with tempfile.TemporaryDirectory() as tmp:
+            blender = os.path.join(tmp, 'slow_blender')
+            with open(blender, 'w') as f:
+                f.write("#!/bin/sh\nexec sleep 30\n")
+            os.chmod(blender, 0o755)
+            runner = br.BatchRunner(jobs[:3], tmp, blender, workers=2)
+            runner.start()
+            runner.cancel()
+            manifest = runner.finish(interval=0.05)
+            written = os.path.isfile(os.path.join(tmp, br.MANIFEST_NAME))
+        if (written and manifest.get('cancelled')
+                and [e['status'] for e in manifest['ships']]
+                == ['cancelled'] * 3):
+            print("✓ Cancelled batches still write a manifest")
+        else:
+            print(f"✗ Unexpected cancelled manifest: {manifest}")
+            all_valid = False
+
+    # In-session runs record failing jobs and carry on (outside Blender
+    # every job fails: run_job cannot import the generator package)
+    with tempfile.TemporaryDirectory() as tmp:
+        try:
+            manifest = br.run_local(jobs[:3], tmp)
+        except Exception as exc:
+            manifest = {'error': repr(exc)}
+        written = os.path.isfile(os.path.join(tmp, br.MANIFEST_NAME))
+    if (written and manifest.get('failed') == 3
+            and [e['index'] for e in manifest['ships']] == [0, 1, 2]
+            and all(e['status'] == 'error' and 'peak_mb' in e
+                    for e in manifest['ships'])):
+        print("✓ In-session batches record failed jobs and continue")
+    else:
+        print(f"✗ Unexpected in-session manifest: {manifest}")
+        all_valid = False
+
+    return all_valid
+
+
+def test_obj_writer():
+    """Test that atlas_exporter.py streams OBJ/MTL without bpy.ops"""
+    print("\nTesting direct OBJ/MTL writer...")
+
+    addon_path = os.path.dirname(os.path.abspath(__file__))
+    ae_path = os.path.join(addon_path, 'atlas_exporter.py')
+
+    with open(ae_path, 'r') as f:
+        content = f.read()
+
+    checks = {
+        'def write_obj(': 'streaming OBJ writer',
+        'evaluated_get(': 'depsgraph-evaluated meshes',
+        'def _write_mtl(': 'MTL writer',
+        "'NEGATIVE_Z':": 'AtlasForge axis convention',
+        "'Z':": 'NovaForge axis convention',
+        'hull=None': 'hull argument on the export functions',
+    }
+
+    all_valid = True
+    for pattern, description in checks.items():
+        if pattern in content:
+            print(f"✓ {description} found")
+        else:
+            print(f"✗ {description} not found")
+            all_valid = False
+
+    # Batch and operator exports must not go through the selection
+    for filename in ('batch_runner.py', '__init__.py'):
+        with open(os.path.join(addon_path, filename), 'r') as f:
+            if 'export_obj(filepath, hull=' in f.read():
+                print(f"✓ {filename} exports the hull directly")
+            else:
+                print(f"✗ {filename} still exports the selection")
+                all_valid = False
+
+    # Functional test — the axis tables must be proper rotations
+    import importlib.util
+    spec = importlib.util.spec_from_file_location("atlas_exporter", ae_path)
+    ae = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(ae)
+
+    def _det(m):
+        return (m[0][0] * (m[1][1] * m[2][2] - m[1][2] * m[2][1])
+                - m[0][1] * (m[1][0] * m[2][2] - m[1][2] * m[2][0])
+                + m[0][2] * (m[1][0] * m[2][1] - m[1][1] * m[2][0]))
+
+    def _apply(m, v):
+        return tuple(sum(m[r][c] * v[c] for c in range(3)) for r in range(3))
+
+    up = {axis: _apply(m, (0, 0, 1)) for axis, m in ae._OBJ_AXES.items()}
+    forward = {axis: _apply(m, (0, 1, 0)) for axis, m in ae._OBJ_AXES.items()}
+    if (all(_det(m) == 1 for m in ae._OBJ_AXES.values())
+            and up == {'NEGATIVE_Z': (0, 1, 0), 'Z': (0, 1, 0)}
+            and forward == {'NEGATIVE_Z': (0, 0, -1), 'Z': (0, 0, 1)}):
+        print("✓ Axis conversions map Blender +Y forward and +Z up")
+    else:
+        print(f"✗ Unexpected axis conversions: {ae._OBJ_AXES}")
+        all_valid = False
+
+    return all_valid
+
+
+def test_glb_export():
+    """Test that atlas_exporter.py defines the instanced GLB exporter"""
+    print("\nTesting GLB export...")
+
+    addon_path = os.path.dirname(os.path.abspath(__file__))
+    ae_path = os.path.join(addon_path, 'atlas_exporter.py')
+
+    with open(ae_path, 'r') as f:
+        content = f.read()
+
+    checks = {
+        'def export_glb(': 'GLB export function',
+        'class _GltfBuilder': 'single-buffer glTF builder',
+        'mesh_cache': 'shared-mesh instancing',
+        'def _node_extras(': 'custom properties as node extras',
+        'KHR_materials_emissive_strength': 'emission strength extension',
+    }
+
+    all_valid = True
+    for pattern, description in checks.items():
+        if pattern in content:
+            print(f"✓ {description} found")
+        else:
+            print(f"✗ {description} not found")
+            all_valid = False
+
+    # Functional test — container layout with a hand-built glTF
+    import importlib.util
+    import json
+    import struct
+    import tempfile
+    spec = importlib.util.spec_from_file_location("atlas_exporter", ae_path)
+    ae = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(ae)
+
+    builder = ae._GltfBuilder()
+    builder.blob.extend(b'\x01\x02\x03')
+    builder.gltf['nodes'].append({'name': 'Hull', 'extras': {'seed': 7}})
+    builder.gltf['scenes'][0]['nodes'].append(0)
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'ship.glb')
+        builder.write(path)
+        with open(path, 'rb') as f:
+            data = f.read()
+    magic, version, length = struct.unpack('<III', data[:12])
+    json_length, json_type = struct.unpack('<II', data[12:20])
+    gltf = json.loads(data[20:20 + json_length])
+    bin_length, bin_type = struct.unpack(
+        '<II', data[20 + json_length:28 + json_length])
+    if (magic == 0x46546C67 and version == 2 and length == len(data)
+            and json_type == 0x4E4F534A and bin_type == 0x004E4942
+            and json_length % 4 == 0 and bin_length == 4
+            and gltf['buffers'] == [{'byteLength': 3}]
+            and gltf['nodes'][0]['extras'] == {'seed': 7}):
+        print("✓ GLB container has aligned JSON and BIN chunks")
+    else:
+        print("✗ Malformed GLB container")
+        all_valid = False
+
+    builder = ae._GltfBuilder()
+    builder.gltf['nodes'].append({'name': 'Hull'})
+    builder.gltf['scenes'][0]['nodes'].append(0)
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'empty.glb')
+        builder.write(path)
+        with open(path, 'rb') as f:
+            data = f.read()
+    length = struct.unpack('<I', data[8:12])[0]
+    json_length = struct.unpack('<I', data[12:16])[0]
+    gltf = json.loads(data[20:20 + json_length])
+    empty_keys = [key for key, value in gltf.items() if value == []]
+    if (length == len(data) == 20 + json_length and not empty_keys
+            and 'buffers' not in gltf):
+        print("✓ GLB without mesh data has no empty arrays or BIN chunk")
+    else:
+        print("✗ GLB without mesh data is invalid glTF")
+        all_valid = False
+
+    return all_valid
+
+
+def test_output_cache():
+    """Test that output_cache.py restores unchanged ships by content key"""
+    print("\nTesting content-addressed output cache...")
+
+    addon_path = os.path.dirname(os.path.abspath(__file__))
+    oc_path = os.path.join(addon_path, 'output_cache.py')
+
+    valid, error = test_python_syntax(oc_path)
+    if not valid:
+        print(f"✗ output_cache.py has syntax error: {error}")
+        return False
+    print("✓ output_cache.py has valid syntax")
+
+    with open(oc_path, 'r') as f:
+        content = f.read()
+
+    checks = {
+        'class OutputCache': 'OutputCache class',
+        'def source_digest(': 'add-on source digest',
+        'def register()': 'register function',
+        'def unregister()': 'unregister function',
+    }
+
+    all_valid = True
+    for pattern, description in checks.items():
+        if pattern in content:
+            print(f"✓ {description} found")
+        else:
+            print(f"✗ {description} not found")
+            all_valid = False
+
+    with open(os.path.join(addon_path, 'batch_runner.py'), 'r') as f:
+        if 'cache.restore(' in f.read():
+            print("✓ batch_runner.py skips cached ships")
+        else:
+            print("✗ batch_runner.py does not consult the cache")
+            all_valid = False
+
+    # Functional test
+    import importlib.util
+    import tempfile
+    spec = importlib.util.spec_from_file_location("output_cache", oc_path)
+    oc = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(oc)
+
+    job = {'name': 'rifter', 'params': {'ship_class': 'FRIGATE', 'seed': 7},
+           'texture': None, 'glb': False}
+    with tempfile.TemporaryDirectory() as tmp:
+        first = os.path.join(tmp, 'first')
+        second = os.path.join(tmp, 'second')
+        os.makedirs(first)
+        os.makedirs(second)
+        cache = oc.OutputCache(os.path.join(tmp, 'cache'), (3, 0, 0))
+
+        key = cache.key(job)
+        same = cache.key(dict(job, index=5))
+        reseeded = cache.key(dict(job, params={'ship_class': 'FRIGATE',
+                                               'seed': 8}))
+        bumped = oc.OutputCache(os.path.join(tmp, 'cache'),
+                                (3, 0, 1)).key(job)
+        blender = [oc.OutputCache(os.path.join(tmp, 'cache'), (3, 0, 0),
+                                  blender_version=v).key(job)
+                   for v in ((4, 1, 0), (4, 2, 0))]
+        if key == same and len({key, reseeded, bumped, *blender}) == 5:
+            print("✓ Keys follow params and add-on/Blender version, "
+                  "not job order")
+        else:
+            print("✗ Cache keys are not content-addressed")
+            all_valid = False
+
+        sources = os.path.join(tmp, 'addon')
+        os.makedirs(sources)
+        digests = []
+        for module, test in (('a = 1', 't = 1'), ('a = 1', 't = 2'),
+                             ('a = 2', 't = 2')):
+            for filename, text in (('gen.py', module), ('test_gen.py', test)):
+                with open(os.path.join(sources, filename), 'w') as f:
+                    f.write(text)
+            digests.append(oc.source_digest(sources))
+        if digests[0] == digests[1] != digests[2]:
+            print("✓ Source digest ignores test files")
+        else:
+            print("✗ Source digest should follow sources but not tests")
+            all_valid = False
+
+        obj_path = os.path.join(first, 'rifter.obj')
+        with open(obj_path, 'w') as f:
+            f.write('o Hull\n')
+        missed = cache.restore(key, second)
+        cache.store(key, {'index': 0, 'name': 'rifter', 'file': obj_path,
+                          'files': [obj_path], 'status': 'ok',
+                          'seconds': 2.5})
+        restored = cache.restore(key, second)
+        with open(os.path.join(second, 'rifter.obj'), 'r') as f:
+            copied = f.read()
+        if (missed is None and restored is not None
+                and restored['cached'] and copied == 'o Hull\n'
+                and restored['file'] == os.path.join(second, 'rifter.obj')
+                and cache.stats() == {'hits': 1, 'misses': 1}):
+            print("✓ Stored outputs are restored on the next run")
+        else:
+            print(f"✗ Unexpected restore: {restored}")
+            all_valid = False
+
     return all_valid
 
 
@@ -1370,11 +2914,11 @@ def test_ship_class_consistency():
 
     all_valid = True
 
-    # 1. SHIP_CONFIGS in ship_generator.py (parse via AST to avoid bpy)
-    sg_path = os.path.join(addon_path, 'ship_generator.py')
-    with open(sg_path, 'r') as f:
-        sg_content = f.read()
-    tree = ast.parse(sg_content)
+    # 1. SHIP_CONFIGS in ship_layout.py (parse via AST to avoid imports)
+    sl_path = os.path.join(addon_path, 'ship_layout.py')
+    with open(sl_path, 'r') as f:
+        sl_content = f.read()
+    tree = ast.parse(sl_content)
     sg_classes = set()
     for node in ast.walk(tree):
         if isinstance(node, ast.Assign):
@@ -1513,6 +3057,15 @@ def run_tests():
         ("Damage System", test_damage_system),
         ("Power System", test_power_system),
         ("Build Validator", test_build_validator),
+        ("Fleet Simulator", test_fleet_simulator),
+        ("Bulk Validator", test_bulk_validator),
+        ("Ship Layout", test_ship_layout),
+        ("Geometry Backend", test_geometry_backend),
+        ("Material Registry", test_material_registry),
+        ("Batch Runner", test_batch_runner),
+        ("OBJ Writer", test_obj_writer),
+        ("GLB Export", test_glb_export),
+        ("Output Cache", test_output_cache),
         ("Connecting Geometry", test_connecting_geometry),
         ("Batch Generate Operator", test_batch_generate_operator),
         ("Emission Color Compat", test_emission_color_compat),
@@ -6,6 +6,7 @@ Supports hull plating, glow effects, weathering, and NovaForge faction color pal
 
 import bpy
 import random
+from . import ship_parts
 
 
 # Color palettes for NovaForge factions
@@ -278,23 +279,14 @@ def apply_textures_to_ship(ship_object, style='SOLARI', seed=0,
         if obj.type != 'MESH':
             return
         name_lower = obj.name.lower()
+        # set_material keeps per-object materials on shared part meshes
         if 'engine' in name_lower:
-            if obj.data.materials:
-                obj.data.materials[0] = engine_mat
-            else:
-                obj.data.materials.append(engine_mat)
+            ship_parts.set_material(obj, engine_mat)
         elif any(k in name_lower for k in ('weapon', 'hardpoint', 'cockpit',
                                             'wing', 'turret')):
-            if obj.data.materials:
-                obj.data.materials[0] = accent_mat
-            else:
-                obj.data.materials.append(accent_mat)
+            ship_parts.set_material(obj, accent_mat)
         else:
-            varied = _varied_hull_mat(obj)
-            if obj.data.materials:
-                obj.data.materials[0] = varied
-            else:
-                obj.data.materials.append(varied)
+            ship_parts.set_material(obj, _varied_hull_mat(obj))
 
     _assign(ship_object)
     for child in ship_object.children_recursive: